@@ -0,0 +1,2 @@
+# Geliştirici araçları (sentetik veri, performans ölçümü)
+from .veri_uretici import VeriUretici
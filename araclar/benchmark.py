@@ -0,0 +1,262 @@
+# -*- coding: utf-8 -*-
+"""
+Performans Ölçümü
+Sentetik veri üzerinde analiz_yap, CM aramaları ve tum_gruplari_isle
+sürelerini ölçer; sonuçları JSON satırları olarak biriktirir ve bir önceki
+aynı boyutlu ölçümle karşılaştırarak gerilemeleri gösterir.
+
+Kullanım:
+    python -m araclar.benchmark --boyut 10000 100000 1000000 --grup-limiti 50
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Config ve modülleri import et
+KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(KOK_DIZIN)
+from config import ONBELLEK_AYARLARI, TM_ARDARDA_AYARLARI, VARSAYILAN
+from modules.kesinti_analiz import KesintiAnaliz
+from modules.dosyalama import Dosyalama
+from modules.okuyucu import TabloOkuyucu
+from modules.profil import profil, tepe_rss_mb
+from araclar.veri_uretici import VeriUretici
+
+# Bir önceki ölçüme göre bu oranın üstündeki yavaşlamalar gerileme sayılır
+GERILEME_ESIGI = 1.2
+
+
+def surum_bilgisi():
+    """Ölçümün ait olduğu kod sürümünü ve ortamı döndür"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=KOK_DIZIN,
+            capture_output=True, text=True, timeout=10
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        commit = None
+    return {
+        'commit': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'numpy': np.__version__,
+        'excel_motoru': TabloOkuyucu.excel_motoru(),
+        'platform': platform.platform()
+    }
+
+
+def veri_hazirla(kok_klasor, uretici):
+    """
+    Parametreleri aynı olan veri önceden üretilmişse onu kullan, yoksa üret.
+
+    Args:
+        kok_klasor: Veri setlerinin tutulduğu klasör
+        uretici: VeriUretici nesnesi
+
+    Returns:
+        str: Veri klasörü
+    """
+    p = uretici.parametreler()
+    klasor = os.path.join(
+        kok_klasor,
+        f"n{p['satir_sayisi']}_z{p['zincir_yogunlugu']}_ag{p['dagitim_ag_orani']}"
+        f"_c{p['cagri_hacmi']}_t{p['tohum']}"
+    )
+    uretim_yolu = os.path.join(klasor, 'uretim.json')
+    if os.path.exists(uretim_yolu):
+        with open(uretim_yolu, encoding='utf-8') as f:
+            if json.load(f).get('parametreler') == p:
+                print(f"✓ Hazır veri kullanılıyor: {klasor}")
+                return klasor
+
+    print(f"⏳ Veri üretiliyor: {klasor}")
+    uretici.uret(klasor)
+    return klasor
+
+
+def olc(veri_klasoru, grup_limiti=None, isci_sayisi=1):
+    """
+    Tek bir veri seti için analiz ve raporlama sürelerini ölç.
+
+    Args:
+        veri_klasoru: kesinti.xlsx, CM.xlsx, table.xlsx, jtk.xlsx içeren klasör
+        grup_limiti: Raporlanacak en fazla grup (None ise hepsi)
+        isci_sayisi: Raporlama süreç sayısı
+
+    Returns:
+        dict: Süreler, sayılar ve aşama profili
+    """
+    sonuc = {'sureler_sn': {}}
+    sureler = sonuc['sureler_sn']
+    profil.baslat()
+
+    engine = KesintiAnaliz()
+    tolerans = {
+        'kritik_saat': TM_ARDARDA_AYARLARI['KRITIK_SAAT'],
+        'tolerans_ustu_dk': TM_ARDARDA_AYARLARI['TOLERANS_USTU_DK'],
+        'tolerans_alti_dk': TM_ARDARDA_AYARLARI['TOLERANS_ALTI_DK']
+    }
+    baslangic = time.perf_counter()
+    # Önceki ölçümün analiz durumu kullanılmaz (tam analiz ölçülür)
+    df_sonuc = engine.analiz_yap(os.path.join(veri_klasoru, 'kesinti.xlsx'), tolerans, artimli=False)
+    sureler['analiz_yap'] = time.perf_counter() - baslangic
+    sonuc['grup_sayisi'] = len(df_sonuc)
+
+    analiz_yolu = os.path.join(veri_klasoru, VARSAYILAN['ANALIZ_DOSYA_ADI'])
+    baslangic = time.perf_counter()
+    engine.kaydet(analiz_yolu)
+    sureler['kaydet'] = time.perf_counter() - baslangic
+
+    if not df_sonuc.empty:
+        dosyalama = Dosyalama(veri_klasoru)
+        dosyalama.analiz_sonucunu_yukle(analiz_yolu)
+        dosyalama.gruplari_yukle()
+
+        baslangic = time.perf_counter()
+        basarili, eksik = dosyalama.dosyalari_yukle()
+        sureler['rapor_yukleme'] = time.perf_counter() - baslangic
+        if not basarili:
+            raise RuntimeError(f"Rapor girdileri yüklenemedi: {eksik}")
+
+        if grup_limiti is not None:
+            dosyalama.grup_list = dosyalama.grup_list[:grup_limiti]
+        baslangic = time.perf_counter()
+        islenen = dosyalama.tum_gruplari_isle(isci_sayisi=isci_sayisi)
+        sureler['tum_gruplari_isle'] = time.perf_counter() - baslangic
+        sonuc['raporlanan_grup'] = islenen
+        if islenen:
+            sureler['grup_basina'] = sureler['tum_gruplari_isle'] / islenen
+
+    profil.durdur()
+    # CM aramaları analiz içinde ölçülür; toplamları ayrıca öne çıkar
+    asamalar = profil.rapor()
+    for asama in asamalar:
+        if asama['asama'].startswith('cm.'):
+            sureler[asama['asama']] = asama['duvar_sn']
+
+    for anahtar in sureler:
+        sureler[anahtar] = round(sureler[anahtar], 4)
+    sonuc['asamalar'] = asamalar
+    rss = tepe_rss_mb()
+    sonuc['tepe_rss_mb'] = round(rss, 1) if rss is not None else None
+    return sonuc
+
+
+def onceki_olcum(sonuc_dosyasi, kayit):
+    """
+    Aynı boyut ve parametrelerle yapılmış en son ölçümü bul.
+
+    Args:
+        sonuc_dosyasi: JSON satırları dosyası
+        kayit: Yeni ölçüm kaydı
+
+    Returns:
+        dict: Önceki kayıt (yoksa None)
+    """
+    if not os.path.exists(sonuc_dosyasi):
+        return None
+    onceki = None
+    with open(sonuc_dosyasi, encoding='utf-8') as f:
+        for satir in f:
+            satir = satir.strip()
+            if not satir:
+                continue
+            eski = json.loads(satir)
+            if (eski.get('parametreler') == kayit['parametreler']
+                    and eski.get('grup_limiti') == kayit['grup_limiti']
+                    and eski.get('isci_sayisi') == kayit['isci_sayisi']):
+                onceki = eski
+    return onceki
+
+
+def karsilastir(onceki, kayit):
+    """
+    İki ölçümün sürelerini yazdır.
+
+    Returns:
+        list: Gerileme gösteren ölçüm adları
+    """
+    gerilemeler = []
+    print(f"  Önceki ölçüm: {onceki['tarih']} ({onceki['surum'].get('commit')})")
+    for ad, sure in kayit['sureler_sn'].items():
+        eski = onceki['sureler_sn'].get(ad)
+        if not eski:
+            print(f"    {ad:<22} {sure:>10.3f} sn")
+            continue
+        oran = sure / eski
+        isaret = "✗" if oran > GERILEME_ESIGI else "✓"
+        print(f"  {isaret} {ad:<22} {eski:>10.3f} → {sure:>10.3f} sn (x{oran:.2f})")
+        if oran > GERILEME_ESIGI:
+            gerilemeler.append(ad)
+    return gerilemeler
+
+
+def main(argv=None):
+    """Komut satırından ölçüm yap"""
+    parser = argparse.ArgumentParser(description="Kesinti analizi performans ölçümü")
+    parser.add_argument('--boyut', type=int, nargs='+', default=[10000, 100000, 1000000],
+                        help="Kesinti satır sayıları")
+    parser.add_argument('--veri-klasoru', default=os.path.join(os.path.expanduser('~'), '.kesinti_benchmark'),
+                        help="Sentetik verilerin tutulduğu klasör")
+    parser.add_argument('--sonuc-dosyasi', default=None,
+                        help="Ölçümlerin eklendiği JSON satırları dosyası "
+                             "(varsayılan: <veri klasörü>/sonuclar.jsonl)")
+    parser.add_argument('--zincir', type=float, default=0.35, help="Zincir yoğunluğu (0-1)")
+    parser.add_argument('--dagitim-ag', type=float, default=0.3, help="Dağıtım-AG oranı (0-1)")
+    parser.add_argument('--cagri', type=float, default=2.0, help="Kesinti başına ortalama çağrı")
+    parser.add_argument('--tohum', type=int, default=0, help="Rastgele tohum")
+    parser.add_argument('--grup-limiti', type=int, default=50,
+                        help="Raporlanacak en fazla grup (0 = hepsi)")
+    parser.add_argument('--isci', type=int, default=1, help="Raporlama süreç sayısı")
+    parser.add_argument('--onbellek', action='store_true',
+                        help="Excel önbelleğini açık bırak (varsayılan: soğuk okuma)")
+    args = parser.parse_args(argv)
+
+    ONBELLEK_AYARLARI['AKTIF'] = args.onbellek
+    sonuc_dosyasi = args.sonuc_dosyasi or os.path.join(args.veri_klasoru, 'sonuclar.jsonl')
+    grup_limiti = args.grup_limiti or None
+    surum = surum_bilgisi()
+    gerileme_var = False
+
+    for boyut in args.boyut:
+        uretici = VeriUretici(boyut, args.zincir, args.dagitim_ag, args.cagri, tohum=args.tohum)
+        veri_klasoru = veri_hazirla(args.veri_klasoru, uretici)
+
+        print(f"\n{'=' * 60}\n⏱  {boyut} satır\n{'=' * 60}")
+        olcum = olc(veri_klasoru, grup_limiti, args.isci)
+
+        kayit = {
+            'tarih': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'surum': surum,
+            'parametreler': uretici.parametreler(),
+            'grup_limiti': grup_limiti,
+            'isci_sayisi': args.isci,
+            'onbellek': args.onbellek,
+            **olcum
+        }
+
+        onceki = onceki_olcum(sonuc_dosyasi, kayit)
+        if onceki:
+            gerileme_var |= bool(karsilastir(onceki, kayit))
+        else:
+            for ad, sure in kayit['sureler_sn'].items():
+                print(f"    {ad:<22} {sure:>10.3f} sn")
+
+        os.makedirs(os.path.dirname(os.path.abspath(sonuc_dosyasi)), exist_ok=True)
+        with open(sonuc_dosyasi, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(kayit, ensure_ascii=False) + '\n')
+        print(f"✓ Sonuç eklendi: {sonuc_dosyasi}")
+
+    return 1 if gerileme_var else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
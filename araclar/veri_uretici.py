@@ -0,0 +1,397 @@
+# -*- coding: utf-8 -*-
+"""
+Sentetik Veri Üretici
+Gerçek müşteri verisi olmadan performans ölçümü için kesinti dışa aktarımı,
+CM.xlsx, table.xlsx ve jtk.xlsx dosyalarını config'deki sütun yerleşimiyle üretir.
+
+Kullanım:
+    python -m araclar.veri_uretici HEDEF_KLASOR --satir 100000 --zincir 0.4
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Config'i import et
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (
+    KESINTI_SUTUNLARI, CM_SUTUN_INDEKSLERI, TABLE_SUTUN_INDEKSLERI,
+    JTK_SUTUN_INDEKSLERI, EXCEL_AYARLARI, DAGITIM_AG_AYARLARI
+)
+
+# Excel sayfasına yazılabilecek en fazla satır
+EXCEL_MAKS_SATIR = 1048576
+
+
+class VeriUretici:
+    """Ayarlanabilir yoğunlukta sentetik kesinti verisi üreten sınıf"""
+
+    DIGER_KAYNAKLAR = ['Dağıtım-OG', 'Dağıtım-YG', 'İletim']
+
+    def __init__(self, satir_sayisi=10000, zincir_yogunlugu=0.35, dagitim_ag_orani=0.3,
+                 cagri_hacmi=2.0, unsur_sayisi=None, tm_sayisi=None, gun_sayisi=90,
+                 tohum=0):
+        """
+        Üretim parametrelerini ayarla.
+
+        Args:
+            satir_sayisi: Kesinti dosyasındaki satır (kademe) sayısı
+            zincir_yogunlugu: Bir kesintinin öncekinin ardından/içinden gelme olasılığı (0-1)
+            dagitim_ag_orani: Dağıtım-AG kaynaklı zincirlerin oranı (0-1)
+            cagri_hacmi: Kesinti başına ortalama CM çağrı satırı
+            unsur_sayisi: Farklı şebeke unsuru sayısı (None ise satır sayısından)
+            tm_sayisi: Farklı CBS TM No sayısı (None ise satır sayısından)
+            gun_sayisi: Kesintilerin yayıldığı gün sayısı
+            tohum: Rastgele sayı üreteci tohumu
+        """
+        self.satir_sayisi = int(satir_sayisi)
+        self.zincir_yogunlugu = float(zincir_yogunlugu)
+        self.dagitim_ag_orani = float(dagitim_ag_orani)
+        self.cagri_hacmi = float(cagri_hacmi)
+        self.unsur_sayisi = unsur_sayisi or max(20, self.satir_sayisi // 15)
+        self.tm_sayisi = tm_sayisi or max(10, self.satir_sayisi // 40)
+        self.gun_sayisi = gun_sayisi
+        self.tohum = tohum
+        self.baslangic = pd.Timestamp('2024-01-01')
+
+    def parametreler(self):
+        """Üretimi tekrar edilebilir kılan parametreleri döndür"""
+        return {
+            'satir_sayisi': self.satir_sayisi,
+            'zincir_yogunlugu': self.zincir_yogunlugu,
+            'dagitim_ag_orani': self.dagitim_ag_orani,
+            'cagri_hacmi': self.cagri_hacmi,
+            'unsur_sayisi': self.unsur_sayisi,
+            'tm_sayisi': self.tm_sayisi,
+            'gun_sayisi': self.gun_sayisi,
+            'tohum': self.tohum
+        }
+
+    def uret(self, klasor):
+        """
+        Tüm girdi dosyalarını klasöre yaz.
+
+        Args:
+            klasor: Hedef klasör (kesinti.xlsx, CM.xlsx, cm.xlsx, table.xlsx, jtk.xlsx)
+
+        Returns:
+            dict: Üretilen dosyaların satır sayıları ve parametreler
+        """
+        os.makedirs(klasor, exist_ok=True)
+        rng = np.random.default_rng(self.tohum)
+
+        kesintiler, df_kesinti = self.kesinti_tablosu_olustur(rng)
+        df_cm = self.cm_tablosu_olustur(rng, kesintiler)
+        df_table = self.table_tablosu_olustur(rng, kesintiler)
+        df_jtk = self.jtk_tablosu_olustur(rng, kesintiler)
+
+        self._kesinti_yaz(df_kesinti, os.path.join(klasor, 'kesinti.xlsx'))
+        print(f"✓ kesinti.xlsx yazıldı: {len(df_kesinti)} satır")
+
+        self._cm_yaz(df_cm, os.path.join(klasor, 'CM.xlsx'))
+        # Büyük/küçük harf ayırmayan dosya sistemlerinde ikisi aynı dosyadır
+        if not os.path.exists(os.path.join(klasor, 'cm.xlsx')):
+            self._cm_yaz(df_cm, os.path.join(klasor, 'cm.xlsx'))
+        print(f"✓ CM.xlsx yazıldı: {len(df_cm)} satır")
+
+        self._table_yaz(df_table, os.path.join(klasor, 'table.xlsx'))
+        print(f"✓ table.xlsx yazıldı: {len(df_table)} satır")
+
+        df_jtk.to_excel(os.path.join(klasor, 'jtk.xlsx'), index=False)
+        print(f"✓ jtk.xlsx yazıldı: {len(df_jtk)} satır")
+
+        ozet = {
+            'parametreler': self.parametreler(),
+            'satirlar': {
+                'kesinti': len(df_kesinti),
+                'cm': len(df_cm),
+                'table': len(df_table),
+                'jtk': len(df_jtk)
+            }
+        }
+        with open(os.path.join(klasor, 'uretim.json'), 'w', encoding='utf-8') as f:
+            json.dump(ozet, f, ensure_ascii=False, indent=2)
+
+        return ozet
+
+    # ═══════════════════════════════════════════════════════════════
+    # TABLOLAR
+    # ═══════════════════════════════════════════════════════════════
+
+    def kesinti_tablosu_olustur(self, rng):
+        """
+        Kesinti dışa aktarımını oluştur.
+
+        Zincirler vektörel kurulur: her kesinti zincir_yogunlugu olasılığıyla
+        öncekinin bitişine yakın (veya içinde) başlar ve aynı unsur/TM'yi paylaşır.
+
+        Args:
+            rng: numpy Generator
+
+        Returns:
+            tuple: (kesinti bazlı DataFrame, satır bazlı dışa aktarım DataFrame)
+        """
+        # Kesinti başına 1-3 kademe; satır sayısına yetecek kadar kesinti üret
+        kesinti_sayisi = self.satir_sayisi
+        kademe_sayilari = 1 + rng.binomial(2, 0.15, kesinti_sayisi)
+        kesinti_sayisi = int(np.searchsorted(np.cumsum(kademe_sayilari), self.satir_sayisi)) + 1
+        kademe_sayilari = kademe_sayilari[:kesinti_sayisi]
+
+        # Zincir segmentleri
+        devam = rng.random(kesinti_sayisi) < self.zincir_yogunlugu
+        devam[0] = False
+        segment = np.cumsum(~devam) - 1
+        segment_sayisi = segment[-1] + 1
+
+        seg_unsur = rng.integers(0, self.unsur_sayisi, segment_sayisi)
+        seg_ag = rng.random(segment_sayisi) < self.dagitim_ag_orani
+        seg_tm = rng.integers(0, self.tm_sayisi, segment_sayisi)
+        seg_baslama = rng.integers(0, self.gun_sayisi * 24 * 60, segment_sayisi)
+
+        # Süre (dk): log-normal, 9 saatin üstü ve altı birlikte
+        sure = np.clip(rng.lognormal(4.0, 1.3, kesinti_sayisi), 1, 3000).astype(np.int64)
+        # Sonraki kesintiye boşluk (dk): negatif değerler iç içe/örtüşen kesintiler
+        bosluk = rng.choice([-45, -10, 0, 5, 10, 20, 40, 55, 70, 120],
+                            kesinti_sayisi,
+                            p=[0.08, 0.08, 0.04, 0.15, 0.15, 0.15, 0.1, 0.1, 0.1, 0.05])
+        adim = sure + bosluk
+        kumulatif = np.cumsum(adim) - adim
+        segment_ilk = np.flatnonzero(np.r_[True, segment[1:] != segment[:-1]])
+        ofset = kumulatif - kumulatif[segment_ilk][segment]
+        baslama_dk = seg_baslama[segment] + ofset
+
+        kesinti_nolari = 5000000 + np.arange(kesinti_sayisi)
+        dagitim_ag = seg_ag[segment]
+        kaynak = np.where(
+            dagitim_ag,
+            DAGITIM_AG_AYARLARI.get('KAYNAGA_GORE_DEGER', 'Dağıtım-AG'),
+            np.array(self.DIGER_KAYNAKLAR, dtype=object)[rng.integers(0, len(self.DIGER_KAYNAKLAR), kesinti_sayisi)]
+        )
+        tm_no = (1000000 + seg_tm[segment]).astype(float)
+        tm_no[rng.random(kesinti_sayisi) < 0.05] = np.nan
+
+        kesintiler = pd.DataFrame({
+            'KesintiNo': kesinti_nolari,
+            'Unsur': seg_unsur[segment],
+            'Baslama': self.baslangic + pd.to_timedelta(baslama_dk, unit='m'),
+            'SureDk': sure,
+            'KademeSayisi': kademe_sayilari,
+            'Kaynak': kaynak,
+            'TMNo': tm_no
+        })
+
+        # Kademe satırları
+        tekrar = np.repeat(np.arange(kesinti_sayisi), kademe_sayilari)[:self.satir_sayisi]
+        kademe = np.arange(len(tekrar)) - np.repeat(np.cumsum(kademe_sayilari) - kademe_sayilari,
+                                                     kademe_sayilari)[:self.satir_sayisi] + 1
+        k = kesintiler.iloc[tekrar].reset_index(drop=True)
+        kaydirma = pd.to_timedelta((kademe - 1) * rng.integers(1, 10, len(tekrar)), unit='m')
+        baslama = k['Baslama'] + kaydirma
+        bitis = baslama + pd.to_timedelta(k['SureDk'].to_numpy() + (kademe - 1) * 5, unit='m')
+        n = len(k)
+
+        def cagri_zamani(referans, alt_dk, ust_dk, bos_orani):
+            zaman = referans + pd.to_timedelta(rng.integers(alt_dk, ust_dk, n), unit='m')
+            return zaman.where(rng.random(n) >= bos_orani)
+
+        def secim(degerler, olasiliklar):
+            return np.array(degerler, dtype=object)[rng.choice(len(degerler), n, p=olasiliklar)]
+
+        kolonlar = KESINTI_SUTUNLARI
+        df = pd.DataFrame({
+            'Sıra No': np.arange(1, n + 1),
+            'Bölge': secim(['Merkez', 'Kuzey', 'Güney', 'Doğu', 'Batı'], None),
+            kolonlar['INOUT']: secim(['IN', 'OUT', np.nan], [0.45, 0.45, 0.1]),
+            kolonlar['KESINTI_NO']: k['KesintiNo'].to_numpy(),
+            kolonlar['KADEME']: kademe,
+            kolonlar['SEBEKE_UNSURU']: np.char.add('UNSUR-', k['Unsur'].to_numpy().astype(str)).astype(object),
+            kolonlar['BASLAMA']: self._karisik_tarih(rng, baslama),
+            kolonlar['BITIS']: self._karisik_tarih(rng, bitis),
+            kolonlar['SCADA']: secim(['X', '', np.nan], [0.3, 0.2, 0.5]),
+            kolonlar['SON_CAGRI']: cagri_zamani(bitis, -30, 120, 0.3),
+            kolonlar['ILK_MUSTERI_DISI']: cagri_zamani(baslama, -20, 60, 0.4),
+            kolonlar['ILK_MUSTERI']: cagri_zamani(baslama, -30, 90, 0.2),
+            kolonlar['CBS_TM_NO']: k['TMNo'].to_numpy(),
+            kolonlar['KAYNAGA_GORE']: k['Kaynak'].to_numpy(),
+            kolonlar['TOPLAM_CAGRI']: rng.poisson(self.cagri_hacmi * 2, n),
+            kolonlar['KESINTI_SEVIYESI']: secim(['AG', 'OG', 'YG', np.nan], [0.5, 0.3, 0.1, 0.1]),
+            'Açıklama': 'Sentetik kayıt'
+        })
+
+        # Dışa aktarımlar sıralı gelmez
+        df = df.iloc[rng.permutation(n)].reset_index(drop=True)
+        return kesintiler, df
+
+    def cm_tablosu_olustur(self, rng, kesintiler):
+        """
+        CM çağrı kayıtlarını CM_SUTUN_INDEKSLERI yerleşimiyle oluştur.
+
+        Müşteriler unsur bazlı havuzlardan seçilir; böylece aynı unsurun
+        ardışık kesintilerinde ortak Hizmet No (Ortak W) oluşur.
+
+        Args:
+            rng: numpy Generator
+            kesintiler: kesinti_tablosu_olustur'un kesinti bazlı çıktısı
+
+        Returns:
+            DataFrame: Başlıksız, sütun pozisyonları config ile uyumlu CM verisi
+        """
+        cagri_sayilari = rng.poisson(self.cagri_hacmi, len(kesintiler))
+        kaynak = np.repeat(np.arange(len(kesintiler)), cagri_sayilari)
+        if len(kaynak) > EXCEL_MAKS_SATIR - 3:
+            print(f"⚠️ CM satırları Excel sınırına indirildi: {len(kaynak)} → {EXCEL_MAKS_SATIR - 3}")
+            kaynak = kaynak[:EXCEL_MAKS_SATIR - 3]
+        n = len(kaynak)
+        k = kesintiler.iloc[kaynak]
+
+        sutun_sayisi = max(CM_SUTUN_INDEKSLERI.values()) + 2
+        df = pd.DataFrame({i: '' for i in range(sutun_sayisi)}, index=range(n))
+        df[0] = np.arange(1, n + 1)
+        df[1] = 'Arıza'
+
+        musteri = k['Unsur'].to_numpy() * 1000 + rng.integers(0, 25, n)
+        df[CM_SUTUN_INDEKSLERI['HIZMET_NO']] = 40000000 + musteri
+
+        ticket = np.char.add('OMS-', rng.integers(1, 10 ** 7, n).astype(str)).astype(object)
+        ticket[rng.random(n) < 0.05] = ''
+        df[CM_SUTUN_INDEKSLERI['OMS_TICKET_ID']] = ticket
+        df[CM_SUTUN_INDEKSLERI['KESINTI_ID']] = k['KesintiNo'].to_numpy()
+
+        # Çağrılar kesinti öncesi, sırası ve sonrasına dağılır
+        ofset = (rng.random(n) * (k['SureDk'].to_numpy() + 180) - 60).astype(np.int64)
+        olusturma = k['Baslama'].reset_index(drop=True) + pd.to_timedelta(ofset, unit='m')
+        metin = rng.random(n) < 0.2
+        tarih = olusturma.astype(object)
+        tarih[metin] = olusturma[metin].dt.strftime('%Y-%m-%d %H:%M:%S')
+        df[CM_SUTUN_INDEKSLERI['OLUSTURMA_TARIHI']] = tarih.to_numpy()
+
+        return df
+
+    def table_tablosu_olustur(self, rng, kesintiler):
+        """
+        table.xlsx (OTG) satırlarını TABLE_SUTUN_INDEKSLERI yerleşimiyle oluştur.
+
+        Args:
+            rng: numpy Generator
+            kesintiler: Kesinti bazlı DataFrame
+
+        Returns:
+            DataFrame: Kesinti başına bir satır
+        """
+        n = len(kesintiler)
+        sutun_sayisi = TABLE_SUTUN_INDEKSLERI['SON_SUTUN'] + 1
+        veri = {}
+        for i in range(sutun_sayisi):
+            veri[f'Sütun {i + 1}'] = np.char.add(f'D{i}-', rng.integers(0, 100, n).astype(str)).astype(object)
+        df = pd.DataFrame(veri)
+
+        df.iloc[:, TABLE_SUTUN_INDEKSLERI['KESINTI_ID']] = kesintiler['KesintiNo'].to_numpy()
+        df.rename(columns={df.columns[TABLE_SUTUN_INDEKSLERI['KESINTI_ID']]: 'Kesinti No'}, inplace=True)
+
+        for anahtar in ('ETKILENEN_KULLANICI_T', 'ETKILENEN_KULLANICI_U',
+                        'ETKILENEN_KULLANICI_V', 'ETKILENEN_KULLANICI_W'):
+            deger = rng.integers(0, 500, n).astype(object)
+            deger[rng.random(n) < 0.1] = ''
+            df.iloc[:, TABLE_SUTUN_INDEKSLERI[anahtar]] = deger
+
+        for anahtar in ('ILK_CAGRI_AT', 'ILK_CAGRI_AU'):
+            zaman = (kesintiler['Baslama'] + pd.to_timedelta(rng.integers(-20, 90, n), unit='m')).astype(object)
+            zaman[rng.random(n) < 0.3] = ''
+            df.iloc[:, TABLE_SUTUN_INDEKSLERI[anahtar]] = zaman.to_numpy()
+
+        kelime_sayisi = rng.integers(1, 15, n)
+        df.iloc[:, TABLE_SUTUN_INDEKSLERI['OMS_YORUM']] = [
+            ' '.join(['ekip sahada arıza giderildi'] * int(s)) for s in kelime_sayisi
+        ]
+        return df
+
+    def jtk_tablosu_olustur(self, rng, kesintiler):
+        """
+        jtk.xlsx satırlarını oluştur (kesintilerin yarısı, 1-2 kayıt).
+
+        Args:
+            rng: numpy Generator
+            kesintiler: Kesinti bazlı DataFrame
+
+        Returns:
+            DataFrame: Kesinti ID'si JTK_SUTUN_INDEKSLERI['KESINTI_ID'] sütununda
+        """
+        secili = kesintiler.iloc[::2]
+        tekrar = rng.integers(1, 3, len(secili))
+        kaynak = np.repeat(np.arange(len(secili)), tekrar)
+        n = len(kaynak)
+        s = secili.iloc[kaynak]
+
+        df = pd.DataFrame({
+            'Ekip': np.char.add('Ekip-', rng.integers(1, 50, n).astype(str)),
+            'Durum': np.array(['Açık', 'Kapalı'], dtype=object)[rng.integers(0, 2, n)],
+            'Kesinti ID': s['KesintiNo'].to_numpy(),
+            'Zaman': (s['Baslama'] + pd.to_timedelta(rng.integers(0, 240, n), unit='m')).to_numpy(),
+            'Açıklama': 'Jeneratör talebi iletildi',
+            'Adet': rng.integers(1, 5, n)
+        })
+        # Kesinti ID sütununu config'deki pozisyona taşı
+        sutunlar = [c for c in df.columns if c != 'Kesinti ID']
+        sutunlar.insert(JTK_SUTUN_INDEKSLERI['KESINTI_ID'], 'Kesinti ID')
+        return df[sutunlar]
+
+    # ═══════════════════════════════════════════════════════════════
+    # YARDIMCILAR
+    # ═══════════════════════════════════════════════════════════════
+
+    @staticmethod
+    def _karisik_tarih(rng, zamanlar, metin_orani=0.1):
+        """Zamanların bir kısmını 'gg.aa.yyyy ss:dd:ss' metni olarak döndür"""
+        sonuc = zamanlar.astype(object)
+        metin = rng.random(len(zamanlar)) < metin_orani
+        sonuc[metin] = zamanlar[metin].dt.strftime('%d.%m.%Y %H:%M:%S')
+        return sonuc.to_numpy()
+
+    @staticmethod
+    def _kesinti_yaz(df, dosya_yolu):
+        """Başlık satırı KESINTI_HEADER_ROW'da olacak şekilde yaz"""
+        with pd.ExcelWriter(dosya_yolu, engine='openpyxl') as writer:
+            df.to_excel(writer, startrow=EXCEL_AYARLARI['KESINTI_HEADER_ROW'], index=False)
+            writer.sheets['Sheet1']['A1'] = 'Kesinti Raporu (sentetik)'
+
+    @staticmethod
+    def _cm_yaz(df, dosya_yolu):
+        """İki açıklama satırı + başlık satırı ile başlıksız CM verisini yaz"""
+        ust = pd.DataFrame(
+            [['CM Çağrı Raporu (sentetik)'] + [''] * (len(df.columns) - 1),
+             [''] * len(df.columns),
+             [f'Alan {i + 1}' for i in range(len(df.columns))]],
+            columns=df.columns
+        )
+        pd.concat([ust, df], ignore_index=True).to_excel(dosya_yolu, index=False, header=False)
+
+    @staticmethod
+    def _table_yaz(df, dosya_yolu):
+        """Başlık TABLE_SKIP_ROWS satır atlandıktan sonra gelecek şekilde yaz"""
+        with pd.ExcelWriter(dosya_yolu, engine='openpyxl') as writer:
+            df.to_excel(writer, startrow=EXCEL_AYARLARI['TABLE_SKIP_ROWS'], index=False)
+            writer.sheets['Sheet1']['A1'] = 'OTG Tablosu (sentetik)'
+
+
+def main(argv=None):
+    """Komut satırından veri üret"""
+    parser = argparse.ArgumentParser(description="Sentetik kesinti verisi üret")
+    parser.add_argument('klasor', help="Hedef klasör")
+    parser.add_argument('--satir', type=int, default=10000, help="Kesinti satır sayısı")
+    parser.add_argument('--zincir', type=float, default=0.35, help="Zincir yoğunluğu (0-1)")
+    parser.add_argument('--dagitim-ag', type=float, default=0.3, help="Dağıtım-AG oranı (0-1)")
+    parser.add_argument('--cagri', type=float, default=2.0, help="Kesinti başına ortalama çağrı")
+    parser.add_argument('--tohum', type=int, default=0, help="Rastgele tohum")
+    args = parser.parse_args(argv)
+
+    uretici = VeriUretici(args.satir, args.zincir, args.dagitim_ag, args.cagri, tohum=args.tohum)
+    ozet = uretici.uret(args.klasor)
+    print(json.dumps(ozet, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
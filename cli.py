@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Kesinti Analiz - Komut Satırı Arayüzü
+Analiz ve raporlamayı ekransız (cron, sunucu, toplu işlem) çalıştırır.
+Bu yol tkinter'ı import etmez.
+
+Örnek:
+    python cli.py kesinti.xlsx --kritik-saat 9 --tolerans-ustu 60 --tolerans-alti 15 --isci 4
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+from config import VARSAYILAN, TM_ARDARDA_AYARLARI, ONBELLEK_AYARLARI, PARALEL_AYARLARI, PROFIL_AYARLARI
+from modules.kesinti_analiz import KesintiAnaliz
+from modules.dosyalama import Dosyalama
+from modules.ilerleme import IslemIptalEdildi
+from modules.profil import profil
+from modules.veri_deposu import VeriDeposu
+
+# Çıkış kodları
+CIKIS_BASARILI = 0
+CIKIS_HATA = 1          # Beklenmeyen hata
+CIKIS_GIRDI_HATASI = 2  # Geçersiz argüman / kesinti dosyası yok
+CIKIS_EKSIK_DOSYA = 3   # Raporlama için table/jtk/cm eksik
+CIKIS_SONUC_YOK = 4     # Analiz sonuç üretmedi
+CIKIS_IPTAL = 130       # Ctrl+C
+
+
+def _tam_sayi_listesi(metin):
+    """Virgülle ayrılmış tam sayıları listeye çevir (argparse tipi)"""
+    try:
+        degerler = [int(p) for p in metin.split(',') if p.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"virgülle ayrılmış tam sayılar bekleniyor: {metin}")
+    if not degerler:
+        raise argparse.ArgumentTypeError("en az bir değer gerekli")
+    return degerler
+
+
+def argumanlari_ayristir(argv=None):
+    """Komut satırı argümanlarını ayrıştır"""
+    parser = argparse.ArgumentParser(
+        description="Kesinti analizi ve PNG/Excel raporlama (ekransız)"
+    )
+    parser.add_argument('kesinti_dosyasi', nargs='?',
+                        help="Kesinti Excel dosyası (--analiz-yok ile gerekmez)")
+    parser.add_argument('--cikti-klasoru',
+                        help="table.xlsx/jtk.xlsx/cm.xlsx klasörü ve rapor çıktısı "
+                             "(varsayılan: kesinti dosyasının klasörü)")
+    parser.add_argument('--analiz-dosyasi',
+                        help=f"Analiz sonuç dosyası (varsayılan: <klasör>/{VARSAYILAN['ANALIZ_DOSYA_ADI']})")
+    parser.add_argument('--kritik-saat', type=int, default=TM_ARDARDA_AYARLARI['KRITIK_SAAT'],
+                        help="Kritik süre (saat)")
+    parser.add_argument('--tolerans-ustu', type=int, default=TM_ARDARDA_AYARLARI['TOLERANS_USTU_DK'],
+                        help="Kritik süre üstü tolerans (dakika)")
+    parser.add_argument('--tolerans-alti', type=int, default=TM_ARDARDA_AYARLARI['TOLERANS_ALTI_DK'],
+                        help="Kritik süre altı tolerans (dakika)")
+    parser.add_argument('--tarama-kritik-saat', type=_tam_sayi_listesi, metavar='LISTE',
+                        help="Tolerans taraması: kritik süre değerleri (örn. 6,9,12)")
+    parser.add_argument('--tarama-tolerans-ustu', type=_tam_sayi_listesi, metavar='LISTE',
+                        help="Tolerans taraması: kritik süre üstü tolerans değerleri (dk)")
+    parser.add_argument('--tarama-tolerans-alti', type=_tam_sayi_listesi, metavar='LISTE',
+                        help="Tolerans taraması: kritik süre altı tolerans değerleri (dk); "
+                             "tarama özeti JSON'a yazılır, tam analiz --kritik-saat/--tolerans-* ile yapılır")
+    parser.add_argument('--isci', type=int, default=None,
+                        help=f"Rapor üretimi için süreç sayısı (varsayılan: {PARALEL_AYARLARI['RAPOR_ISCI_SAYISI']})")
+    parser.add_argument('--analiz-isci', type=int, default=None,
+                        help="Zincir oluşturma için süreç sayısı "
+                             f"(varsayılan: {PARALEL_AYARLARI.get('ANALIZ_ISCI_SAYISI', 1)})")
+    parser.add_argument('--analiz-yok', action='store_true',
+                        help="Analizi atla, mevcut analiz dosyasından raporla")
+    parser.add_argument('--rapor-yok', action='store_true',
+                        help="Sadece analiz yap, PNG/Excel raporlarını oluşturma")
+    parser.add_argument('--tum-raporlar', action='store_true',
+                        help="Girdisi değişmeyen grupları da yeniden raporla (manifesti yok say)")
+    parser.add_argument('--tam-analiz', action='store_true',
+                        help="Kesintileri değişmeyen şebeke unsurlarını da yeniden zincirle (analiz durumunu yok say)")
+    parser.add_argument('--onbellek-yok', action='store_true',
+                        help="Excel önbelleğini kullanma")
+    parser.add_argument('--profil', nargs='?', const='', default=None, metavar='DOSYA',
+                        help="Aşama bazlı süre/bellek raporu yaz (.json/.csv; "
+                             f"varsayılan: <klasör>/{PROFIL_AYARLARI['RAPOR_ADI']})")
+    parser.add_argument('--json',
+                        help="JSON özetinin yazılacağı dosya (varsayılan: stdout)")
+    return parser.parse_args(argv)
+
+
+def calistir(args):
+    """
+    Analiz → kaydet → raporlama akışını çalıştır.
+
+    Args:
+        args: Ayrıştırılmış argümanlar
+
+    Returns:
+        tuple: (çıkış kodu, özet sözlüğü)
+    """
+    ozet = {'durum': 'basarili', 'sureler_sn': {}}
+
+    if args.onbellek_yok:
+        ONBELLEK_AYARLARI['AKTIF'] = False
+
+    if args.analiz_yok:
+        if not args.analiz_dosyasi and not args.cikti_klasoru:
+            ozet['hata'] = "--analiz-yok için --analiz-dosyasi veya --cikti-klasoru gerekli"
+            return CIKIS_GIRDI_HATASI, ozet
+    elif not args.kesinti_dosyasi or not os.path.exists(args.kesinti_dosyasi):
+        ozet['hata'] = f"Kesinti dosyası bulunamadı: {args.kesinti_dosyasi}"
+        return CIKIS_GIRDI_HATASI, ozet
+
+    cikti_klasoru = args.cikti_klasoru or os.path.dirname(
+        os.path.abspath(args.kesinti_dosyasi or args.analiz_dosyasi)
+    )
+    analiz_dosyasi = args.analiz_dosyasi or os.path.join(cikti_klasoru, VARSAYILAN['ANALIZ_DOSYA_ADI'])
+    ozet['cikti_klasoru'] = cikti_klasoru
+    ozet['analiz_dosyasi'] = analiz_dosyasi
+
+    if args.profil is not None or PROFIL_AYARLARI['AKTIF']:
+        profil.baslat()
+        ozet['profil_raporu'] = args.profil or os.path.join(cikti_klasoru, PROFIL_AYARLARI['RAPOR_ADI'])
+
+    try:
+        return _akisi_calistir(args, ozet, cikti_klasoru, analiz_dosyasi)
+    finally:
+        if profil.aktif:
+            profil.durdur()
+            profil.rapor_yaz(ozet['profil_raporu'])
+
+
+def _akisi_calistir(args, ozet, cikti_klasoru, analiz_dosyasi):
+    """Analiz ve raporlama adımlarını sırayla çalıştır (bkz. calistir)"""
+    veri_deposu = VeriDeposu()  # CM analiz ve raporlamada bir kez okunur
+
+    # ═══════════════════════════════════════════════════════════════
+    # ANALİZ
+    # ═══════════════════════════════════════════════════════════════
+    if not args.analiz_yok:
+        tolerans_ayarlari = {
+            'kritik_saat': args.kritik_saat,
+            'tolerans_ustu_dk': args.tolerans_ustu,
+            'tolerans_alti_dk': args.tolerans_alti
+        }
+        ozet['kesinti_dosyasi'] = args.kesinti_dosyasi
+        ozet['tolerans_ayarlari'] = tolerans_ayarlari
+
+        engine = KesintiAnaliz(veri_deposu)
+        tarama_listeleri = (args.tarama_kritik_saat, args.tarama_tolerans_ustu, args.tarama_tolerans_alti)
+        if any(tarama_listeleri):
+            # Verilmeyen listeler tek değer olarak ana ayardan alınır
+            baslangic = time.perf_counter()
+            ayar_listesi = KesintiAnaliz.tarama_izgarasi(*[
+                liste or [varsayilan] for liste, varsayilan in zip(tarama_listeleri, tolerans_ayarlari.values())
+            ])
+            df_tarama = engine.tolerans_taramasi(args.kesinti_dosyasi, ayar_listesi)
+            ozet['tarama'] = json.loads(df_tarama.to_json(orient='records', force_ascii=False))
+            ozet['sureler_sn']['tarama'] = round(time.perf_counter() - baslangic, 3)
+
+        baslangic = time.perf_counter()
+        df_sonuc = engine.analiz_yap(args.kesinti_dosyasi, tolerans_ayarlari, isci_sayisi=args.analiz_isci,
+                                     artimli=False if args.tam_analiz else None)
+        ozet['grup_sayisi'] = int(len(df_sonuc))
+
+        if df_sonuc.empty:
+            ozet['durum'] = 'sonuc_yok'
+            ozet['sureler_sn']['analiz'] = round(time.perf_counter() - baslangic, 3)
+            return CIKIS_SONUC_YOK, ozet
+
+        engine.kaydet(analiz_dosyasi)
+        ozet['sureler_sn']['analiz'] = round(time.perf_counter() - baslangic, 3)
+    elif not os.path.exists(analiz_dosyasi):
+        ozet['hata'] = f"Analiz dosyası bulunamadı: {analiz_dosyasi}"
+        return CIKIS_GIRDI_HATASI, ozet
+
+    # ═══════════════════════════════════════════════════════════════
+    # RAPORLAMA
+    # ═══════════════════════════════════════════════════════════════
+    if not args.rapor_yok:
+        baslangic = time.perf_counter()
+        dosyalama = Dosyalama(cikti_klasoru, veri_deposu)
+        dosyalama.analiz_sonucunu_yukle(analiz_dosyasi)
+        dosyalama.gruplari_yukle()
+
+        basarili, eksik = dosyalama.dosyalari_yukle()
+        if not basarili:
+            ozet['durum'] = 'eksik_dosya'
+            ozet['eksik_dosyalar'] = eksik
+            return CIKIS_EKSIK_DOSYA, ozet
+
+        islenen = dosyalama.tum_gruplari_isle(isci_sayisi=args.isci,
+                                              artimli=False if args.tum_raporlar else None)
+        ozet['islenen_grup'] = islenen
+        ozet['atlanan_grup'] = dosyalama.son_rapor_ozeti['atlanan']
+        ozet['eski_klasorler'] = dosyalama.son_rapor_ozeti['eski_klasorler']
+        ozet['rapor_klasoru'] = os.path.join(cikti_klasoru, VARSAYILAN['OUTPUT_FOLDER'])
+        ozet['sureler_sn']['raporlama'] = round(time.perf_counter() - baslangic, 3)
+
+    return CIKIS_BASARILI, ozet
+
+
+def main(argv=None):
+    """Komut satırı giriş noktası"""
+    args = argumanlari_ayristir(argv)
+    for secenek, deger in (('--isci', args.isci), ('--analiz-isci', args.analiz_isci)):
+        if deger is not None and deger < 1:
+            print(json.dumps({'durum': 'hata', 'hata': f"{secenek} en az 1 olmalı",
+                              'cikis_kodu': CIKIS_GIRDI_HATASI}, ensure_ascii=False))
+            return CIKIS_GIRDI_HATASI
+
+    # Motorların ✓/✗ çıktıları stderr'e, JSON özeti stdout'a gider
+    try:
+        with contextlib.redirect_stdout(sys.stderr):
+            cikis_kodu, ozet = calistir(args)
+    except (KeyboardInterrupt, IslemIptalEdildi):
+        cikis_kodu, ozet = CIKIS_IPTAL, {'durum': 'iptal'}
+    except Exception as e:
+        import traceback
+        traceback.print_exc()
+        cikis_kodu, ozet = CIKIS_HATA, {'durum': 'hata', 'hata': str(e)}
+
+    if cikis_kodu not in (CIKIS_BASARILI, CIKIS_SONUC_YOK) and ozet.get('durum') == 'basarili':
+        ozet['durum'] = 'hata'
+    ozet['cikis_kodu'] = cikis_kodu
+
+    metin = json.dumps(ozet, ensure_ascii=False, indent=2)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            f.write(metin)
+    else:
+        print(metin)
+
+    return cikis_kodu
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -40,6 +40,12 @@ TM_ARDARDA_AYARLARI = {
     'TOLERANS_ALTI_DK': 15      # Kritik süre altı için tolerans (dakika)
 }
 
+# Paralel çalışma ayarları
+PARALEL_AYARLARI = {
+    'RAPOR_ISCI_SAYISI': 1,     # Grup raporları için süreç sayısı (1 = seri çalışma)
+    'ANALIZ_ISCI_SAYISI': 1     # Zincir/TM zinciri oluşturma için süreç sayısı (1 = seri çalışma)
+}
+
 # CM.xlsx sütun indeksleri
 CM_SUTUN_INDEKSLERI = {
     'HIZMET_NO': 2,           # C sütunu - Hizmet No
@@ -80,12 +86,83 @@ VERI_SUTUN_INDEKSLERI = {
 
 EXCEL_AYARLARI = {
     'KESINTI_HEADER_ROW': 3,     # Kesinti dosyası başlık satırı (0-tabanlı: 4. satır)
-    'CM_HEADER_ROW': None,       # CM dosyası başlık yok (header=None)
+    'CM_SKIP_ROWS': 2,           # CM dosyası atlanacak satır sayısı (ardından başlık satırı)
     'TABLE_SKIP_ROWS': 3,        # table.xlsx atlanacak satır sayısı
     'JTK_HEADER_ROW': 0,         # jtk.xlsx başlık satırı
     'VERI_HEADER_ROW': 0         # veri.xlsx başlık satırı
 }
 
+# Okuma motoru ve Excel dışı girdiler
+OKUYUCU_AYARLARI = {
+    'EXCEL_MOTORU': 'otomatik',                        # 'otomatik' (python-calamine kuruluysa calamine), 'calamine', 'openpyxl'
+    'GIRDI_UZANTILARI': ['.xlsx', '.parquet', '.csv'],  # table/jtk/cm aranırken denenecek uzantılar (sırayla)
+    'CSV_AYIRICI': ',',
+    'CSV_KODLAMA': 'utf-8-sig',
+    'SURE_YAZDIR': True                                # Her okumada motoru ve süreyi yazdır
+}
+
+# ============================================================================
+# GİRDİ ŞEMALARI (okunacak sütunlar ve tipleri)
+# ============================================================================
+
+# Kesinti dosyasından yalnızca KESINTI_SUTUNLARI okunur; tipler anahtara göre
+KESINTI_SEMASI = {
+    'KATEGORIK': ['INOUT', 'SEBEKE_UNSURU', 'KAYNAGA_GORE'],   # Okurken category
+    'TAM_SAYI': ['KESINTI_NO'],                                 # Boş satırlar atıldıktan sonra int64 (tam sayıysa; 5000001.0 -> 5000001)
+    'TARIH': ['BASLAMA', 'BITIS', 'SON_CAGRI', 'ILK_MUSTERI_DISI', 'ILK_MUSTERI']  # datetime64 (gün önce)
+}
+
+# table.xlsx'ten yalnızca OTG raporunda kullanılan sütunlar okunur (jtk/cm raporlarda tüm sütunlarıyla yer alır)
+TABLE_SEMASI = {
+    'SUTUN_INDEKSLERI': sorted(
+        {TABLE_SUTUN_INDEKSLERI['KESINTI_ID']}
+        | set(TABLE_SUTUN_INDEKSLERI['SECILEN_SUTUNLAR'])
+        | set(TABLE_SUTUN_INDEKSLERI['EK_SUTUNLAR'])
+        | {TABLE_SUTUN_INDEKSLERI[anahtar] for anahtar in (
+            'ETKILENEN_KULLANICI_T', 'ETKILENEN_KULLANICI_U', 'ETKILENEN_KULLANICI_V',
+            'ETKILENEN_KULLANICI_W', 'OMS_YORUM', 'ILK_CAGRI_AT', 'ILK_CAGRI_AU', 'SON_SUTUN'
+        )}
+    )
+}
+
+# ============================================================================
+# ÖNBELLEK AYARLARI
+# ============================================================================
+
+ONBELLEK_AYARLARI = {
+    'AKTIF': True,                      # Excel girdileri için yan dosya önbelleği
+    'KLASOR_ADI': '.kesinti_onbellek',  # Çalışma kitabının yanındaki önbellek klasörü
+    'MAKS_BOYUT_MB': 2048               # Klasör başına boyut sınırı (eskiler silinir)
+}
+
+# ============================================================================
+# ARTIMLI RAPORLAMA AYARLARI
+# ============================================================================
+
+RAPOR_MANIFEST_AYARLARI = {
+    'AKTIF': True,                         # Girdisi değişmeyen grupların raporları yeniden üretilmez
+    'DOSYA_ADI': '.rapor_manifest.json',   # outputs klasörüne yazılır
+    'ESKI_KLASORLERI_SIL': False           # Artık listede olmayan grup klasörleri silinsin mi (False: sadece raporlanır)
+}
+
+# ============================================================================
+# ARTIMLI ANALİZ AYARLARI
+# ============================================================================
+
+ARTIMLI_ANALIZ_AYARLARI = {
+    'AKTIF': True,                         # Kesintileri değişmeyen şebeke unsuru / TM zincirleri yeniden hesaplanmaz
+    'KLASOR_ADI': '.analiz_durumu'         # Kesinti dosyasının klasöründe (JSON özet + Parquet tablolar; pyarrow gerekir)
+}
+
+# ============================================================================
+# PROFİL AYARLARI
+# ============================================================================
+
+PROFIL_AYARLARI = {
+    'AKTIF': False,                      # Aşama bazlı süre/bellek ölçümü
+    'RAPOR_ADI': 'profil_raporu.json'    # Çıktı klasörüne yazılır (.csv de olabilir)
+}
+
 # ============================================================================
 # GÖRSEL AYARLAR
 # ============================================================================
@@ -107,7 +184,8 @@ PNG_AYARLARI = {
     'HEADER_WRAP_LENGTH': 12,      # Başlık wrap (kısa - alta geçsin)
     'CELL_WRAP_LENGTH': 15,        # Veri hücresi wrap (kısa - alta geçsin)
     'OTG_CELL_WRAP': 12,           # OTG için özel wrap (çok kısa - alta geçsin)
-    'ROW_HEIGHT_FACTOR': 0.5       # Satır yükseklik çarpanı (artırıldı)
+    'ROW_HEIGHT_FACTOR': 0.5,      # Satır yükseklik çarpanı (artırıldı)
+    'TABLO_CIZICI': 'pillow'       # 'pillow' (hızlı) veya 'matplotlib' (ax.table)
 }
 
 # ============================================================================
@@ -8,12 +8,18 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import os
 import sys
+import queue
+import threading
+import traceback
 
 # Modülleri import et
-from config import VARSAYILAN, VERI_SUTUN_INDEKSLERI, TM_ARDARDA_AYARLARI
+from config import VARSAYILAN, VERI_SUTUN_INDEKSLERI, TM_ARDARDA_AYARLARI, PROFIL_AYARLARI
 from modules.kesinti_analiz import KesintiAnaliz
 from modules.dosyalama import Dosyalama
 from modules.excel_yardimci import ExcelYardimci
+from modules.ilerleme import Ilerleme, IslemIptalEdildi
+from modules.profil import profil
+from modules.veri_deposu import VeriDeposu
 
 
 class ModernButton(tk.Canvas):
@@ -112,6 +118,20 @@ class BirlesikPanel:
         'error': '#ef4444'
     }
     
+    # İlerleme aşamalarının durum çubuğundaki karşılıkları
+    ASAMA_METINLERI = {
+        'okuma': 'Excel dosyaları okunuyor',
+        'hazirlik': 'Veriler hazırlanıyor',
+        'zincir': 'Zincirler oluşturuluyor',
+        'tm': 'TM No ard arda analizi',
+        'ortak_w': 'Ortak W değerleri hesaplanıyor',
+        'oms_ticket': "OMS ticket ID'leri belirleniyor",
+        'tarama': 'Tolerans ayarları karşılaştırılıyor',
+        'kaydet': 'Sonuçlar kaydediliyor',
+        'yukleme': 'Rapor dosyaları yükleniyor',
+        'gruplar': 'Raporlar oluşturuluyor'
+    }
+    
     def __init__(self, root):
         self.root = root
         self.root.title("⚡ Kesinti Analiz Pro")
@@ -136,8 +156,15 @@ class BirlesikPanel:
         self.cikti_klasoru = None
         self.analiz_engine = None
         self.dosyalama_engine = None
+        self.tarama_engine = None  # Tolerans taramasının okuduğu veri seçilen ayarın analizinde kullanılır
+        self.veri_deposu = VeriDeposu()  # CM analiz ve raporlamada bir kez okunur
         self.grup_list = []
         
+        # Arka plan iş parçacığı ile iletişim
+        self.is_kuyrugu = queue.Queue()
+        self.iptal_olayi = threading.Event()
+        self._is_bitince = None
+        
         # ttk stil ayarları
         self._setup_styles()
         self._create_ui()
@@ -349,16 +376,25 @@ class BirlesikPanel:
         self._create_param_input(tolerans_row, "< Tolerans (dk)", "entry_tolerans_alti",
                                 TM_ARDARDA_AYARLARI['TOLERANS_ALTI_DK'])
         
-        # Analiz butonu
+        # Analiz ve tarama butonları
         btn_frame = tk.Frame(analiz_card, bg=self.COLORS['card_bg'])
         btn_frame.pack(fill='x', pady=(10, 3))
+        btn_inner = tk.Frame(btn_frame, bg=self.COLORS['card_bg'])
+        btn_inner.pack()
         
         self.btn_analiz = ModernButton(
-            btn_frame, "▶  ANALİZİ BAŞLAT", self._analiz_baslat,
+            btn_inner, "▶  ANALİZİ BAŞLAT", self._analiz_baslat,
             self.COLORS['accent_green'], '#0ea472',
             width=180, height=38, font_size=10
         )
-        self.btn_analiz.pack()
+        self.btn_analiz.pack(side='left', padx=(0, 12))
+        
+        self.btn_tarama = ModernButton(
+            btn_inner, "🔍 Tolerans Taraması", self._tarama_penceresi_ac,
+            self.COLORS['accent_cyan'], '#0096b4',
+            width=160, height=38, font_size=9
+        )
+        self.btn_tarama.pack(side='left')
         
         # Sonuç etiketi
         self.lbl_analiz_sonuc = tk.Label(
@@ -485,6 +521,61 @@ class BirlesikPanel:
         )
         self.lbl_status.pack(side='left', fill='x', expand=True)
         
+        self.btn_iptal = tk.Button(
+            status_header,
+            text="⏹ İptal",
+            command=self._iptal_et,
+            font=('Segoe UI', 8, 'bold'),
+            bg=self.COLORS['error'],
+            fg='white',
+            relief='flat',
+            cursor='hand2',
+            padx=10,
+            pady=2,
+            activebackground=self.COLORS['accent_pink'],
+            activeforeground='white',
+            state='disabled'
+        )
+        self.btn_iptal.pack(side='right')
+        
+        self.var_profil = tk.BooleanVar(value=PROFIL_AYARLARI['AKTIF'])
+        tk.Checkbutton(
+            status_header,
+            text="📈 Profil",
+            variable=self.var_profil,
+            font=('Segoe UI', 8),
+            bg=self.COLORS['bg_medium'],
+            fg=self.COLORS['text_muted'],
+            selectcolor=self.COLORS['input_bg'],
+            activebackground=self.COLORS['bg_medium'],
+            activeforeground=self.COLORS['text_light'],
+            highlightthickness=0
+        ).pack(side='right', padx=(0, 10))
+        
+        # İşaretliyse analiz durumu yok sayılır, tüm zincirler yeniden hesaplanır
+        self.var_tam_analiz = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            status_header,
+            text="🔄 Tam analiz",
+            variable=self.var_tam_analiz,
+            font=('Segoe UI', 8),
+            bg=self.COLORS['bg_medium'],
+            fg=self.COLORS['text_muted'],
+            selectcolor=self.COLORS['input_bg'],
+            activebackground=self.COLORS['bg_medium'],
+            activeforeground=self.COLORS['text_light'],
+            highlightthickness=0
+        ).pack(side='right', padx=(0, 10))
+        
+        self.lbl_ilerleme = tk.Label(
+            status_header,
+            text="",
+            font=('Segoe UI', 9),
+            bg=self.COLORS['bg_medium'],
+            fg=self.COLORS['text_muted']
+        )
+        self.lbl_ilerleme.pack(side='right', padx=(0, 10))
+        
         # Progress bar
         self.progress = ttk.Progressbar(
             status_card,
@@ -544,10 +635,11 @@ class BirlesikPanel:
         """Kesinti Excel dosyasını seç"""
         dosya = filedialog.askopenfilename(
             title="Kesinti Excel Dosyasını Seç",
-            filetypes=[("Excel Dosyası", "*.xlsx *.xls")]
+            filetypes=[("Excel Dosyası", "*.xlsx *.xls"), ("CSV / Parquet", "*.csv *.parquet")]
         )
         if dosya:
             self.kesinti_dosyasi = dosya
+            self.tarama_engine = None
             self.entry_kesinti.delete(0, tk.END)
             self.entry_kesinti.insert(0, dosya)
             
@@ -612,29 +704,48 @@ class BirlesikPanel:
         }
         
         self._set_status("⏳ Analiz yapılıyor, lütfen bekleyin...", 'processing')
-        self.btn_analiz.config(state='disabled')
-        self.progress['value'] = 20
-        self.root.update()
+        self._butonlari_ayarla('disabled')
+        self.progress['value'] = 0
         
-        try:
-            self.analiz_engine = KesintiAnaliz()
-            df_sonuc = self.analiz_engine.analiz_yap(dosya, tolerans_ayarlari)
+        ilerleme = Ilerleme(
+            KesintiAnaliz.ILERLEME_ASAMALARI + [('kaydet', 5)],
+            callback=self._ilerleme_gonder,
+            iptal_olayi=self.iptal_olayi
+        )
+        analiz_sonuc_yolu = os.path.join(os.path.dirname(dosya), VARSAYILAN['ANALIZ_DOSYA_ADI'])
+        artimli = False if self.var_tam_analiz.get() else None
+        
+        def analiz_isi():
+            # Aynı dosya taranmışsa okuma ve sıralama tekrarlanmaz
+            engine = self.tarama_engine or KesintiAnaliz(self.veri_deposu)
+            df_sonuc = engine.analiz_yap(dosya, tolerans_ayarlari, ilerleme, artimli=artimli)
+            if not df_sonuc.empty:
+                ilerleme.guncelle('kaydet', 0.0, zorla=True)
+                engine.kaydet(analiz_sonuc_yolu)
+            return engine, df_sonuc
+        
+        def analiz_bitti(durum, veri):
+            self._butonlari_ayarla('normal')
+            self.progress['value'] = 0
+            self.lbl_ilerleme.config(text="")
             
-            self.progress['value'] = 60
-            self.root.update()
+            if durum == 'iptal':
+                self._set_status("⏹ Analiz iptal edildi", 'warning')
+                return
+            
+            if durum == 'hata':
+                messagebox.showerror("Hata", f"Analiz sırasında hata oluştu:\n\n{str(veri)}")
+                self._set_status(f"✗ Hata: {str(veri)[:50]}...", 'error')
+                return
+            
+            self.analiz_engine, df_sonuc = veri
             
             if df_sonuc.empty:
                 messagebox.showinfo("Sonuç Yok", "Belirtilen kriterlere göre ard arda veya iç içe kesinti bulunamadı.")
                 self._set_status("⚠️ Sonuç bulunamadı", 'warning')
-                self.btn_analiz.config(state='normal')
-                self.progress['value'] = 0
                 return
             
-            self.analiz_sonuc_yolu = os.path.join(os.path.dirname(dosya), VARSAYILAN['ANALIZ_DOSYA_ADI'])
-            self.analiz_engine.kaydet(self.analiz_sonuc_yolu)
-            
-            self.progress['value'] = 100
-            self.root.update()
+            self.analiz_sonuc_yolu = analiz_sonuc_yolu
             
             self.lbl_analiz_sonuc.config(
                 text=f"✓ {len(df_sonuc)} grup bulundu → {VARSAYILAN['ANALIZ_DOSYA_ADI']}",
@@ -651,16 +762,163 @@ class BirlesikPanel:
                 f"📁 Kaydedilen dosya: {self.analiz_sonuc_yolu}\n\n"
                 f"Şimdi 'Raporları Oluştur' butonuna tıklayarak PNG/Excel raporlarını oluşturabilirsiniz."
             )
+        
+        profil_yolu = os.path.join(os.path.dirname(dosya), 'analiz_' + PROFIL_AYARLARI['RAPOR_ADI'])
+        self._arka_planda_calistir(analiz_isi, analiz_bitti, profil_yolu)
+    
+    def _tarama_penceresi_ac(self):
+        """Tolerans taraması penceresi: değer listelerinin tüm kombinasyonlarını karşılaştır"""
+        dosya = self.entry_kesinti.get().strip()
+        if not os.path.exists(dosya):
+            messagebox.showerror("Hata", "Lütfen geçerli bir Excel dosyası seçin.")
+            return
+        
+        pencere = tk.Toplevel(self.root)
+        pencere.title("🔍 Tolerans Taraması")
+        pencere.configure(bg=self.COLORS['bg_dark'], padx=12, pady=10)
+        pencere.transient(self.root)
+        pencere.geometry("720x460")
+        
+        giris = tk.Frame(pencere, bg=self.COLORS['bg_medium'], padx=12, pady=8)
+        giris.pack(fill='x')
+        
+        tk.Label(
+            giris,
+            text="⚙️ Virgülle ayrılmış değerler (tüm kombinasyonlar denenir)",
+            font=('Segoe UI', 9, 'bold'),
+            bg=self.COLORS['bg_medium'],
+            fg=self.COLORS['accent_cyan']
+        ).pack(anchor='w', pady=(0, 6))
+        
+        giris_row = tk.Frame(giris, bg=self.COLORS['bg_medium'])
+        giris_row.pack(fill='x')
+        
+        self._create_param_input(giris_row, "Kritik Süre (saat)", "entry_tarama_kritik",
+                                 self.entry_kritik_saat.get().strip())
+        self._create_param_input(giris_row, "≥ Tolerans (dk)", "entry_tarama_ustu",
+                                 self.entry_tolerans_ustu.get().strip())
+        self._create_param_input(giris_row, "< Tolerans (dk)", "entry_tarama_alti",
+                                 self.entry_tolerans_alti.get().strip())
+        
+        # Karşılaştırma tablosu
+        sutunlar = [
+            ('kritik_saat', "Kritik (saat)", 80), ('tolerans_ustu_dk', "≥ Tol. (dk)", 80),
+            ('tolerans_alti_dk', "< Tol. (dk)", 80), ('Grup Sayısı', "Grup", 80),
+            ('İlgili Kesinti Sayısı', "Kesinti", 80), ('Toplam Birleşik Süre', "Toplam Süre", 110)
+        ]
+        tablo_frame = tk.Frame(pencere, bg=self.COLORS['input_bg'])
+        tablo_frame.pack(fill='both', expand=True, pady=8)
+        
+        tablo_scroll = tk.Scrollbar(tablo_frame)
+        tablo_scroll.pack(side='right', fill='y')
+        
+        tablo = ttk.Treeview(
+            tablo_frame, columns=[ad for ad, _, _ in sutunlar], show='headings',
+            selectmode='browse', yscrollcommand=tablo_scroll.set
+        )
+        for ad, baslik, genislik in sutunlar:
+            tablo.heading(ad, text=baslik)
+            tablo.column(ad, width=genislik, anchor='center')
+        tablo.pack(fill='both', expand=True)
+        tablo_scroll.config(command=tablo.yview)
+        
+        btn_row = tk.Frame(pencere, bg=self.COLORS['bg_dark'])
+        btn_row.pack()
+        
+        def taramayi_baslat():
+            listeler = [
+                self._deger_listesi(entry.get())
+                for entry in (self.entry_tarama_kritik, self.entry_tarama_ustu, self.entry_tarama_alti)
+            ]
+            if any(liste is None for liste in listeler):
+                messagebox.showerror("Hata", "Değerler virgülle ayrılmış tam sayılar olmalı.", parent=pencere)
+                return
+            
+            ayarlar = KesintiAnaliz.tarama_izgarasi(*listeler)
+            self._set_status(f"⏳ {len(ayarlar)} tolerans ayarı karşılaştırılıyor...", 'processing')
+            self._butonlari_ayarla('disabled')
+            btn_baslat.config(state='disabled')
+            btn_sec.config(state='disabled')
+            self.progress['value'] = 0
+            
+            ilerleme = Ilerleme(
+                KesintiAnaliz.TARAMA_ILERLEME_ASAMALARI,
+                callback=self._ilerleme_gonder,
+                iptal_olayi=self.iptal_olayi
+            )
+            
+            def tarama_isi():
+                if self.tarama_engine is None:
+                    self.tarama_engine = KesintiAnaliz(self.veri_deposu)
+                return self.tarama_engine.tolerans_taramasi(dosya, ayarlar, ilerleme)
             
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            messagebox.showerror("Hata", f"Analiz sırasında hata oluştu:\n\n{str(e)}")
-            self._set_status(f"✗ Hata: {str(e)[:50]}...", 'error')
-        
-        finally:
-            self.btn_analiz.config(state='normal')
+            self._arka_planda_calistir(tarama_isi, tarama_bitti)
+        
+        def tarama_bitti(durum, veri):
+            self._butonlari_ayarla('normal')
             self.progress['value'] = 0
+            self.lbl_ilerleme.config(text="")
+            if pencere.winfo_exists():
+                btn_baslat.config(state='normal')
+                btn_sec.config(state='normal')
+            
+            if durum == 'iptal':
+                self._set_status("⏹ Tarama iptal edildi", 'warning')
+                return
+            
+            if durum == 'hata':
+                messagebox.showerror("Hata", f"Tarama sırasında hata oluştu:\n\n{str(veri)}")
+                self._set_status(f"✗ Hata: {str(veri)[:50]}...", 'error')
+                return
+            
+            if not pencere.winfo_exists():
+                return
+            tablo.delete(*tablo.get_children())
+            for _, satir in veri.iterrows():
+                tablo.insert('', tk.END, values=[satir[ad] for ad, _, _ in sutunlar])
+            self._set_status(f"✓ {len(veri)} tolerans ayarı karşılaştırıldı", 'success')
+        
+        def secili_ile_analiz():
+            secim = tablo.selection()
+            if not secim:
+                messagebox.showwarning("Uyarı", "Lütfen tablodan bir ayar seçin.", parent=pencere)
+                return
+            
+            degerler = tablo.item(secim[0], 'values')
+            for entry, deger in zip(
+                (self.entry_kritik_saat, self.entry_tolerans_ustu, self.entry_tolerans_alti), degerler[:3]
+            ):
+                entry.delete(0, tk.END)
+                entry.insert(0, str(deger))
+            pencere.destroy()
+            self._analiz_baslat()
+        
+        btn_baslat = tk.Button(
+            btn_row, text="▶ Taramayı Başlat", command=taramayi_baslat,
+            font=('Segoe UI', 9, 'bold'), bg=self.COLORS['accent_cyan'], fg='white',
+            relief='flat', cursor='hand2', padx=12, pady=4
+        )
+        btn_baslat.pack(side='left', padx=(0, 10))
+        
+        btn_sec = tk.Button(
+            btn_row, text="✓ Seçili Ayarla Analiz Et", command=secili_ile_analiz,
+            font=('Segoe UI', 9, 'bold'), bg=self.COLORS['accent_green'], fg='white',
+            relief='flat', cursor='hand2', padx=12, pady=4
+        )
+        btn_sec.pack(side='left')
+    
+    @staticmethod
+    def _deger_listesi(metin):
+        """
+        Virgülle ayrılmış tam sayıları listeye çevir.
+        
+        Returns:
+            list: Değerler (geçersiz veya boşsa None)
+        """
+        parcalar = [p.strip() for p in metin.split(',') if p.strip()]
+        if not parcalar or not all(p.isdigit() for p in parcalar):
+            return None
+        return list(dict.fromkeys(int(p) for p in parcalar))
     
     def _gruplari_yukle(self):
         """Analiz sonucundan grupları yükle"""
@@ -669,7 +927,9 @@ class BirlesikPanel:
         
         if self.analiz_sonuc_yolu and os.path.exists(self.analiz_sonuc_yolu):
             try:
-                self.dosyalama_engine = Dosyalama(self.cikti_klasoru or os.path.dirname(self.analiz_sonuc_yolu))
+                self.dosyalama_engine = Dosyalama(
+                    self.cikti_klasoru or os.path.dirname(self.analiz_sonuc_yolu), self.veri_deposu
+                )
                 self.dosyalama_engine.analiz_sonucunu_yukle(self.analiz_sonuc_yolu)
                 self.grup_list = self.dosyalama_engine.gruplari_yukle()
                 
@@ -686,7 +946,7 @@ class BirlesikPanel:
             veri_path = os.path.join(self.cikti_klasoru, 'veri.xlsx')
             if os.path.exists(veri_path):
                 try:
-                    self.dosyalama_engine = Dosyalama(self.cikti_klasoru)
+                    self.dosyalama_engine = Dosyalama(self.cikti_klasoru, self.veri_deposu)
                     self.grup_list = self.dosyalama_engine.gruplari_yukle(veri_path)
                     
                     for idx, grup in enumerate(self.grup_list, 1):
@@ -714,49 +974,157 @@ class BirlesikPanel:
             return
         
         if not self.dosyalama_engine:
-            self.dosyalama_engine = Dosyalama(self.cikti_klasoru)
+            self.dosyalama_engine = Dosyalama(self.cikti_klasoru, self.veri_deposu)
         else:
             self.dosyalama_engine.klasor_yolu = self.cikti_klasoru
         
-        basarili, eksik = self.dosyalama_engine.dosyalari_yukle()
-        if not basarili:
-            messagebox.showerror("Hata", f"Eksik dosyalar:\n" + "\n".join(eksik))
-            return
-        
         self._set_status("⏳ Raporlar oluşturuluyor...", 'processing')
-        self.btn_raporla.config(state='disabled')
+        self._butonlari_ayarla('disabled')
         self.progress['value'] = 0
-        self.root.update()
         
-        try:
+        engine = self.dosyalama_engine
+        ilerleme = Ilerleme(
+            [('yukleme', 10), ('gruplar', 90)],
+            callback=self._ilerleme_gonder,
+            iptal_olayi=self.iptal_olayi
+        )
+        
+        def rapor_isi():
+            ilerleme.guncelle('yukleme', 0.0, zorla=True)
+            basarili, eksik = engine.dosyalari_yukle()
+            if not basarili:
+                return False, eksik
+            
             def progress_callback(idx, total, grup):
-                progress_pct = int((idx / total) * 100)
-                self.progress['value'] = progress_pct
-                self._set_status(f"⏳ Grup {idx}/{total}: {grup[:30]}...", 'processing')
-                self.root.update()
+                ilerleme.guncelle('gruplar', idx / total, zorla=True,
+                                  detay=f"Grup {idx}/{total}: {grup[:30]}")
             
-            islenen = self.dosyalama_engine.tum_gruplari_isle(progress_callback)
+            islenen = engine.tum_gruplari_isle(progress_callback, iptal_olayi=self.iptal_olayi)
+            return True, islenen
+        
+        def rapor_bitti(durum, veri):
+            self._butonlari_ayarla('normal')
+            self.progress['value'] = 0
+            self.lbl_ilerleme.config(text="")
+            
+            if durum == 'iptal':
+                self._set_status("⏹ Raporlama iptal edildi", 'warning')
+                return
+            
+            if durum == 'hata':
+                messagebox.showerror("Hata", f"Raporlama sırasında hata:\n\n{str(veri)}")
+                self._set_status(f"✗ Hata: {str(veri)[:50]}...", 'error')
+                return
+            
+            basarili, sonuc = veri
+            if not basarili:
+                messagebox.showerror("Hata", f"Eksik dosyalar:\n" + "\n".join(sonuc))
+                self._set_status("✗ Eksik dosyalar", 'error')
+                return
+            
+            self._set_status(f"✓ {sonuc} grup başarıyla raporlandı!", 'success')
             
-            self.progress['value'] = 100
-            self._set_status(f"✓ {islenen} grup başarıyla raporlandı!", 'success')
+            rapor_ozeti = engine.son_rapor_ozeti
+            eski_metin = ""
+            if rapor_ozeti.get('eski_klasorler'):
+                eski_metin = f"🗂 Artık listede olmayan klasör: {len(rapor_ozeti['eski_klasorler'])}\n"
             
             output_path = os.path.join(self.cikti_klasoru, VARSAYILAN['OUTPUT_FOLDER'])
             messagebox.showinfo(
                 "Tamamlandı",
                 f"✅ Raporlama tamamlandı!\n\n"
-                f"📊 İşlenen grup: {islenen}\n"
+                f"📊 İşlenen grup: {sonuc}\n"
+                f"⏭️ Değişmediği için atlanan: {rapor_ozeti.get('atlanan', 0)}\n"
+                f"{eski_metin}"
                 f"📁 Çıktı klasörü: {output_path}"
             )
+        
+        profil_yolu = os.path.join(self.cikti_klasoru, 'rapor_' + PROFIL_AYARLARI['RAPOR_ADI'])
+        self._arka_planda_calistir(rapor_isi, rapor_bitti, profil_yolu)
+    
+    # ═══════════════════════════════════════════════════════════════
+    # ARKA PLAN İŞLERİ
+    # ═══════════════════════════════════════════════════════════════
+    
+    def _arka_planda_calistir(self, is_fonksiyonu, bitince, profil_yolu=None):
+        """
+        İşi arka plan iş parçacığında çalıştır; sonuç ve ilerleme kuyruk
+        üzerinden root.after ile ana iş parçacığında işlenir.
+        
+        Args:
+            is_fonksiyonu: Arka planda çalışacak fonksiyon
+            bitince: Ana iş parçacığında çağrılacak fonksiyon (durum, veri);
+                     durum 'bitti', 'iptal' veya 'hata'
+            profil_yolu: Profil açıksa aşama raporunun yazılacağı dosya
+        """
+        self.iptal_olayi.clear()
+        self.btn_iptal.config(state='normal')
+        self._is_bitince = bitince
+        
+        profil_acik = bool(profil_yolu) and self.var_profil.get()
+        if profil_acik:
+            profil.baslat()
+        
+        def calistir():
+            try:
+                sonuc = ('bitti', is_fonksiyonu())
+            except IslemIptalEdildi:
+                sonuc = ('iptal', None)
+            except Exception as e:
+                traceback.print_exc()
+                sonuc = ('hata', e)
             
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            messagebox.showerror("Hata", f"Raporlama sırasında hata:\n\n{str(e)}")
-            self._set_status(f"✗ Hata: {str(e)[:50]}...", 'error')
-        
-        finally:
-            self.btn_raporla.config(state='normal')
-            self.progress['value'] = 0
+            if profil_acik:
+                profil.durdur()
+                try:
+                    profil.rapor_yaz(profil_yolu)
+                except OSError as e:
+                    print(f"✗ Profil raporu yazılamadı: {e}")
+            
+            self.is_kuyrugu.put(sonuc)
+        
+        threading.Thread(target=calistir, daemon=True).start()
+        self.root.after(100, self._kuyrugu_kontrol)
+    
+    def _ilerleme_gonder(self, yuzde, asama, kalan, detay=''):
+        """Arka plandaki işten gelen ilerlemeyi kuyruğa koy"""
+        self.is_kuyrugu.put(('ilerleme', (yuzde, asama, kalan, detay)))
+    
+    def _kuyrugu_kontrol(self):
+        """Kuyruktaki ilerleme/sonuç mesajlarını işle"""
+        try:
+            while True:
+                tur, veri = self.is_kuyrugu.get_nowait()
+                
+                if tur == 'ilerleme':
+                    yuzde, asama, kalan, detay = veri
+                    self.progress['value'] = yuzde
+                    metin = detay or self.ASAMA_METINLERI.get(asama, asama)
+                    self.lbl_status.config(text=f"⏳ {metin}...", fg=self.COLORS['accent_cyan'])
+                    self.lbl_ilerleme.config(
+                        text=f"%{yuzde:.0f} • Kalan: {Ilerleme.sure_metni(kalan)}"
+                    )
+                    continue
+                
+                self.btn_iptal.config(state='disabled')
+                bitince, self._is_bitince = self._is_bitince, None
+                bitince(tur, veri)
+                return
+        except queue.Empty:
+            pass
+        
+        self.root.after(100, self._kuyrugu_kontrol)
+    
+    def _iptal_et(self):
+        """Çalışan işi bir sonraki zincir/grup sınırında durdur"""
+        self.iptal_olayi.set()
+        self.btn_iptal.config(state='disabled')
+        self._set_status("⏹ İptal ediliyor...", 'warning')
+    
+    def _butonlari_ayarla(self, state):
+        """İş sürerken işlem butonlarını kapat/aç"""
+        for btn in (self.btn_analiz, self.btn_tarama, self.btn_gruplar, self.btn_raporla):
+            btn.config(state=state)
 
 
 def main():
@@ -1,6 +1,14 @@
 # Kesinti Analiz Modülleri
 from .cm_islemleri import CMIslemleri
-from .excel_yardimci import ExcelYardimci
+from .excel_yardimci import ExcelYardimci, IdIndeksi
 from .kesinti_analiz import KesintiAnaliz
 from .dosyalama import Dosyalama
+from .onbellek import Onbellek
+from .okuyucu import TabloOkuyucu
+from .veri_deposu import VeriDeposu
+from .png_tablo import PngTablo
+from .rapor_manifest import RaporManifest
+from .analiz_durumu import AnalizDurumu
+from .ilerleme import Ilerleme, IslemIptalEdildi
 
+from .profil import Profilci, profil
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+"""
+Analiz Durumu Modülü
+Artımlı analiz için şebeke unsuru ve TM birimlerinin girdi özetlerini,
+sonuç satırlarını ve toplu CM kayıtlarını kesinti dosyasının yanında saklar.
+Girdisi değişmeyen birimlerin zincirleri yeniden hesaplanmaz.
+
+Durum klasörde JSON özet ve Parquet tablolar olarak tutulur; pickle
+kullanılmaz (paylaşılan klasöre dosya bırakabilen biri okuma sırasında
+kod çalıştıramaz).
+"""
+
+import pandas as pd
+import numpy as np
+import hashlib
+import json
+import os
+import sys
+
+# Config'i import et
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ARTIMLI_ANALIZ_AYARLARI, DAGITIM_AG_AYARLARI, KESINTI_SUTUNLARI
+from modules.onbellek import Onbellek
+
+
+class AnalizDurumu:
+    """
+    Birim türü ('unsur', 'tm') başına kalıcı analiz durumu.
+
+    Her tür için dört tablo tutulur:
+        birimler: birim anahtarı indeksli 'ozet' (girdi özeti) ve 'sayi'
+                  (birimin kapladığı sonuç sırası sayısı)
+        sonuc: sonuç satırları; 'birim' ve birim içi 'yerel' sıra ile
+        ortak_w: toplu Ortak W kayıtları ('birim', 'yerel', 'kesinti')
+        ticket: toplu OMS ticket kayıtları ('birim', 'yerel', 'yon', 'kesinti',
+                'baslama', 'bitis')
+    Sonuç ve CM kayıtları birim içi sırayla saklandığından birimler yeni
+    veride başka konuma kaysa da tekrar kullanılabilir.
+
+    Klasörde 'durum.json' sürüm, ayar özeti, CM imzası ve birimler
+    tablosunu; '<tür>_<tablo>.<nesil>.parquet' dosyaları diğer tabloları
+    tutar. Her kayıt yeni bir nesil yazıp JSON'u en son değiştirir; yarım
+    kalan kayıt önceki durumu bozmaz.
+    """
+
+    SURUM = 2  # Sonuç sütunları, özet içeriği veya kayıt biçimi değişirse artırılır (tüm birimler yeniden hesaplanır)
+
+    TURLER = ('unsur', 'tm')
+    TABLOLAR = ('sonuc', 'ortak_w', 'ticket')  # Parquet olarak saklananlar
+    OZET_DOSYASI = 'durum.json'
+
+    ORTAK_W_SUTUNLARI = ['birim', 'yerel', 'kesinti']
+    TICKET_SUTUNLARI = ['birim', 'yerel', 'yon', 'kesinti', 'baslama', 'bitis']
+
+    def __init__(self, klasor, klasor_adi=None):
+        """
+        Durumu başlat (okumak için yukle çağrılır).
+
+        Args:
+            klasor: Kesinti dosyasının klasörü
+            klasor_adi: Durum klasörünün adı (None ise config'den)
+        """
+        self.klasor = os.path.join(
+            klasor, klasor_adi or ARTIMLI_ANALIZ_AYARLARI.get('KLASOR_ADI', '.analiz_durumu')
+        )
+        self.ayar_ozeti = None
+        self.cm_imzasi = None
+        self.turler = {tur: self.bos_tur() for tur in self.TURLER}
+
+    @classmethod
+    def bos_tur(cls):
+        """Bir birim türü için boş tablolar"""
+        return {
+            'birimler': pd.DataFrame({'ozet': pd.Series(dtype=np.uint64), 'sayi': pd.Series(dtype=np.int64)}),
+            'sonuc': None,
+            'ortak_w': pd.DataFrame(columns=cls.ORTAK_W_SUTUNLARI),
+            'ticket': pd.DataFrame(columns=cls.TICKET_SUTUNLARI)
+        }
+
+    def yukle(self, ayar_ozeti):
+        """
+        Mevcut durumu oku (yoksa, bozuksa, sürümü veya ayarları farklıysa boş başla).
+
+        Args:
+            ayar_ozeti: Güncel analiz ayarlarının özeti (bkz. ayar_ozeti_hesapla)
+        """
+        if not Onbellek.PARQUET_VAR:
+            return
+        try:
+            with open(os.path.join(self.klasor, self.OZET_DOSYASI), encoding='utf-8') as f:
+                veri = json.load(f)
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"✗ Analiz durumu okunamadı, tüm zincirler yeniden hesaplanacak: {e}")
+            return
+
+        if not isinstance(veri, dict) or veri.get('surum') != self.SURUM or veri.get('ayar_ozeti') != ayar_ozeti:
+            return
+        try:
+            turler = {tur: self._tur_oku(tur, veri['turler'][tur], veri['nesil']) for tur in self.TURLER}
+        except Exception as e:
+            print(f"✗ Analiz durumu okunamadı, tüm zincirler yeniden hesaplanacak: {e}")
+            return
+        self.ayar_ozeti = ayar_ozeti
+        self.cm_imzasi = None if veri.get('cm_imzasi') is None else tuple(veri['cm_imzasi'])
+        self.turler = turler
+
+    def _tur_oku(self, tur, kayit, nesil):
+        """Bir birim türünün tablolarını JSON kaydı ve Parquet dosyalarından oluştur"""
+        tablolar = self.bos_tur()
+        tablolar['birimler'] = pd.DataFrame(
+            {'ozet': np.array(kayit['ozet'], dtype=np.uint64), 'sayi': np.array(kayit['sayi'], dtype=np.int64)},
+            index=pd.Index(kayit['birim'], dtype=object)
+        )
+        for tablo in self.TABLOLAR:
+            if kayit['tablolar'][tablo]:
+                tablolar[tablo] = Onbellek.parquet_oku(self._tablo_yolu(tur, tablo, nesil))
+        return tablolar
+
+    def kaydet(self):
+        """Durumu yeni bir nesil olarak yaz; JSON özeti en son değiştirilir"""
+        if not Onbellek.PARQUET_VAR:
+            return
+        nesil = os.urandom(4).hex()
+        try:
+            os.makedirs(self.klasor, exist_ok=True)
+            veri = {
+                'surum': self.SURUM,
+                'ayar_ozeti': self.ayar_ozeti,
+                'cm_imzasi': None if self.cm_imzasi is None else list(self.cm_imzasi),
+                'nesil': nesil,
+                'turler': {tur: self._tur_yaz(tur, nesil) for tur in self.TURLER}
+            }
+            yol = os.path.join(self.klasor, self.OZET_DOSYASI)
+            with open(f"{yol}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(veri, f, ensure_ascii=False)
+            os.replace(f"{yol}.tmp", yol)
+        except Exception as e:
+            print(f"✗ Analiz durumu yazılamadı: {e}")
+            self._nesilleri_sil(lambda ad: ad.endswith(f".{nesil}.parquet"))
+            return
+        self._nesilleri_sil(lambda ad: not ad.endswith(f".{nesil}.parquet"))
+
+    def _tur_yaz(self, tur, nesil):
+        """Bir birim türünün tablolarını Parquet'e yaz, birimler tablosunu JSON kaydı olarak döndür"""
+        tablolar = self.turler[tur]
+        birimler = tablolar['birimler']
+        kayit = {
+            'birim': birimler.index.tolist(),
+            'ozet': birimler['ozet'].tolist(),
+            'sayi': birimler['sayi'].tolist(),
+            'tablolar': {}
+        }
+        for tablo in self.TABLOLAR:
+            df = tablolar[tablo]
+            kayit['tablolar'][tablo] = df is not None
+            if df is not None and not Onbellek.parquet_yaz(df, self._tablo_yolu(tur, tablo, nesil)):
+                raise ValueError(f"'{tur}' {tablo} tablosu Parquet olarak yazılamadı")
+        return kayit
+
+    def _tablo_yolu(self, tur, tablo, nesil):
+        """Bir neslin tablo dosyasının yolu"""
+        return os.path.join(self.klasor, f"{tur}_{tablo}.{nesil}.parquet")
+
+    def _nesilleri_sil(self, silinsin_mi):
+        """Klasördeki tablo dosyalarından koşula uyanları sessizce sil"""
+        try:
+            adlar = os.listdir(self.klasor)
+        except OSError:
+            return
+        for ad in adlar:
+            if ad.endswith('.parquet') and silinsin_mi(ad):
+                try:
+                    os.remove(os.path.join(self.klasor, ad))
+                except OSError:
+                    pass
+
+    @staticmethod
+    def ayar_ozeti_hesapla(tolerans_ayarlari):
+        """Zincirleri etkileyen ayarların özeti (tolerans, Dağıtım-AG, kesinti sütunları)"""
+        ayarlar = [
+            sorted(ayar.items()) for ayar in (tolerans_ayarlari, DAGITIM_AG_AYARLARI, KESINTI_SUTUNLARI)
+        ]
+        return hashlib.blake2b(repr(ayarlar).encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def grup_ozetleri(df, anahtarlar):
+        """
+        Satırları anahtara göre gruplayıp grup başına sıraya duyarlı özet üret.
+
+        Satır özetleri grup içi sırayla birlikte yeniden özetlenip toplanır;
+        grubun satırları, değerleri veya kendi içindeki sırası değişirse
+        özet de değişir (diğer grupların satırlarının araya girmesi değiştirmez).
+
+        Args:
+            df: Özete girecek sütunlar
+            anahtarlar: Satırların grup anahtarları (Series)
+
+        Returns:
+            Series: Anahtar -> özet (uint64), ilk görülme sırasıyla
+        """
+        kodlar, degerler = pd.factorize(anahtarlar)
+        if len(kodlar) == 0:
+            return pd.Series(dtype=np.uint64)
+
+        satir = pd.util.hash_pandas_object(df, index=False).to_numpy()
+        grup_ici_sira = pd.Series(kodlar).groupby(kodlar).cumcount().to_numpy()
+        ozet = pd.util.hash_pandas_object(
+            pd.DataFrame({'satir': satir, 'sira': grup_ici_sira}), index=False
+        ).to_numpy()
+
+        # uint64 toplamı taşmada sarar; grup sırasından bağımsızdır
+        sira = np.argsort(kodlar, kind='stable')
+        baslar = np.flatnonzero(np.r_[True, np.diff(kodlar[sira]) != 0])
+        toplam = np.add.reduceat(ozet[sira], baslar)
+        return pd.Series(toplam, index=pd.Index(np.asarray(degerler)[kodlar[sira][baslar]], dtype=object))
+
+    def degisen_birimler(self, tur, ozetler):
+        """
+        Özeti kayıtlı olmayan veya değişen birimler.
+
+        Args:
+            tur: Birim türü
+            ozetler: Güncel birim özetleri (Series)
+
+        Returns:
+            ndarray: Yeniden hesaplanacak birimlerin maskesi (ozetler sırasıyla)
+        """
+        kayitli = self.turler[tur]['birimler']['ozet']
+        konum = kayitli.index.get_indexer(ozetler.index)
+        ayni = konum >= 0
+        ayni[ayni] = kayitli.to_numpy()[konum[ayni]] == ozetler.to_numpy()[ayni]
+        return ~ayni
@@ -5,26 +5,43 @@ CM.xlsx dosyası ile ilgili tüm işlemler burada yapılır.
 """
 
 import pandas as pd
+import numpy as np
 import os
 import sys
+from datetime import datetime
 
 # Config'i import et
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import CM_SUTUN_INDEKSLERI, EXCEL_AYARLARI
+from config import CM_SUTUN_INDEKSLERI
+from modules.profil import profil
+from modules.veri_deposu import VeriDeposu
+
+# pandas'ın varsayılan NA metinleri; CM keep_default_na=False ile okunduğu için
+# bu hücreler Hizmet No / Ticket ID / tarih sütunlarında eksik sayılır
+NA_METINLERI = frozenset([
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'
+])
 
 
 class CMIslemleri:
     """CM.xlsx dosyası işlemleri için sınıf"""
     
-    def __init__(self, cm_dosya_yolu=None):
+    def __init__(self, cm_dosya_yolu=None, veri_deposu=None):
         """
         CM işlemleri sınıfını başlat.
         
         Args:
             cm_dosya_yolu: CM.xlsx dosyasının tam yolu
+            veri_deposu: Opsiyonel paylaşılan VeriDeposu (raporlama ile aynı CM verisi)
         """
         self.cm_dosya_yolu = cm_dosya_yolu
+        self.veri_deposu = veri_deposu or VeriDeposu()
         self.df_cm = None
+        self.kesinti_index = {}  # Normalize Kesinti ID -> satır pozisyonları
+        self.olusturma_tarihleri = None  # Oluşturma Tarihi (datetime64, satır bazlı)
+        self._ortak_w_tablosu = None  # Toplu Ortak W için hazırlanmış C/W sütunları
+        self._ticket_tablosu = None  # Toplu ticket sınıflandırması için hazırlanmış sütunlar
         
         if cm_dosya_yolu and os.path.exists(cm_dosya_yolu):
             self.yukle(cm_dosya_yolu)
@@ -41,14 +58,74 @@ class CMIslemleri:
         """
         try:
             self.cm_dosya_yolu = cm_dosya_yolu
-            self.df_cm = pd.read_excel(cm_dosya_yolu, header=EXCEL_AYARLARI['CM_HEADER_ROW'])
-            print(f"✓ CM.xlsx yüklendi: {len(self.df_cm)} satır")
+            self._ortak_w_tablosu = None
+            self._ticket_tablosu = None
+            with profil.asama('cm.yukleme') as a:
+                self.df_cm = self.veri_deposu.cm_al(cm_dosya_yolu)
+                self.kesinti_index = self.veri_deposu.cm_kesinti_index(cm_dosya_yolu)
+                self.olusturma_tarihleri = self._olusturma_tarihlerini_ayristir()
+                a.adet = len(self.df_cm)
+            print(f"✓ CM.xlsx yüklendi: {len(self.df_cm)} satır, {len(self.kesinti_index)} farklı Kesinti ID")
             return True
         except Exception as e:
             print(f"✗ CM.xlsx yüklenemedi: {e}")
             self.df_cm = None
+            self.kesinti_index = {}
+            self.olusturma_tarihleri = None
             return False
     
+    def _sutun_al(self, col_index):
+        """Sütunu pozisyonla al; varsayılan NA metinlerini NaN yap"""
+        seri = self.df_cm.iloc[:, col_index]
+        if seri.dtype == object:
+            seri = seri.mask(seri.isin(list(NA_METINLERI)))
+        return seri
+    
+    def _olusturma_tarihlerini_ayristir(self):
+        """
+        Oluşturma Tarihi sütununu bir kez datetime64'e çevir.
+        
+        Değerler eski satır bazlı pd.to_datetime(str(değer).strip()) ile aynı
+        sonucu verir: tarih nesneleri doğrudan çevrilir, metinler ise her farklı
+        metin için yalnızca bir kez ayrıştırılır. Ayrıştırılamayanlar ve kesinti
+        zamanlarıyla karşılaştırılamayan saat dilimli değerler NaT olur.
+        
+        Returns:
+            Series: CM satırlarıyla hizalı datetime64 değerleri
+        """
+        col_index = CM_SUTUN_INDEKSLERI['OLUSTURMA_TARIHI']
+        if col_index >= len(self.df_cm.columns):
+            return pd.Series(pd.NaT, index=self.df_cm.index, dtype='datetime64[ns]')
+        
+        seri = self._sutun_al(col_index)
+        if pd.api.types.is_datetime64_dtype(seri):
+            return seri.astype('datetime64[ns]')
+        
+        degerler = seri.to_numpy(dtype=object)
+        tarihler = np.full(len(degerler), np.datetime64('NaT'), dtype='datetime64[ns]')
+        tarih_mi = np.fromiter(
+            (isinstance(d, datetime) and d.tzinfo is None for d in degerler),
+            dtype=bool, count=len(degerler)
+        )
+        if tarih_mi.any():
+            tarihler[tarih_mi] = pd.to_datetime(degerler[tarih_mi]).to_numpy(dtype='datetime64[ns]')
+        
+        metin_mi = ~tarih_mi
+        if metin_mi.any():
+            metinler = pd.Series(degerler[metin_mi]).map(str).str.strip()
+            kodlar, benzersiz = pd.factorize(metinler)
+            ayristirilan = np.full(len(benzersiz), np.datetime64('NaT'), dtype='datetime64[ns]')
+            for i, metin in enumerate(benzersiz):
+                try:
+                    tarih = pd.to_datetime(metin, errors='coerce')
+                except Exception:
+                    continue
+                if not pd.isna(tarih) and tarih.tzinfo is None:
+                    ayristirilan[i] = tarih.to_datetime64()
+            tarihler[metin_mi] = ayristirilan[kodlar]
+        
+        return pd.Series(tarihler, index=self.df_cm.index)
+    
     def yuklu_mu(self):
         """CM dosyası yüklü mü kontrol et"""
         return self.df_cm is not None
@@ -68,13 +145,15 @@ class CMIslemleri:
         
         try:
             kesinti_id_str = str(kesinti_id).strip()
-            col_index = CM_SUTUN_INDEKSLERI['KESINTI_ID']
-            mask = self.df_cm.iloc[:, col_index].astype(str).str.strip() == kesinti_id_str
-            return self.df_cm[mask]
+            pozisyonlar = self.kesinti_index.get(kesinti_id_str)
+            if pozisyonlar is None:
+                return self.df_cm.iloc[0:0]
+            return self.df_cm.iloc[pozisyonlar]
         except Exception as e:
             print(f"Arama hatası: {e}")
             return pd.DataFrame()
     
+    @profil.olc('cm.ortak_w')
     def ortak_w_degerlerini_bul(self, kesinti_id_listesi, elemanlar=None):
         """
         Birden fazla kesinti için ortak müşterilerin (C sütunu) 
@@ -93,64 +172,202 @@ class CMIslemleri:
         if len(kesinti_id_listesi) <= 1:
             return ""
         
-        # Her kesinti ID için C-W eşleşmelerini sakla
-        id_c_w_map = {}
+        return self.ortak_w_toplu_bul([(0, kesinti_id) for kesinti_id in kesinti_id_listesi]).get(0, "")
+    
+    def _hucre_metinleri(self, col_index):
+        """
+        Bir sütunun hücrelerini iterrows() + str().strip() ile aynı metinlere çevir.
         
-        hizmet_no_idx = CM_SUTUN_INDEKSLERI['HIZMET_NO']
-        ticket_id_idx = CM_SUTUN_INDEKSLERI['OMS_TICKET_ID']
+        iterrows satırları ortak dtype'a çevirdiği için (ör. tüm sütunlar sayısalsa
+        int -> float) önce aynı dönüşüm uygulanır.
         
-        for kesinti_id in kesinti_id_listesi:
-            data = self.kesinti_ara(kesinti_id)
-            
-            if len(data) == 0:
-                continue
-            
-            c_w_dict = {}
-            for _, row in data.iterrows():
-                c_val = str(row.iloc[hizmet_no_idx]).strip() if len(row) > hizmet_no_idx else ""
-                w_val = str(row.iloc[ticket_id_idx]).strip() if len(row) > ticket_id_idx else ""
-                
-                if c_val and c_val != '' and c_val.lower() != 'nan':
-                    if c_val not in c_w_dict:
-                        c_w_dict[c_val] = []
-                    if w_val and w_val != '' and w_val.lower() != 'nan':
-                        c_w_dict[c_val].append((kesinti_id, w_val))
+        Args:
+            col_index: Sütun indeksi
             
-            id_c_w_map[kesinti_id] = c_w_dict
+        Returns:
+            Series: Metin değerleri (sütun yoksa boş metinler)
+        """
+        if col_index >= len(self.df_cm.columns):
+            return pd.Series('', index=self.df_cm.index, dtype=object)
         
-        if len(id_c_w_map) <= 1:
-            return ""
+        seri = self._sutun_al(col_index)
+        ortak_tip = self.df_cm.iloc[:0].to_numpy().dtype
+        if ortak_tip != object:
+            seri = seri.astype(ortak_tip)
+        return seri.astype(object).map(str).str.strip()
+    
+    def _ortak_w_tablosu_hazirla(self):
+        """Geçerli Hizmet No'lu CM satırlarını (anahtar, C, W) olarak bir kez hazırla"""
+        if self._ortak_w_tablosu is not None:
+            return self._ortak_w_tablosu
         
-        # Ortak C değerlerini bul
-        first_id = list(id_c_w_map.keys())[0]
-        common_c_values = set(id_c_w_map[first_id].keys())
+        col_index = CM_SUTUN_INDEKSLERI['KESINTI_ID']
+        if col_index >= len(self.df_cm.columns):
+            anahtarlar = pd.Series('', index=self.df_cm.index, dtype=object)
+        else:
+            anahtarlar = self.df_cm.iloc[:, col_index].astype(str).str.strip()
         
-        for kesinti_id in list(id_c_w_map.keys())[1:]:
-            common_c_values = common_c_values.intersection(set(id_c_w_map[kesinti_id].keys()))
+        c = self._hucre_metinleri(CM_SUTUN_INDEKSLERI['HIZMET_NO'])
+        w = self._hucre_metinleri(CM_SUTUN_INDEKSLERI['OMS_TICKET_ID'])
+        tablo = pd.DataFrame({
+            'anahtar': anahtarlar.to_numpy(),
+            'c': c.to_numpy(),
+            'w': w.to_numpy(),
+            'cm_sira': range(len(self.df_cm))
+        })
+        tablo['w_gecerli'] = (tablo['w'] != '') & (tablo['w'].str.lower() != 'nan')
+        c_gecerli = (tablo['c'] != '') & (tablo['c'].str.lower() != 'nan')
         
-        if len(common_c_values) == 0:
-            return ""
+        self._ortak_w_tablosu = tablo[c_gecerli].reset_index(drop=True)
+        return self._ortak_w_tablosu
+    
+    @profil.olc('cm.ortak_w_toplu')
+    def ortak_w_toplu_bul(self, zincir_kesintileri):
+        """
+        Tüm zincirlerin ortak W değerlerini tek seferde hesapla.
+        
+        Her zincir için ortak_w_degerlerini_bul ile aynı metni üretir; ancak
+        kesinti başına arama yerine tüm (zincir, kesinti) çiftleri CM ile tek
+        bir birleştirmede eşleştirilir ve Hizmet No başına zincirdeki farklı
+        kesinti sayısı sayılır.
         
-        # Her ortak C (Hizmet No) için formatla
-        result_parts = []
-        for c_val in sorted(common_c_values):
-            kesinti_ticket_pairs = []
-            seen_pairs = set()
+        Args:
+            zincir_kesintileri: (zincir_id, kesinti_id) çiftleri; her zincirin
+                                kesintileri zincirdeki sırasıyla verilir
             
-            for kesinti_id in id_c_w_map:
-                if c_val in id_c_w_map[kesinti_id]:
-                    for kesinti_no, ticket_id in id_c_w_map[kesinti_id][c_val]:
-                        pair = (kesinti_no, ticket_id)
-                        if pair not in seen_pairs:
-                            kesinti_ticket_pairs.append(f"{kesinti_no} [{ticket_id}]")
-                            seen_pairs.add(pair)
+        Returns:
+            dict: zincir_id -> formatlanmış ortak W değerleri ("" olabilir)
+        """
+        if not zincir_kesintileri:
+            return {}
+        
+        ciftler = pd.DataFrame(zincir_kesintileri, columns=['zincir', 'kesinti'])
+        sonuc = dict.fromkeys(ciftler['zincir'].tolist(), "")
+        if not self.yuklu_mu():
+            return sonuc
+        
+        # Zincir içinde tekrarlanan kesintiler bir kez sayılır
+        ciftler = ciftler.drop_duplicates(['zincir', 'kesinti']).reset_index(drop=True)
+        ciftler['sira'] = ciftler.groupby('zincir', sort=False).cumcount()
+        ciftler['anahtar'] = [str(k).strip() for k in ciftler['kesinti'].tolist()]
+        
+        # Tek kesintili zincirler ve CM'de kaydı olmayan kesintiler elenir
+        ciftler = ciftler[ciftler.groupby('zincir', sort=False)['sira'].transform('size') > 1]
+        ciftler = ciftler[ciftler['anahtar'].map(self.kesinti_index.__contains__).astype(bool)]
+        veri_sayisi = ciftler.groupby('zincir', sort=False)['sira'].transform('size')
+        ciftler = ciftler[veri_sayisi > 1].assign(veri_sayisi=veri_sayisi[veri_sayisi > 1])
+        if ciftler.empty:
+            return sonuc
+        
+        eslesme = ciftler.merge(self._ortak_w_tablosu_hazirla(), on='anahtar', how='inner')
+        if eslesme.empty:
+            return sonuc
+        
+        # Hizmet No, verisi olan tüm kesintilerde geçiyorsa ortaktır
+        kesinti_sayisi = eslesme.groupby(['zincir', 'c'], sort=False)['sira'].transform('nunique')
+        eslesme = eslesme[(kesinti_sayisi == eslesme['veri_sayisi']) & eslesme['w_gecerli']]
+        if eslesme.empty:
+            return sonuc
+        
+        eslesme = eslesme.sort_values(['zincir', 'sira', 'cm_sira'], kind='stable')
+        eslesme = eslesme.drop_duplicates(['zincir', 'c', 'sira', 'w'])
+        eslesme['parca'] = eslesme['kesinti'].astype(str) + ' [' + eslesme['w'] + ']'
+        parcalar = eslesme.groupby(['zincir', 'c'], sort=False)['parca'].agg(', '.join)
+        
+        zincir_parcalari = {}
+        for (zincir_id, c_val), metin in parcalar.items():
+            zincir_parcalari.setdefault(zincir_id, []).append((c_val, f"{c_val} → {metin}"))
+        for zincir_id, liste in zincir_parcalari.items():
+            sonuc[zincir_id] = '\n'.join(metin for _, metin in sorted(liste))
+        
+        return sonuc
+    
+    def _ticket_tablosu_hazirla(self):
+        """Geçerli ticket ID'li CM satırlarını (anahtar, ticket, tarih) olarak bir kez hazırla"""
+        if self._ticket_tablosu is not None:
+            return self._ticket_tablosu
+        
+        col_index = CM_SUTUN_INDEKSLERI['KESINTI_ID']
+        if col_index >= len(self.df_cm.columns):
+            anahtarlar = pd.Series('', index=self.df_cm.index, dtype=object)
+        else:
+            anahtarlar = self.df_cm.iloc[:, col_index].astype(str).str.strip()
+        
+        ticket = self._hucre_metinleri(CM_SUTUN_INDEKSLERI['OMS_TICKET_ID'])
+        tablo = pd.DataFrame({
+            'anahtar': anahtarlar.to_numpy(),
+            'ticket': ticket.to_numpy(),
+            'tarih': self.olusturma_tarihleri.to_numpy()
+        })
+        gecerli = (tablo['ticket'] != '') & (tablo['ticket'].str.lower() != 'nan') & tablo['tarih'].notna()
+        
+        self._ticket_tablosu = tablo[gecerli].reset_index(drop=True)
+        return self._ticket_tablosu
+    
+    @profil.olc('cm.cagri_ticket_toplu')
+    def cagri_ticket_toplu_bul(self, zincir_kesintileri):
+        """
+        Tüm zincirlerin öncesi/sonrası çağrı ticket ID'lerini tek seferde bul.
+        
+        Her zincir için cagri_ticket_idlerini_bul ile aynı metni üretir. Ticket'lar
+        (kesinti, başlama, bitiş) vektörü ile tek birleştirmede eşleştirilir;
+        öncesi için oluşturma < başlama, sonrası için oluşturma > bitiş aranır.
+        
+        Args:
+            zincir_kesintileri: (zincir_id, 'oncesi'/'sonrasi', kesinti_id, baslama, bitis)
+                                kayıtları; kesintiler metinde bu sırayla yer alır
             
-            if kesinti_ticket_pairs:
-                formatted = f"{c_val} → {', '.join(kesinti_ticket_pairs)}"
-                result_parts.append(formatted)
+        Returns:
+            dict: zincir_id -> "Öncesi: ... | Sonrası: ..." metni ("" olabilir)
+        """
+        if not zincir_kesintileri:
+            return {}
+        
+        istekler = pd.DataFrame(zincir_kesintileri, columns=['zincir', 'yon', 'kesinti', 'baslama', 'bitis'])
+        sonuc = dict.fromkeys(istekler['zincir'].tolist(), "")
+        if not self.yuklu_mu():
+            return sonuc
+        
+        istekler['sira'] = np.arange(len(istekler))
+        istekler['anahtar'] = [str(k).strip() for k in istekler['kesinti'].tolist()]
+        istekler['baslama'] = pd.to_datetime(istekler['baslama'])
+        istekler['bitis'] = pd.to_datetime(istekler['bitis'])
         
-        return '\n'.join(result_parts)
+        eslesme = istekler.merge(self._ticket_tablosu_hazirla(), on='anahtar', how='inner')
+        oncesi_mi = (eslesme['yon'] == 'oncesi').to_numpy()
+        uygun = np.where(
+            oncesi_mi,
+            (eslesme['tarih'] < eslesme['baslama']).to_numpy(),
+            (eslesme['tarih'] > eslesme['bitis']).to_numpy()
+        )
+        eslesme = eslesme[uygun]
+        if eslesme.empty:
+            return sonuc
+        
+        # Kesinti başına sıralı ve tekil ticket listesi
+        eslesme = eslesme.drop_duplicates(['sira', 'ticket']).sort_values(['sira', 'ticket'])
+        ticketler = eslesme.groupby('sira')['ticket'].agg(', '.join)
+        
+        parcalar = {}
+        satirlar = istekler.iloc[ticketler.index]
+        for (zincir_id, yon, kesinti_id), tickets_str in zip(
+                satirlar[['zincir', 'yon', 'kesinti']].itertuples(index=False, name=None), ticketler):
+            parcalar.setdefault(zincir_id, {'oncesi': [], 'sonrasi': []})[yon].append(
+                f"{kesinti_id} ({tickets_str})"
+            )
+        
+        # Format: Öncesi: ... | Sonrası: ...
+        for zincir_id, yonler in parcalar.items():
+            result_parts = []
+            if yonler['oncesi']:
+                result_parts.append(f"Öncesi: {'; '.join(yonler['oncesi'])}")
+            if yonler['sonrasi']:
+                result_parts.append(f"Sonrası: {'; '.join(yonler['sonrasi'])}")
+            sonuc[zincir_id] = ' | '.join(result_parts)
+        
+        return sonuc
     
+    @profil.olc('cm.cagri_ticket')
     def cagri_ticket_idlerini_bul(self, oncesi_kesintiler, sonrasi_kesintiler, 
                                    kesinti_zamanlar_dict):
         """
@@ -167,88 +384,30 @@ class CMIslemleri:
         if not self.yuklu_mu():
             return ""
         
-        ticket_id_idx = CM_SUTUN_INDEKSLERI['OMS_TICKET_ID']
-        olusturma_tarihi_idx = CM_SUTUN_INDEKSLERI['OLUSTURMA_TARIHI']
-        
-        oncesi_tickets = []
-        sonrasi_tickets = []
+        kayitlar = self.ticket_kayitlari_olustur(0, oncesi_kesintiler, sonrasi_kesintiler, kesinti_zamanlar_dict)
+        return self.cagri_ticket_toplu_bul(kayitlar).get(0, "")
+    
+    @staticmethod
+    def ticket_kayitlari_olustur(zincir_id, oncesi_kesintiler, sonrasi_kesintiler, kesinti_zamanlar_dict):
+        """
+        Bir zincirin öncesi/sonrası kesintilerini cagri_ticket_toplu_bul kayıtlarına çevir.
         
-        # Öncesi çağrı olan kesintiler
-        for kesinti_id in oncesi_kesintiler:
-            if kesinti_id not in kesinti_zamanlar_dict:
-                continue
-            
-            kesinti_baslama, kesinti_bitis = kesinti_zamanlar_dict[kesinti_id]
-            data = self.kesinti_ara(kesinti_id)
-            
-            if len(data) == 0:
-                continue
-            
-            ticket_ids = set()  # Mükerrerleri önlemek için set
-            for _, row in data.iterrows():
-                ticket_id = str(row.iloc[ticket_id_idx]).strip() if len(row) > ticket_id_idx else ""
-                olusturma_tarihi_str = str(row.iloc[olusturma_tarihi_idx]).strip() if len(row) > olusturma_tarihi_idx else ""
-                
-                if not ticket_id or ticket_id == '' or ticket_id.lower() == 'nan':
-                    continue
-                
-                try:
-                    olusturma_tarihi = pd.to_datetime(olusturma_tarihi_str, errors='coerce')
-                    
-                    if pd.isna(olusturma_tarihi):
-                        continue
-                    
-                    if olusturma_tarihi < kesinti_baslama:
-                        ticket_ids.add(ticket_id)  # set.add() kullan
-                except:
-                    continue
-            
-            if ticket_ids:
-                tickets_str = ', '.join(sorted(ticket_ids))  # Sıralı ve tekil
-                oncesi_tickets.append(f"{kesinti_id} ({tickets_str})")
-        
-        # Sonrası çağrı olan kesintiler
-        for kesinti_id in sonrasi_kesintiler:
-            if kesinti_id not in kesinti_zamanlar_dict:
-                continue
-            
-            kesinti_baslama, kesinti_bitis = kesinti_zamanlar_dict[kesinti_id]
-            data = self.kesinti_ara(kesinti_id)
-            
-            if len(data) == 0:
-                continue
-            
-            ticket_ids = set()  # Mükerrerleri önlemek için set
-            for _, row in data.iterrows():
-                ticket_id = str(row.iloc[ticket_id_idx]).strip() if len(row) > ticket_id_idx else ""
-                olusturma_tarihi_str = str(row.iloc[olusturma_tarihi_idx]).strip() if len(row) > olusturma_tarihi_idx else ""
-                
-                if not ticket_id or ticket_id == '' or ticket_id.lower() == 'nan':
-                    continue
-                
-                try:
-                    olusturma_tarihi = pd.to_datetime(olusturma_tarihi_str, errors='coerce')
-                    
-                    if pd.isna(olusturma_tarihi):
-                        continue
-                    
-                    if olusturma_tarihi > kesinti_bitis:
-                        ticket_ids.add(ticket_id)  # set.add() kullan
-                except:
-                    continue
+        Args:
+            zincir_id: Zincir anahtarı
+            oncesi_kesintiler: Öncesi çağrı olan kesinti ID listesi
+            sonrasi_kesintiler: Sonrası çağrı olan kesinti ID listesi
+            kesinti_zamanlar_dict: {kesinti_id: (baslama, bitis)} sözlüğü
             
-            if ticket_ids:
-                tickets_str = ', '.join(sorted(ticket_ids))  # Sıralı ve tekil
-                sonrasi_tickets.append(f"{kesinti_id} ({tickets_str})")
-        
-        # Format: Öncesi: ... | Sonrası: ...
-        result_parts = []
-        if oncesi_tickets:
-            result_parts.append(f"Öncesi: {'; '.join(oncesi_tickets)}")
-        if sonrasi_tickets:
-            result_parts.append(f"Sonrası: {'; '.join(sonrasi_tickets)}")
-        
-        return ' | '.join(result_parts) if result_parts else ""
+        Returns:
+            list: (zincir_id, yön, kesinti_id, baslama, bitis) kayıtları
+        """
+        kayitlar = []
+        for yon, kesintiler in (('oncesi', oncesi_kesintiler), ('sonrasi', sonrasi_kesintiler)):
+            for kesinti_id in kesintiler:
+                if kesinti_id in kesinti_zamanlar_dict:
+                    kesinti_baslama, kesinti_bitis = kesinti_zamanlar_dict[kesinti_id]
+                    kayitlar.append((zincir_id, yon, kesinti_id, kesinti_baslama, kesinti_bitis))
+        return kayitlar
     
     def get_dataframe(self):
         """CM DataFrame'ini döndür"""
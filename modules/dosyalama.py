@@ -6,6 +6,7 @@ NOT: Ortak W değerleri hesaplanmaz, analiz sonucundan alınır.
 """
 
 import pandas as pd
+import multiprocessing
 import os
 import sys
 import matplotlib
@@ -17,30 +18,71 @@ from openpyxl.styles import Font, PatternFill, Alignment
 # Config ve diğer modülleri import et
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import (
-    TABLE_SUTUN_INDEKSLERI, JTK_SUTUN_INDEKSLERI, 
+    TABLE_SUTUN_INDEKSLERI, TABLE_SEMASI, JTK_SUTUN_INDEKSLERI, 
     CM_SUTUN_INDEKSLERI, VERI_SUTUN_INDEKSLERI,
     PNG_AYARLARI, EXCEL_STIL, EXCEL_AYARLARI, VARSAYILAN,
-    DAGITIM_AG_AYARLARI
+    DAGITIM_AG_AYARLARI, PARALEL_AYARLARI, RAPOR_MANIFEST_AYARLARI
 )
-from modules.excel_yardimci import ExcelYardimci
+from modules.excel_yardimci import ExcelYardimci, IdIndeksi
+from modules.okuyucu import TabloOkuyucu
+from modules.ilerleme import IslemIptalEdildi
+from modules.profil import profil
+from modules.veri_deposu import VeriDeposu
+from modules.png_tablo import PngTablo
+from modules.rapor_manifest import RaporManifest
+
+# Paralel raporlamada işçi süreçlerin kullandığı Dosyalama nesnesi
+# (fork ile miras alınır veya spawn'da işçi başına bir kez aktarılır)
+_ISCI_DOSYALAMA = None
+
+
+def _isci_baslat(dosyalama, profil_aktif):
+    """
+    İşçi süreci hazırla.
+    
+    Args:
+        dosyalama: Spawn'da aktarılan Dosyalama nesnesi (fork'ta None, miras alınır)
+        profil_aktif: İşçide aşama ölçümü yapılsın mı
+    """
+    global _ISCI_DOSYALAMA
+    if dosyalama is not None:
+        _ISCI_DOSYALAMA = dosyalama
+    # Fork'ta ana sürecin kayıtları da kopyalanır; tekrar sayılmasın
+    profil.sifirla(profil_aktif)
+
+
+def _isci_grup_isle(gorev):
+    """İşçi süreçte tek bir grubun raporlarını oluştur"""
+    grup, output_base, kaynaga_gore = gorev
+    _ISCI_DOSYALAMA._grup_isle(grup, output_base, kaynaga_gore)
+    return grup, profil.devret()
 
 
 class Dosyalama:
     """Dosyalama ve raporlama işlemleri için sınıf"""
     
-    def __init__(self, klasor_yolu):
+    def __init__(self, klasor_yolu, veri_deposu=None):
         """
         Dosyalama sınıfını başlat.
         
         Args:
             klasor_yolu: Çalışma klasörü
+            veri_deposu: Opsiyonel paylaşılan VeriDeposu (analizde okunan CM tekrar okunmaz)
         """
         self.klasor_yolu = klasor_yolu
+        self.veri_deposu = veri_deposu or VeriDeposu()
         self.grup_list = []
         self.df_table = None
+        self.table_konumlari = {}  # table.xlsx sütun indeksi (config) -> okunan df_table'daki konumu
+        self.df_otg = None  # df_table'ın OTG raporu için filtrelenmiş hali (aynı satır index'i)
+        self._otg_kaynak = None  # df_otg'nin üretildiği df_table
         self.df_jtk = None
         self.df_cm = None
         self.df_analiz = None  # Analiz sonucu (W değerleri dahil)
+        self.analiz_indeksi = None  # Normalize grup -> df_analiz'deki ilk satırın konumu
+        self._analiz_indeksi_df = None  # İndeksin oluşturulduğu df_analiz
+        self.id_indeksleri = {}  # 'OTG' / 'JTK' / 'CM' -> IdIndeksi
+        self.son_rapor_ozeti = {}  # Son tum_gruplari_isle çağrısının üretilen/atlanan/eski sayıları
     
     def dosyalari_yukle(self):
         """
@@ -51,44 +93,107 @@ class Dosyalama:
         """
         eksik = []
         
-        table_path = os.path.join(self.klasor_yolu, 'table.xlsx')
-        jtk_path = os.path.join(self.klasor_yolu, 'jtk.xlsx')
-        cm_path = os.path.join(self.klasor_yolu, 'cm.xlsx')
+        # .xlsx yerine aynı adla .parquet / .csv de kullanılabilir
+        table_path = TabloOkuyucu.dosya_bul(self.klasor_yolu, 'table')
+        jtk_path = TabloOkuyucu.dosya_bul(self.klasor_yolu, 'jtk')
+        cm_path = TabloOkuyucu.dosya_bul(self.klasor_yolu, 'cm')
         
-        if not os.path.exists(table_path):
+        if table_path is None:
             eksik.append('table.xlsx')
-        if not os.path.exists(jtk_path):
+        if jtk_path is None:
             eksik.append('jtk.xlsx')
-        if not os.path.exists(cm_path):
+        if cm_path is None:
             eksik.append('cm.xlsx')
         
         if eksik:
             return False, eksik
         
         try:
-            self.df_table = pd.read_excel(
-                table_path, 
-                skiprows=EXCEL_AYARLARI['TABLE_SKIP_ROWS'], 
-                header=0, 
-                keep_default_na=False
-            )
-            self.df_jtk = pd.read_excel(
-                jtk_path, 
-                header=EXCEL_AYARLARI['JTK_HEADER_ROW'], 
-                keep_default_na=False
-            )
-            self.df_cm = pd.read_excel(
-                cm_path, 
-                skiprows=2, 
-                header=0, 
-                keep_default_na=False
-            )
+            with profil.asama('rapor.yukleme') as a:
+                self.df_table = self._table_oku(table_path)
+                self.otg_tablosu()
+                self.df_jtk = ExcelYardimci.excel_oku(
+                    jtk_path, 
+                    header=EXCEL_AYARLARI['JTK_HEADER_ROW'], 
+                    keep_default_na=False
+                )
+                self.df_cm = self.veri_deposu.cm_al(cm_path)
+                self._id_indekslerini_olustur(cm_path)
+                a.adet = len(self.df_table) + len(self.df_jtk) + len(self.df_cm)
             print(f"✓ Dosyalar yüklendi")
             return True, []
         except Exception as e:
             print(f"✗ Dosya yükleme hatası: {e}")
             return False, [str(e)]
     
+    def _table_oku(self, table_path):
+        """
+        table.xlsx'ten yalnızca OTG raporunda kullanılan sütunları oku.
+        
+        Config'deki sütun indeksleri _table_konumu ile okunan DataFrame'deki
+        konumlara çevrilir.
+        
+        Args:
+            table_path: table.xlsx yolu
+            
+        Returns:
+            DataFrame: Seçili sütunlar (dosyadaki sırayla)
+        """
+        okuma_ayarlari = dict(skiprows=EXCEL_AYARLARI['TABLE_SKIP_ROWS'], header=0, keep_default_na=False)
+        indeksler = TABLE_SEMASI['SUTUN_INDEKSLERI']
+        try:
+            df = ExcelYardimci.excel_oku(table_path, usecols=indeksler, **okuma_ayarlari)
+        except ValueError:
+            # Dosyada config'deki son sütunlar yok: tümünü okuyup olanları seç
+            df = ExcelYardimci.excel_oku(table_path, **okuma_ayarlari)
+            df = df.iloc[:, [idx for idx in indeksler if idx < len(df.columns)]]
+        
+        self.table_konumlari = {idx: konum for konum, idx in enumerate(indeksler[:len(df.columns)])}
+        return df
+    
+    def _table_konumu(self, anahtar):
+        """
+        TABLE_SUTUN_INDEKSLERI değerinin df_table'daki konumu.
+        
+        Args:
+            anahtar: TABLE_SUTUN_INDEKSLERI anahtarı
+            
+        Returns:
+            int veya list: Konum(lar); okunmayan sütunlar için sütun sayısı
+            (mevcut "idx < len(df.columns)" kontrolleri aynen geçerli kalır)
+        """
+        yok = len(self.table_konumlari)
+        deger = TABLE_SUTUN_INDEKSLERI[anahtar]
+        if isinstance(deger, list):
+            return [self.table_konumlari.get(idx, yok) for idx in deger]
+        return self.table_konumlari.get(deger, yok)
+    
+    def _id_indekslerini_olustur(self, cm_path):
+        """table/jtk/cm için Kesinti ID -> satır index'lerini bir kez oluştur (CM'ninki depodan)"""
+        self.id_indeksleri = {
+            'OTG': IdIndeksi(self.df_table, self._table_konumu('KESINTI_ID')),
+            'JTK': IdIndeksi(self.df_jtk, JTK_SUTUN_INDEKSLERI['KESINTI_ID']),
+            'CM': self.veri_deposu.cm_id_indeksi(cm_path)
+        }
+    
+    def _id_ara(self, kaynak_adi, df, aranan_id, col_index):
+        """
+        Kaynak için index varsa ondan, yoksa tam tarama ile ID ara.
+        
+        Args:
+            kaynak_adi: 'OTG', 'JTK' veya 'CM'
+            df: Aranacak DataFrame
+            aranan_id: Aranacak ID
+            col_index: ID sütununun indeksi
+            
+        Returns:
+            DataFrame: Eşleşen satırlar
+        """
+        indeks = self.id_indeksleri.get(kaynak_adi)
+        if indeks is not None and indeks.df is df:
+            return indeks.ara(aranan_id)
+        return ExcelYardimci.id_ara(df, aranan_id, col_index)
+    
     def analiz_sonucunu_yukle(self, analiz_yolu):
         """
         Analiz sonuç dosyasını yükle (W değerleri dahil).
@@ -100,13 +205,49 @@ class Dosyalama:
             bool: Başarılı ise True
         """
         try:
-            self.df_analiz = pd.read_excel(analiz_yolu, header=0, keep_default_na=False)
+            self.df_analiz = TabloOkuyucu.oku(analiz_yolu, header=0, keep_default_na=False)
+            self._analiz_indeksini_olustur()
             print(f"✓ Analiz sonucu yüklendi: {len(self.df_analiz)} satır")
             return True
         except Exception as e:
             print(f"✗ Analiz yüklenemedi: {e}")
             return False
     
+    def _analiz_indeksini_olustur(self):
+        """
+        Normalize grup string'i -> df_analiz satır konumu index'ini bir kez oluştur.
+        
+        Aynı grup birden fazla satırda varsa ilk satır kullanılır (satır
+        satır aramadaki gibi). İlgili Kesintiler sütunu yoksa index None kalır.
+        """
+        self.analiz_indeksi = None
+        self._analiz_indeksi_df = self.df_analiz
+        h_sutun_idx = VERI_SUTUN_INDEKSLERI['ILGILI_KESINTILER']
+        if self.df_analiz is None or h_sutun_idx >= len(self.df_analiz.columns):
+            return
+        
+        indeks = {}
+        for konum, grup_str in enumerate(self.df_analiz.iloc[:, h_sutun_idx]):
+            indeks.setdefault(ExcelYardimci.normalize_grup_string(grup_str), konum)
+        self.analiz_indeksi = indeks
+    
+    def _analiz_satiri(self, grup):
+        """
+        Grubun analiz sonucundaki satırını döndür.
+        
+        Args:
+            grup: Normalize grup string'i
+            
+        Returns:
+            Series veya None: Satır (grup yoksa None)
+        """
+        if self.df_analiz is None:
+            return None
+        if self._analiz_indeksi_df is not self.df_analiz:
+            self._analiz_indeksini_olustur()
+        konum = (self.analiz_indeksi or {}).get(grup)
+        return None if konum is None else self.df_analiz.iloc[konum]
+    
     def gruplari_yukle(self, veri_yolu=None):
         """
         Grupları yükle (analiz sonucundan veya veri.xlsx'den).
@@ -119,33 +260,29 @@ class Dosyalama:
         """
         self.grup_list = []
         
-        # Önce analiz sonucundan dene
+        # Önce analiz sonucundan dene (index ilk görülme sırasını korur)
         if self.df_analiz is not None:
-            try:
-                h_sutun_idx = VERI_SUTUN_INDEKSLERI['ILGILI_KESINTILER']
-                for idx, row in self.df_analiz.iterrows():
-                    grup_str = str(row.iloc[h_sutun_idx]).strip()
-                    if grup_str and grup_str != '':
-                        grup_normalized = ExcelYardimci.normalize_grup_string(grup_str)
-                        if grup_normalized not in self.grup_list:
-                            self.grup_list.append(grup_normalized)
+            if self._analiz_indeksi_df is not self.df_analiz:
+                self._analiz_indeksini_olustur()
+            if self.analiz_indeksi is not None:
+                self.grup_list = [grup for grup in self.analiz_indeksi if grup]
                 print(f"✓ Analiz sonucundan {len(self.grup_list)} grup yüklendi")
                 return self.grup_list
-            except Exception as e:
-                print(f"Analiz'den grup yükleme hatası: {e}")
+            print("Analiz'den grup yükleme hatası: İlgili Kesintiler sütunu bulunamadı")
         
         # veri.xlsx'den yükle
         if veri_yolu and os.path.exists(veri_yolu):
             try:
-                df_veri = pd.read_excel(veri_yolu, header=0, keep_default_na=False)
+                df_veri = TabloOkuyucu.oku(veri_yolu, header=0, keep_default_na=False)
                 h_sutun_idx = VERI_SUTUN_INDEKSLERI['ILGILI_KESINTILER']
                 
-                for idx in range(1, len(df_veri)):
-                    grup_str = str(df_veri.iloc[idx, h_sutun_idx]).strip()
-                    if grup_str and grup_str != '':
-                        grup_normalized = ExcelYardimci.normalize_grup_string(grup_str)
-                        if grup_normalized not in self.grup_list:
-                            self.grup_list.append(grup_normalized)
+                # Sıralı küme (dict) ile tekrarları at
+                gruplar = dict.fromkeys(self.grup_list)
+                for grup_str in df_veri.iloc[1:, h_sutun_idx]:
+                    grup_str = str(grup_str).strip()
+                    if grup_str:
+                        gruplar[ExcelYardimci.normalize_grup_string(grup_str)] = None
+                self.grup_list = list(gruplar)
                 
                 print(f"✓ veri.xlsx'den {len(self.grup_list)} grup yüklendi")
             except Exception as e:
@@ -163,83 +300,70 @@ class Dosyalama:
         Returns:
             str: W değeri veya boş string
         """
-        if self.df_analiz is None:
-            return ""
-        
         try:
-            h_sutun_idx = VERI_SUTUN_INDEKSLERI['ILGILI_KESINTILER']
-            
-            for idx, row in self.df_analiz.iterrows():
-                analiz_grup = str(row.iloc[h_sutun_idx]).strip()
-                analiz_grup_normalized = ExcelYardimci.normalize_grup_string(analiz_grup)
-                
-                if analiz_grup_normalized == grup:
-                    # "Ortak W Değerleri" sütununu bul
-                    if 'Ortak W Değerleri' in self.df_analiz.columns:
-                        return str(row['Ortak W Değerleri'])
-                    # Alternatif: Son sütun
-                    return str(row.iloc[-1]) if len(row) > 0 else ""
-            
-            return ""
+            row = self._analiz_satiri(grup)
+            if row is None:
+                return ""
+            # "Ortak W Değerleri" sütununu bul
+            if 'Ortak W Değerleri' in self.df_analiz.columns:
+                return str(row['Ortak W Değerleri'])
+            # Alternatif: Son sütun
+            return str(row.iloc[-1]) if len(row) > 0 else ""
         except Exception as e:
             print(f"W değeri alma hatası: {e}")
             return ""
     
     def _filter_table_columns(self, df):
-        """table.xlsx için sütun filtresi"""
+        """
+        table.xlsx için sütun filtresi (OTG raporunda gösterilen sütunlar).
+        
+        Tüm tabloya bir kez uygulanır (otg_tablosu); türetilen sütunlar
+        satır bazlı olduğundan grup dilimleri bu tablodan alınır.
+        """
         try:
-            selected_indices = TABLE_SUTUN_INDEKSLERI['SECILEN_SUTUNLAR']
+            selected_indices = self._table_konumu('SECILEN_SUTUNLAR')
             new_df = df.iloc[:, selected_indices].copy()
             
             # Toplam etkilenen kullanıcı hesapla
             try:
-                t_col = pd.to_numeric(df.iloc[:, TABLE_SUTUN_INDEKSLERI['ETKILENEN_KULLANICI_T']], errors='coerce').fillna(0)
-                u_col = pd.to_numeric(df.iloc[:, TABLE_SUTUN_INDEKSLERI['ETKILENEN_KULLANICI_U']], errors='coerce').fillna(0)
-                v_col = pd.to_numeric(df.iloc[:, TABLE_SUTUN_INDEKSLERI['ETKILENEN_KULLANICI_V']], errors='coerce').fillna(0)
-                w_col = pd.to_numeric(df.iloc[:, TABLE_SUTUN_INDEKSLERI['ETKILENEN_KULLANICI_W']], errors='coerce').fillna(0)
+                t_col = pd.to_numeric(df.iloc[:, self._table_konumu('ETKILENEN_KULLANICI_T')], errors='coerce').fillna(0)
+                u_col = pd.to_numeric(df.iloc[:, self._table_konumu('ETKILENEN_KULLANICI_U')], errors='coerce').fillna(0)
+                v_col = pd.to_numeric(df.iloc[:, self._table_konumu('ETKILENEN_KULLANICI_V')], errors='coerce').fillna(0)
+                w_col = pd.to_numeric(df.iloc[:, self._table_konumu('ETKILENEN_KULLANICI_W')], errors='coerce').fillna(0)
                 new_df['Toplam Etkilenen Kullanıcı'] = (t_col + u_col + v_col + w_col).astype(int)
             except:
                 new_df['Toplam Etkilenen Kullanıcı'] = 0
             
             # Ek sütunlar
-            for idx in TABLE_SUTUN_INDEKSLERI['EK_SUTUNLAR']:
+            for idx in self._table_konumu('EK_SUTUNLAR'):
                 if idx < len(df.columns):
                     new_df[df.columns[idx]] = df.iloc[:, idx]
             
             # OMS yorum
-            oms_idx = TABLE_SUTUN_INDEKSLERI['OMS_YORUM']
+            oms_idx = self._table_konumu('OMS_YORUM')
             if oms_idx < len(df.columns):
                 new_df[df.columns[oms_idx]] = df.iloc[:, oms_idx]
             
             # İlk çağrı zamanı
             try:
-                at_idx = TABLE_SUTUN_INDEKSLERI['ILK_CAGRI_AT']
-                au_idx = TABLE_SUTUN_INDEKSLERI['ILK_CAGRI_AU']
+                at_idx = self._table_konumu('ILK_CAGRI_AT')
+                au_idx = self._table_konumu('ILK_CAGRI_AU')
                 at_col = pd.to_datetime(df.iloc[:, at_idx], errors='coerce')
                 au_col = pd.to_datetime(df.iloc[:, au_idx], errors='coerce')
                 
-                min_times = []
-                for at_val, au_val in zip(at_col, au_col):
-                    at_valid = at_val is not pd.NaT
-                    au_valid = au_val is not pd.NaT
-                    
-                    if at_valid and au_valid:
-                        if at_val <= au_val:
-                            min_times.append(f"{at_val.strftime('%d.%m.%Y %H:%M:%S')} (Müşteri Dışı)")
-                        else:
-                            min_times.append(f"{au_val.strftime('%d.%m.%Y %H:%M:%S')} (Müşteri)")
-                    elif at_valid:
-                        min_times.append(f"{at_val.strftime('%d.%m.%Y %H:%M:%S')} (Müşteri Dışı)")
-                    elif au_valid:
-                        min_times.append(f"{au_val.strftime('%d.%m.%Y %H:%M:%S')} (Müşteri)")
-                    else:
-                        min_times.append("")
+                # Hangisi önce (eşitse Müşteri Dışı); yalnızca biri varsa o
+                at_once = at_col.notna() & (au_col.isna() | (at_col <= au_col))
+                au_once = au_col.notna() & ~at_once
+                
+                min_times = pd.Series("", index=df.index, dtype=object)
+                min_times[at_once] = at_col[at_once].dt.strftime('%d.%m.%Y %H:%M:%S') + " (Müşteri Dışı)"
+                min_times[au_once] = au_col[au_once].dt.strftime('%d.%m.%Y %H:%M:%S') + " (Müşteri)"
                 new_df['İlk Çağrı Zamanı'] = min_times
             except:
                 new_df['İlk Çağrı Zamanı'] = ""
             
             # Son sütun
-            son_idx = TABLE_SUTUN_INDEKSLERI['SON_SUTUN']
+            son_idx = self._table_konumu('SON_SUTUN')
             if son_idx < len(df.columns):
                 new_df[df.columns[son_idx]] = df.iloc[:, son_idx]
             
@@ -248,6 +372,20 @@ class Dosyalama:
             print(f"Filtreleme hatası: {e}")
             return df
     
+    def otg_tablosu(self):
+        """
+        df_table'ın OTG sütun filtresi uygulanmış halini döndür.
+        
+        Tabloya bir kez uygulanır; df_table değişirse yeniden üretilir.
+        
+        Returns:
+            DataFrame veya None: df_table ile aynı satır index'ine sahip tablo
+        """
+        if self._otg_kaynak is not self.df_table:
+            self._otg_kaynak = self.df_table
+            self.df_otg = None if self.df_table is None else self._filter_table_columns(self.df_table)
+        return self.df_otg
+    
     def png_olustur(self, id_listesi, grup_adi, grup_folder, kaynak_adi):
         """
         PNG raporu oluştur (optimize edilmiş versiyon).
@@ -260,7 +398,7 @@ class Dosyalama:
         """
         if kaynak_adi == 'OTG':
             df = self.df_table
-            col_index = TABLE_SUTUN_INDEKSLERI['KESINTI_ID']
+            col_index = self._table_konumu('KESINTI_ID')
             is_table = True
         else:
             df = self.df_jtk
@@ -270,12 +408,14 @@ class Dosyalama:
         if df is None:
             return
         
+        df_otg = self.otg_tablosu() if is_table else None
+        
         all_data = []
         for aranan_id in id_listesi:
-            data = ExcelYardimci.id_ara(df, aranan_id, col_index)
+            data = self._id_ara(kaynak_adi, df, aranan_id, col_index)
             
             if is_table and len(data) > 0:
-                data = self._filter_table_columns(data)
+                data = df_otg.loc[data.index]
             
             all_data.append({'id': aranan_id, 'data': data})
         
@@ -286,6 +426,7 @@ class Dosyalama:
         # Önce veriyi hazırla (fig boyutunu hesaplamak için)
         combined_data = []
         cell_line_counts = []  # Her satırdaki maksimum satır sayısı
+        satir_turleri = []  # Başlık / renkli / düz satır (boyama için)
         
         # OMS sütun indeksini önceden bul
         oms_col_idx = -1
@@ -319,9 +460,10 @@ class Dosyalama:
                     header_max_lines = max(header_max_lines, wrapped.count('\n') + 1)
                 combined_data.append(headers)
                 cell_line_counts.append(header_max_lines)
+                satir_turleri.append(PngTablo.BASLIK)
                 
                 # Veri satırları
-                for _, row in item['data'].iterrows():
+                for data_row_idx, (_, row) in enumerate(item['data'].iterrows()):
                     row_data = []
                     max_lines_in_row = 1
                     
@@ -340,10 +482,29 @@ class Dosyalama:
                     
                     combined_data.append(row_data)
                     cell_line_counts.append(max_lines_in_row)
+                    satir_turleri.append(PngTablo.RENKLI if data_row_idx % 2 == 0 else PngTablo.DUZ)
         
         if len(combined_data) == 0:
             return
         
+        png_path = os.path.join(grup_folder, f"{grup_adi}-{kaynak_adi}.png")
+        if PNG_AYARLARI.get('TABLO_CIZICI', 'pillow') == 'pillow' and PngTablo.kullanilabilir_mi():
+            PngTablo(kaynak_adi).ciz(combined_data, cell_line_counts, satir_turleri, png_path)
+        else:
+            self._png_matplotlib_ciz(combined_data, cell_line_counts, satir_turleri, kaynak_adi, png_path)
+        print(f"  ✓ {kaynak_adi}.png oluşturuldu")
+    
+    def _png_matplotlib_ciz(self, combined_data, cell_line_counts, satir_turleri, kaynak_adi, png_path):
+        """
+        Tabloyu matplotlib ax.table ile çiz (Pillow yoksa veya config'de seçilirse).
+        
+        Args:
+            combined_data: Satırlara bölünmüş hücre metinleri
+            cell_line_counts: Her satırdaki maksimum metin satırı sayısı
+            satir_turleri: Her satır için PngTablo.BASLIK / RENKLI / DUZ
+            kaynak_adi: 'OTG' veya 'JTK'
+            png_path: Hedef dosya yolu
+        """
         # Figure boyutunu içeriğe göre hesapla
         total_lines = sum(cell_line_counts)
         row_height_factor = PNG_AYARLARI.get('ROW_HEIGHT_FACTOR', 0.4)
@@ -399,40 +560,28 @@ class Dosyalama:
                     cell.set_height(0.07 + (line_count - 1) * 0.04)
         
         # Stil uygula
-        row_idx = 0
         header_color = PNG_AYARLARI['HEADER_COLOR']
         alt_color = PNG_AYARLARI['ALTERNATE_ROW_COLOR']
         
-        for item in all_data:
-            if len(item['data']) > 0:
-                # Başlık satırı
-                for col_idx in range(num_cols):
-                    cell = table[(row_idx, col_idx)]
+        for row_idx, satir_turu in enumerate(satir_turleri):
+            for col_idx in range(num_cols):
+                cell = table[(row_idx, col_idx)]
+                if satir_turu == PngTablo.BASLIK:
                     cell.set_facecolor(header_color)
                     cell.set_text_props(
                         weight='bold', 
                         color='white',
                         fontsize=header_font_size
                     )
-                
-                row_idx += 1
-                
-                # Veri satırları
-                for data_row_idx in range(len(item['data'])):
-                    for col_idx in range(num_cols):
-                        cell = table[(row_idx, col_idx)]
-                        if data_row_idx % 2 == 0:
-                            cell.set_facecolor(alt_color)
-                    row_idx += 1
+                elif satir_turu == PngTablo.RENKLI:
+                    cell.set_facecolor(alt_color)
         
         plt.tight_layout(pad=0.2)
         
-        png_path = os.path.join(grup_folder, f"{grup_adi}-{kaynak_adi}.png")
         plt.savefig(png_path, dpi=PNG_AYARLARI['DPI'], bbox_inches='tight',
                     facecolor='none', edgecolor='none', format='png', 
                     pad_inches=0.05, transparent=True)
         plt.close(fig)
-        print(f"  ✓ {kaynak_adi}.png oluşturuldu")
     
     def _wrap_text(self, text, max_len):
         """Metni belirli uzunlukta satırlara böl"""
@@ -485,7 +634,7 @@ class Dosyalama:
         
         all_data = []
         for aranan_id in id_listesi:
-            data = ExcelYardimci.id_ara(self.df_cm, aranan_id, col_index)
+            data = self._id_ara('CM', self.df_cm, aranan_id, col_index)
             if len(data) > 0:
                 all_data.append({'id': aranan_id, 'data': data})
         
@@ -555,69 +704,211 @@ class Dosyalama:
         Returns:
             str: Kaynağa Göre değeri veya boş string
         """
-        if self.df_analiz is None:
-            return ""
-        
         try:
-            h_sutun_idx = VERI_SUTUN_INDEKSLERI['ILGILI_KESINTILER']
-            
-            for idx, row in self.df_analiz.iterrows():
-                analiz_grup = str(row.iloc[h_sutun_idx]).strip()
-                analiz_grup_normalized = ExcelYardimci.normalize_grup_string(analiz_grup)
-                
-                if analiz_grup_normalized == grup:
-                    # "Kaynağa Göre" sütununu bul
-                    if 'Kaynağa Göre' in self.df_analiz.columns:
-                        return str(row['Kaynağa Göre']).strip()
-            
-            return ""
+            row = self._analiz_satiri(grup)
+            # "Kaynağa Göre" sütununu bul
+            if row is None or 'Kaynağa Göre' not in self.df_analiz.columns:
+                return ""
+            return str(row['Kaynağa Göre']).strip()
         except Exception as e:
             print(f"Kaynağa Göre alma hatası: {e}")
             return ""
     
-    def tum_gruplari_isle(self, progress_callback=None):
+    def tum_gruplari_isle(self, progress_callback=None, isci_sayisi=None, iptal_olayi=None, artimli=None):
         """
         Tüm grupları işle.
         
+        Çıktı klasöründeki manifest (RaporManifest) ile girdileri ve ayarları
+        değişmeyen grupların raporları yeniden üretilmez. Artık listede
+        olmayan grup klasörleri raporlanır (ayarlıysa silinir).
+        
         Args:
             progress_callback: İlerleme callback fonksiyonu (idx, total, grup)
+            isci_sayisi: Paralel süreç sayısı (None ise config'den, 1 ise seri)
+            iptal_olayi: Opsiyonel iptal bayrağı (is_set() ile gruplar arasında kontrol edilir)
+            artimli: Değişmeyen gruplar atlansın mı (None ise config'den, False ise hepsi üretilir)
             
         Returns:
-            int: İşlenen grup sayısı
+            int: Raporu üretilen grup sayısı (atlananlar son_rapor_ozeti'nde)
+            
+        Raises:
+            IslemIptalEdildi: iptal_olayi işaretlendiğinde
         """
         output_base = os.path.join(self.klasor_yolu, VARSAYILAN['OUTPUT_FOLDER'])
         os.makedirs(output_base, exist_ok=True)
         
-        # Dağıtım-AG ayarları
-        dagitim_ag_deger = DAGITIM_AG_AYARLARI.get('KAYNAGA_GORE_DEGER', 'Dağıtım-AG')
-        jtk_olustur = DAGITIM_AG_AYARLARI.get('JTK_OLUSTUR', False)
+        if isci_sayisi is None:
+            isci_sayisi = PARALEL_AYARLARI.get('RAPOR_ISCI_SAYISI', 1)
+        if artimli is None:
+            artimli = RAPOR_MANIFEST_AYARLARI.get('AKTIF', True)
         
-        for idx, grup in enumerate(self.grup_list, 1):
-            print(f"\nGRUP {idx}/{len(self.grup_list)}: {grup}")
+        manifest = RaporManifest(output_base)
+        if artimli:
+            manifest.yukle()
+        
+        try:
+            with profil.asama('rapor.manifest', len(self.grup_list)):
+                gorevler, ozetler = self._gorevleri_hazirla(manifest, artimli)
             
-            if progress_callback:
-                progress_callback(idx, len(self.grup_list), grup)
+            atlanan = len(self.grup_list) - len(gorevler)
+            if atlanan:
+                print(f"✓ {atlanan} grubun girdileri değişmedi, raporları atlandı")
             
-            grup_folder = os.path.join(output_base, grup)
-            os.makedirs(grup_folder, exist_ok=True)
+            with profil.asama('rapor.gruplar', len(gorevler)):
+                if isci_sayisi > 1 and len(gorevler) > 1:
+                    self._gruplari_paralel_isle(
+                        gorevler, output_base, isci_sayisi, progress_callback, iptal_olayi,
+                        bitince=lambda grup: manifest.grup_kaydet(grup, ozetler[grup])
+                    )
+                else:
+                    for idx, (grup, kaynaga_gore) in enumerate(gorevler, 1):
+                        self._iptal_kontrol(iptal_olayi)
+                        print(f"\nGRUP {idx}/{len(gorevler)}: {grup}")
+                        
+                        if progress_callback:
+                            progress_callback(idx, len(gorevler), grup)
+                        
+                        self._grup_isle(grup, output_base, kaynaga_gore)
+                        manifest.grup_kaydet(grup, ozetler[grup])
             
-            id_listesi = [id.strip() for id in grup.split(';')]
+            eski_klasorler = manifest.eski_klasorleri_isle(self.grup_list)
+        finally:
+            # İptal/hata durumunda da tamamlanan grupların kaydı korunur
+            manifest.kaydet()
+        
+        self.son_rapor_ozeti = {
+            'uretilen': len(gorevler),
+            'atlanan': atlanan,
+            'eski_klasorler': eski_klasorler
+        }
+        return len(gorevler)
+    
+    def _gorevleri_hazirla(self, manifest, artimli):
+        """
+        Her grubun girdi özetini hesapla ve yeniden üretilecekleri seç.
+        
+        Args:
+            manifest: Yüklenmiş RaporManifest
+            artimli: False ise tüm gruplar üretilir
             
-            # Kaynağa Göre bilgisini al
+        Returns:
+            tuple: ([(grup, kaynaga_gore)] üretilecekler, {grup: özet})
+        """
+        ayar_ozeti = RaporManifest.ayar_ozeti()
+        kaynaklar = [
+            ('OTG', self.df_table, self._table_konumu('KESINTI_ID')),
+            ('JTK', self.df_jtk, JTK_SUTUN_INDEKSLERI['KESINTI_ID']),
+            ('CM', self.df_cm, CM_SUTUN_INDEKSLERI['KESINTI_ID'])
+        ]
+        
+        gorevler = []
+        ozetler = {}
+        for grup in self.grup_list:
+            id_listesi = [id.strip() for id in grup.split(';')]
             kaynaga_gore = self._grup_kaynaga_gore_al(grup)
-            is_dagitim_ag = (kaynaga_gore == dagitim_ag_deger)
             
-            # OTG PNG'sini oluştur (her zaman)
-            self.png_olustur(id_listesi, grup, grup_folder, 'OTG')
+            parcalar = [ayar_ozeti, kaynaga_gore]
+            for kaynak_adi, df, col_index in kaynaklar:
+                parcalar.append(kaynak_adi)
+                for aranan_id in id_listesi:
+                    parcalar.append(None if df is None else self._id_ara(kaynak_adi, df, aranan_id, col_index))
             
-            # JTK PNG'sini oluştur (Dağıtım-AG değilse veya JTK_OLUSTUR=True ise)
-            if not is_dagitim_ag or jtk_olustur:
-                self.png_olustur(id_listesi, grup, grup_folder, 'JTK')
-            else:
-                print(f"  ⏭️ JTK atlandı (Dağıtım-AG)")
+            ozetler[grup] = RaporManifest.ozet_hesapla(parcalar)
+            if not (artimli and manifest.guncel_mi(grup, ozetler[grup])):
+                gorevler.append((grup, kaynaga_gore))
+        
+        return gorevler, ozetler
+    
+    @staticmethod
+    def _iptal_kontrol(iptal_olayi):
+        """İptal istendiyse IslemIptalEdildi fırlat"""
+        if iptal_olayi is not None and iptal_olayi.is_set():
+            raise IslemIptalEdildi("Raporlama kullanıcı tarafından iptal edildi")
+    
+    def _gruplari_paralel_isle(self, gorevler, output_base, isci_sayisi, progress_callback=None,
+                               iptal_olayi=None, bitince=None):
+        """
+        Grupları süreç havuzunda işle.
+        
+        Yüklü DataFrame'ler görev başına değil, işçi başına bir kez aktarılır:
+        fork destekleniyorsa işçiler nesneyi bellekten miras alır, aksi halde
+        (Windows/macOS) spawn başlatıcısı ile her işçiye bir kez gönderilir.
+        
+        Args:
+            gorevler: [(grup, kaynaga_gore)] işlenecek gruplar
+            output_base: Çıktı ana klasörü
+            isci_sayisi: Süreç sayısı
+            progress_callback: İlerleme callback fonksiyonu (idx, total, grup)
+            iptal_olayi: Opsiyonel iptal bayrağı (iptalde havuz sonlandırılır)
+            bitince: Opsiyonel, her grup tamamlandığında ana süreçte çağrılır (grup)
             
-            # CM Excel oluştur
-            self.cm_excel_olustur(id_listesi, grup, grup_folder)
+        Returns:
+            int: İşlenen grup sayısı
+        """
+        global _ISCI_DOSYALAMA
         
-        return len(self.grup_list)
-
+        toplam = len(gorevler)
+        isci_sayisi = min(isci_sayisi, toplam)
+        gorevler = [(grup, output_base, kaynaga_gore) for grup, kaynaga_gore in gorevler]
+        
+        if 'fork' in multiprocessing.get_all_start_methods() and sys.platform != 'darwin':
+            ctx = multiprocessing.get_context('fork')
+            _ISCI_DOSYALAMA = self
+            baslatici_args = (None, profil.aktif)
+        else:
+            ctx = multiprocessing.get_context('spawn')
+            baslatici_args = (self, profil.aktif)
+        
+        print(f"✓ Paralel raporlama: {toplam} grup, {isci_sayisi} işçi")
+        
+        try:
+            with ctx.Pool(isci_sayisi, initializer=_isci_baslat, initargs=baslatici_args) as havuz:
+                for idx, (grup, profil_kayitlari) in enumerate(havuz.imap(_isci_grup_isle, gorevler), 1):
+                    profil.birlestir(profil_kayitlari)
+                    if bitince:
+                        bitince(grup)
+                    self._iptal_kontrol(iptal_olayi)
+                    if progress_callback:
+                        progress_callback(idx, toplam, grup)
+        finally:
+            _ISCI_DOSYALAMA = None
+        
+        return toplam
+    
+    def _grup_isle(self, grup, output_base, kaynaga_gore=None):
+        """
+        Tek bir grubun OTG/JTK PNG ve CM Excel raporlarını oluştur.
+        
+        Args:
+            grup: Grup string'i (;'li kesinti ID'leri)
+            output_base: Çıktı ana klasörü
+            kaynaga_gore: Önceden alınmış "Kaynağa Göre" değeri (None ise analizden alınır)
+        """
+        # Dağıtım-AG ayarları
+        dagitim_ag_deger = DAGITIM_AG_AYARLARI.get('KAYNAGA_GORE_DEGER', 'Dağıtım-AG')
+        jtk_olustur = DAGITIM_AG_AYARLARI.get('JTK_OLUSTUR', False)
+        
+        grup_folder = os.path.join(output_base, grup)
+        os.makedirs(grup_folder, exist_ok=True)
+        
+        id_listesi = [id.strip() for id in grup.split(';')]
+        
+        # Kaynağa Göre bilgisini al
+        if kaynaga_gore is None:
+            kaynaga_gore = self._grup_kaynaga_gore_al(grup)
+        is_dagitim_ag = (kaynaga_gore == dagitim_ag_deger)
+        
+        # OTG PNG'sini oluştur (her zaman)
+        with profil.asama('rapor.png_otg', 1):
+            self.png_olustur(id_listesi, grup, grup_folder, 'OTG')
+        
+        # JTK PNG'sini oluştur (Dağıtım-AG değilse veya JTK_OLUSTUR=True ise)
+        if not is_dagitim_ag or jtk_olustur:
+            with profil.asama('rapor.png_jtk', 1):
+                self.png_olustur(id_listesi, grup, grup_folder, 'JTK')
+        else:
+            print(f"  ⏭️ JTK atlandı (Dağıtım-AG)")
+        
+        # CM Excel oluştur
+        with profil.asama('rapor.cm_excel', 1):
+            self.cm_excel_olustur(id_listesi, grup, grup_folder)
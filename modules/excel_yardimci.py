@@ -5,15 +5,19 @@ Excel dosyalarını okuma, yazma ve formatlama işlemleri.
 """
 
 import pandas as pd
+import numpy as np
 import os
 import sys
 from openpyxl import Workbook
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from openpyxl.styles import Alignment, Font, PatternFill
 
 # Config'i import et
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import EXCEL_STIL, EXCEL_AYARLARI
+from modules.onbellek import Onbellek
+from modules.okuyucu import TabloOkuyucu
 
 
 class ExcelYardimci:
@@ -36,6 +40,41 @@ class ExcelYardimci:
         seconds = total_seconds % 60
         return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
     
+    @staticmethod
+    def toplam_saniye(sureler):
+        """
+        Nanosaniye sürelerini Timedelta.total_seconds() ile aynı saniyelere çevir.
+        
+        total_seconds süreyi mikrosaniyeye aşağı yuvarlar ve tam saniye ile
+        mikrosaniye kısmını ayrı toplar; aynı değerler için aynı adımlar izlenir.
+        
+        Args:
+            sureler: int64 nanosaniye dizisi
+        
+        Returns:
+            ndarray: Saniye (float)
+        """
+        mikro = np.asarray(sureler, dtype=np.int64) // 1000
+        return mikro // 10**6 + (mikro % 10**6) / 1e6
+    
+    @staticmethod
+    def format_sure_dizi(sureler):
+        """
+        format_sure'nin nanosaniye dizisi için vektörel karşılığı.
+        
+        Args:
+            sureler: int64 nanosaniye dizisi
+        
+        Returns:
+            ndarray: "HH:MM:SS" metinleri (object)
+        """
+        total_seconds = np.trunc(ExcelYardimci.toplam_saniye(sureler)).astype(np.int64)
+        parcalar = [
+            np.char.zfill(deger.astype(str), 2).astype(object)
+            for deger in (total_seconds // 3600, (total_seconds % 3600) // 60, total_seconds % 60)
+        ]
+        return parcalar[0] + ':' + parcalar[1] + ':' + parcalar[2]
+    
     @staticmethod
     def format_tarih(val):
         """
@@ -74,6 +113,30 @@ class ExcelYardimci:
         
         return val_str
     
+    @staticmethod
+    def format_tarih_dizi(zamanlar):
+        """
+        Zaman dizisini gg.aa.yyyy ss:dd:nn metinlerine çevir (strftime yerine
+        ISO metninin karakterleri yeniden dizilir).
+        
+        Args:
+            zamanlar: datetime64 dizisi (NaT boş metin olur)
+            
+        Returns:
+            ndarray: Formatlanmış tarihler (object)
+        """
+        zamanlar = np.asarray(zamanlar, dtype='datetime64[ns]')
+        iso = np.datetime_as_string(zamanlar.astype('datetime64[s]'), unit='s').astype('U19')
+        # yyyy-aa-ggTss:dd:nn -> gg.aa.yyyy ss:dd:nn
+        karakterler = np.ascontiguousarray(
+            iso.view('U1').reshape(-1, 19)[:, [8, 9, 4, 5, 6, 7, 0, 1, 2, 3, 10, 11, 12, 13, 14, 15, 16, 17, 18]]
+        )
+        karakterler[:, [2, 5]] = '.'
+        karakterler[:, 10] = ' '
+        metinler = karakterler.view('U19').ravel().astype(object)
+        metinler[np.isnat(zamanlar)] = ''
+        return metinler
+    
     @staticmethod
     def temizle_ve_formatla(val, max_karakter=None, wrap_satir=False):
         """
@@ -183,35 +246,70 @@ class ExcelYardimci:
         """
         DataFrame'i formatlı Excel olarak kaydet.
         
+        Satırlar openpyxl write-only modunda tek geçişte yazılır; sütun
+        genişlikleri önceden DataFrame üzerinden hesaplanır ve veri hücreleri
+        sütun başına bir kez oluşturulan hizalama stilini paylaşır.
+        
         Args:
             df: Kaydedilecek DataFrame
             dosya_yolu: Hedef dosya yolu
         """
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Birlesik_Analiz"
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Birlesik_Analiz")
+        
+        # Sütun genişlikleri (write-only modda satırlardan önce verilmeli)
+        max_width = EXCEL_STIL.get('MAX_COLUMN_WIDTH', 60)
+        for col_idx, genislik in enumerate(ExcelYardimci._sutun_genislikleri(df), 1):
+            ws.column_dimensions[get_column_letter(col_idx)].width = min(genislik + 2, max_width)
         
         # Başlıkları yaz
         ws.append(list(df.columns))
         
-        # Verileri yaz
-        for r in dataframe_to_rows(df, index=False, header=False):
-            ws.append(r)
-        
-        # Hücre formatlaması
-        for row in ws.iter_rows(min_row=2, min_col=1, max_col=len(df.columns)):
-            for cell in row:
-                cell.alignment = Alignment(wrap_text=True, vertical="top")
-        
-        # Sütun genişliklerini ayarla
-        max_width = EXCEL_STIL.get('MAX_COLUMN_WIDTH', 60)
-        for col in ws.columns:
-            max_len = max(len(str(cell.value or "")) for cell in col)
-            ws.column_dimensions[col[0].column_letter].width = min(max_len + 2, max_width)
+        # Verileri yaz (hizalama stili bir kez oluşturulup hücrelerde paylaşılır)
+        hizalama = Alignment(wrap_text=True, vertical="top")
+        sablon = WriteOnlyCell(ws)
+        sablon.alignment = hizalama
+        stil = sablon._style
+        for satir in df.itertuples(index=False, name=None):
+            hucreler = []
+            for deger in satir:
+                hucre = WriteOnlyCell(ws, value=deger)
+                if hucre.has_style:
+                    # Tarih gibi sayı biçimi atanmış hücreler biçimini korur
+                    hucre.alignment = hizalama
+                else:
+                    hucre._style = stil
+                hucreler.append(hucre)
+            ws.append(hucreler)
         
         wb.save(dosya_yolu)
         print(f"✓ Excel kaydedildi: {dosya_yolu}")
     
+    @staticmethod
+    def _sutun_genislikleri(df):
+        """
+        Her sütundaki en uzun hücre metninin uzunluğu (başlık dahil).
+        
+        openpyxl'deki len(str(cell.value or "")) ölçüsünü vektörel olarak
+        uygular: None, 0, False ve boş metin 0 uzunluk sayılır.
+        
+        Args:
+            df: DataFrame
+            
+        Returns:
+            list: Sütun başına karakter sayısı
+        """
+        genislikler = []
+        for col_idx, baslik in enumerate(df.columns):
+            seri = df.iloc[:, col_idx]
+            uzunluk = len(str(baslik or ""))
+            if len(seri):
+                metinler = seri.astype(object).astype(str)
+                bos = seri.isin(['', 0, False]) | (seri.isna() & (metinler == 'None'))
+                uzunluk = max(uzunluk, int(metinler.str.len().where(~bos, 0).max()))
+            genislikler.append(uzunluk)
+        return genislikler
+    
     @staticmethod
     def kaydet_stillendirilmis(df, dosya_yolu, sheet_adi="Veri"):
         """
@@ -273,6 +371,24 @@ class ExcelYardimci:
         wb.save(dosya_yolu)
         print(f"✓ Excel kaydedildi: {dosya_yolu}")
     
+    @staticmethod
+    def excel_oku(dosya_yolu, **okuma_ayarlari):
+        """
+        Girdi dosyasını oku (Excel/CSV; önbellek açıksa tipli yan kopyadan).
+        
+        Parquet girdileri zaten tipli olduğundan önbelleğe alınmaz.
+        
+        Args:
+            dosya_yolu: Dosya yolu (.xlsx, .csv veya .parquet)
+            **okuma_ayarlari: pd.read_excel parametreleri
+            
+        Returns:
+            DataFrame
+        """
+        if dosya_yolu.lower().endswith('.parquet'):
+            return TabloOkuyucu.oku(dosya_yolu, **okuma_ayarlari)
+        return Onbellek().oku(dosya_yolu, TabloOkuyucu.oku, **okuma_ayarlari)
+    
     @staticmethod
     def oku_kesinti_dosyasi(dosya_yolu):
         """
@@ -285,7 +401,7 @@ class ExcelYardimci:
             DataFrame veya None
         """
         try:
-            df = pd.read_excel(
+            df = ExcelYardimci.excel_oku(
                 dosya_yolu, 
                 header=EXCEL_AYARLARI['KESINTI_HEADER_ROW']
             )
@@ -307,7 +423,7 @@ class ExcelYardimci:
             DataFrame veya None
         """
         try:
-            df = pd.read_excel(
+            df = TabloOkuyucu.oku(
                 dosya_yolu, 
                 header=EXCEL_AYARLARI['VERI_HEADER_ROW'],
                 keep_default_na=False
@@ -374,3 +490,85 @@ class ExcelYardimci:
             print(f"Arama hatası: {e}")
             return pd.DataFrame()
 
+
+class IdIndeksi:
+    """
+    Bir DataFrame sütunu için ID -> satır pozisyonları index'i.
+    
+    ExcelYardimci.id_ara'nın arama sırasını (string, float, int, numeric
+    dönüşüm) tek seferlik sözlüklerle uygular; her arama tam sütun taraması
+    yerine sözlük okuması ve iloc dilimidir.
+    """
+    
+    def __init__(self, df, col_index):
+        """
+        Index'i oluştur.
+        
+        Args:
+            df: Aranacak DataFrame
+            col_index: ID sütununun indeksi
+        """
+        self.df = df
+        self.metin_index = {}
+        self.sayi_index = {}
+        self.numerik_index = {}
+        
+        if df is None or col_index >= len(df.columns):
+            return
+        
+        search_col = df.iloc[:, col_index]
+        
+        # String karşılaştırması (str + strip)
+        anahtarlar = search_col.astype(str).str.strip()
+        self.metin_index = self._grupla(anahtarlar)
+        
+        # Doğrudan sayısal eşitlik (float/int araması): sadece sayı hücreleri
+        numerik = pd.to_numeric(search_col, errors='coerce')
+        if pd.api.types.is_numeric_dtype(search_col):
+            self.sayi_index = self._grupla(numerik.astype(float))
+        else:
+            sayi_mi = search_col.map(lambda v: isinstance(v, (int, float, np.number)))
+            self.sayi_index = self._grupla(numerik.astype(float).where(sayi_mi))
+        
+        # Numeric dönüşüm ile arama (sayısal metinler dahil)
+        self.numerik_index = self._grupla(numerik.astype(float))
+    
+    @staticmethod
+    def _grupla(anahtarlar):
+        """Anahtar -> satır pozisyonları sözlüğü (NaN anahtarlar hariç)"""
+        return anahtarlar.groupby(anahtarlar.to_numpy(), sort=False).indices
+    
+    def ara(self, aranan_id):
+        """
+        ID ile eşleşen satırları döndür (ExcelYardimci.id_ara ile aynı sonuç).
+        
+        Args:
+            aranan_id: Aranacak ID
+            
+        Returns:
+            DataFrame: Eşleşen satırlar
+        """
+        pozisyonlar = self.metin_index.get(str(aranan_id).strip())
+        
+        if pozisyonlar is None:
+            try:
+                pozisyonlar = self.sayi_index.get(float(aranan_id))
+            except (TypeError, ValueError):
+                pass
+        
+        if pozisyonlar is None:
+            try:
+                pozisyonlar = self.sayi_index.get(float(int(float(aranan_id))))
+            except (TypeError, ValueError, OverflowError):
+                pass
+        
+        if pozisyonlar is None:
+            try:
+                pozisyonlar = self.numerik_index.get(float(aranan_id))
+            except (TypeError, ValueError):
+                pass
+        
+        if pozisyonlar is None:
+            return pd.DataFrame()
+        
+        return self.df.iloc[pozisyonlar]
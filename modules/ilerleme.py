@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+İlerleme Modülü
+Uzun süren işlemler için aşama bazlı ilerleme, kalan süre ve iptal takibi.
+"""
+
+import time
+
+
+class IslemIptalEdildi(Exception):
+    """Kullanıcı işlemi iptal ettiğinde fırlatılır"""
+
+
+class Ilerleme:
+    """Ağırlıklı aşamalardan toplam yüzde ve kalan süre hesaplayan sınıf"""
+    
+    def __init__(self, asamalar, callback=None, iptal_olayi=None, min_aralik=0.2):
+        """
+        İlerleme takibini başlat.
+        
+        Args:
+            asamalar: [(aşama adı, ağırlık), ...] sıralı listesi
+            callback: Bildirim fonksiyonu (yuzde, asama, kalan_saniye, detay)
+            iptal_olayi: is_set() metodu olan iptal bayrağı (örn. threading.Event)
+            min_aralik: İki bildirim arasındaki en kısa süre (saniye)
+        """
+        self.callback = callback
+        self.iptal_olayi = iptal_olayi
+        self.min_aralik = min_aralik
+        
+        toplam = float(sum(agirlik for _, agirlik in asamalar)) or 1.0
+        self.asamalar = {}
+        baslangic = 0.0
+        for ad, agirlik in asamalar:
+            self.asamalar[ad] = (baslangic / toplam * 100, agirlik / toplam * 100)
+            baslangic += agirlik
+        
+        self.baslangic_zamani = time.monotonic()
+        self._son_bildirim = 0.0
+    
+    def iptal_kontrol(self):
+        """İptal istendiyse IslemIptalEdildi fırlat"""
+        if self.iptal_olayi is not None and self.iptal_olayi.is_set():
+            raise IslemIptalEdildi("İşlem kullanıcı tarafından iptal edildi")
+    
+    def guncelle(self, asama, oran=0.0, zorla=False, detay=''):
+        """
+        Aşama içindeki ilerlemeyi bildir (iptal kontrolü dahil).
+        
+        Args:
+            asama: Aşama adı
+            oran: Aşama içindeki ilerleme (0-1)
+            zorla: min_aralik beklenmeden bildir
+            detay: Opsiyonel açıklama (örn. işlenen grup)
+        """
+        self.iptal_kontrol()
+        
+        simdi = time.monotonic()
+        if not zorla and simdi - self._son_bildirim < self.min_aralik:
+            return
+        self._son_bildirim = simdi
+        
+        baslangic, genislik = self.asamalar.get(asama, (0.0, 0.0))
+        yuzde = min(100.0, baslangic + genislik * max(0.0, min(1.0, oran)))
+        
+        gecen = simdi - self.baslangic_zamani
+        kalan = gecen * (100 - yuzde) / yuzde if yuzde > 0 else None
+        
+        if self.callback:
+            self.callback(yuzde, asama, kalan, detay)
+    
+    @staticmethod
+    def sure_metni(saniye):
+        """Kalan süreyi 'x dk y sn' biçiminde yaz"""
+        if saniye is None:
+            return "hesaplanıyor"
+        saniye = int(saniye)
+        if saniye >= 60:
+            return f"{saniye // 60} dk {saniye % 60} sn"
+        return f"{saniye} sn"
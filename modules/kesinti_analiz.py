@@ -5,498 +5,1509 @@ Birleşik kesinti analizi işlemleri.
 """
 
 import pandas as pd
+import numpy as np
 from datetime import timedelta
+import heapq
+import multiprocessing
 import os
 import sys
 
 # Config ve diğer modülleri import et
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from config import KESINTI_SUTUNLARI, CM_SUTUN_INDEKSLERI, VERI_SUTUN_INDEKSLERI, VARSAYILAN, DAGITIM_AG_AYARLARI
+from config import (
+    KESINTI_SUTUNLARI, KESINTI_SEMASI, CM_SUTUN_INDEKSLERI, VERI_SUTUN_INDEKSLERI, VARSAYILAN,
+    DAGITIM_AG_AYARLARI, PARALEL_AYARLARI, ARTIMLI_ANALIZ_AYARLARI
+)
+from modules.analiz_durumu import AnalizDurumu
 from modules.cm_islemleri import CMIslemleri
 from modules.excel_yardimci import ExcelYardimci
+from modules.okuyucu import TabloOkuyucu
+from modules.profil import profil
+
+# Paralel sonuç oluşturmada işçi süreçlerin kullandığı (KesintiAnaliz, iş adı, birimler)
+# (fork ile miras alınır veya spawn'da işçi başına bir kez aktarılır)
+_ISCI_ANALIZ = None
+
+
+def _analiz_isci_baslat(veri, profil_aktif):
+    """
+    İşçi süreci hazırla.
+    
+    Args:
+        veri: Spawn'da aktarılan (KesintiAnaliz, iş adı, birimler) (fork'ta None, miras alınır)
+        profil_aktif: İşçide aşama ölçümü yapılsın mı
+    """
+    global _ISCI_ANALIZ
+    if veri is not None:
+        _ISCI_ANALIZ = veri
+    _ISCI_ANALIZ[0].ilerleme = None
+    # Fork'ta ana sürecin kayıtları da kopyalanır; tekrar sayılmasın
+    profil.sifirla(profil_aktif)
+
+
+def _analiz_isci_parca_isle(parca):
+    """
+    İşçi süreçte bir bölümdeki birimleri (zincir blokları) işle.
+    
+    Her birimin sonuç tablosu ve toplu Ortak W / OMS ticket sırasına
+    aldığı kayıtlar birlikte döner; kayıtlar sonuç sırasıyla
+    anahtarlandığından ana süreçte doğrudan birleştirilir.
+    """
+    engine, is_adi, birimler = _ISCI_ANALIZ
+    fonksiyon = getattr(engine, is_adi)
+    sonuclar = []
+    for i in parca:
+        engine._ortak_w_bekleyenler = []
+        engine._ticket_bekleyenler = []
+        sonuclar.append((i, fonksiyon(*birimler[i]), engine._ortak_w_bekleyenler, engine._ticket_bekleyenler))
+    return sonuclar, profil.devret()
 
 
 class KesintiAnaliz:
     """Kesinti analizi için ana sınıf"""
     
-    def __init__(self):
-        """Kesinti analiz sınıfını başlat"""
+    # İlerleme aşamaları ve yaklaşık süre ağırlıkları
+    ILERLEME_ASAMALARI = [('okuma', 35), ('hazirlik', 5), ('zincir', 45), ('tm', 10), ('ortak_w', 3), ('oms_ticket', 2)]
+    
+    TARAMA_ILERLEME_ASAMALARI = [('okuma', 60), ('hazirlik', 10), ('tarama', 30)]
+    
+    # KESINTI_SUTUNLARI anahtarı -> analizde kullanılan sütun adı
+    IC_SUTUN_ADLARI = {
+        'INOUT': 'INOUT', 'KESINTI_NO': 'KesintiNo', 'KADEME': 'Kademe', 'SEBEKE_UNSURU': 'SebekeUnsuru',
+        'BASLAMA': 'Baslama', 'BITIS': 'Bitis', 'SCADA': 'ScadaKesintisi', 'SON_CAGRI': 'SonCagri',
+        'ILK_MUSTERI_DISI': 'IlkMusteriDisiCagri', 'ILK_MUSTERI': 'IlkMusteriCagri', 'CBS_TM_NO': 'CBSTMNo',
+        'KAYNAGA_GORE': 'KaynagaGore', 'TOPLAM_CAGRI': 'ToplamCagri', 'KESINTI_SEVIYESI': 'KesijtiSeviyesi'
+    }
+    
+    # Sonuç tablosunun sütunları (sırasıyla)
+    SONUC_SUTUNLARI = [
+        'SebekeUnsuru', 'IN-OUT Durumu', 'BirlesikBaslama', 'BirlesikBitis', 'Süre (hh:mm:ss)', 'Tur',
+        'Ardışık Farklar (dk)', 'İlgiliKesintiler(;)', 'KesintiZamanlari', 'Scada Kesintisi Oranı',
+        'Toplam Çağrı Sayısı', 'Kesinti Seviyesi', 'OMS Ticket IDs', 'Ortak W Değerleri', 'TM Kesintileri'
+    ]
+    
+    # Sonuç satırı başına zincir bilgileri (sıra: Tekil'ler dahil sonuç listesindeki konum)
+    ZINCIR_BILGI_SUTUNLARI = ['sira', 'SebekeUnsuru', 'Tur', 'Ardışık Farklar (dk)']
+    
+    def __init__(self, veri_deposu=None):
+        """
+        Kesinti analiz sınıfını başlat.
+        
+        Args:
+            veri_deposu: Opsiyonel paylaşılan VeriDeposu (CM raporlamayla ortak okunur)
+        """
+        self.veri_deposu = veri_deposu
         self.cm_islemleri = None
         self.df_sonuc = None
-        self.kesinti_max_bitis = None
         self.df_tum_kesintiler = None  # TM bazlı tarama için tüm kesintiler
+        self.ilerleme = None
+        self._ortak_w_bekleyenler = []  # (sonuç sırası, kesinti no) çiftleri - toplu Ortak W için
+        self._ticket_bekleyenler = []  # (sonuç sırası, yön, kesinti no, başlama, bitiş) - toplu OMS ticket için
+        self._hazir = None  # Okunmuş/temizlenmiş veri ve sıralamalar (aynı dosyayla tekrar kullanılır)
+        self._isci_sayisi = 1
+    
+    def __getstate__(self):
+        """İşçi süreçlere yalnızca zincir oluşturmada kullanılan durum taşınır"""
+        durum = self.__dict__.copy()
+        for ad in ('_hazir', 'df_tum_kesintiler', 'df_sonuc', 'ilerleme'):
+            durum[ad] = None
+        durum['_ortak_w_bekleyenler'] = []
+        durum['_ticket_bekleyenler'] = []
+        return durum
     
-    def analiz_yap(self, excel_yolu, tolerans_ayarlari=None):
+    def analiz_yap(self, excel_yolu, tolerans_ayarlari=None, ilerleme=None, isci_sayisi=None, artimli=None):
         """
         Birleşik kesinti analizini gerçekleştir.
         
+        Kesinti dosyasının klasöründeki analiz durumu (bkz. AnalizDurumu)
+        kullanılarak yalnızca kesintileri değişen şebeke unsurlarının ve
+        TM'lerin zincirleri yeniden hesaplanır; sonuç tam hesaplamayla aynıdır.
+        
         Args:
             excel_yolu: Kesinti Excel dosyasının yolu
             tolerans_ayarlari: Ard arda tolerans ayarları (dict: kritik_saat, tolerans_ustu_dk, tolerans_alti_dk)
+            ilerleme: Opsiyonel Ilerleme nesnesi (aşama bildirimi ve iptal kontrolü)
+            isci_sayisi: Zincir oluşturma için süreç sayısı (None ise config'den, 1 ise seri)
+            artimli: Önceki analiz durumu kullanılsın mı (None ise config'den, False ise
+                     tüm zincirler yeniden hesaplanır; durum her iki durumda da kaydedilir)
             
         Returns:
             DataFrame: Analiz sonuçları
+            
+        Raises:
+            IslemIptalEdildi: İlerleme üzerinden iptal istendiğinde
         """
+        self.ilerleme = ilerleme
+        if isci_sayisi is None:
+            isci_sayisi = PARALEL_AYARLARI.get('ANALIZ_ISCI_SAYISI', 1)
+        self._isci_sayisi = isci_sayisi
+        if artimli is None:
+            artimli = ARTIMLI_ANALIZ_AYARLARI.get('AKTIF', True)
+        
         # Tolerans ayarlarını sakla (tüm ard arda analizler için)
         self.tolerans_ayarlari = tolerans_ayarlari or {
             'kritik_saat': 9,
             'tolerans_ustu_dk': 60,
             'tolerans_alti_dk': 15
         }
-        # Excel dosyasını oku (tüm sütunlar dahil - TM taraması için)
-        df_full = pd.read_excel(excel_yolu, header=3)
-        
-        
-        # CM.xlsx dosyasını yükle
-        cm_dosya_yolu = os.path.join(os.path.dirname(excel_yolu), "CM.xlsx")
-        if os.path.exists(cm_dosya_yolu):
-            self.cm_islemleri = CMIslemleri(cm_dosya_yolu)
-        else:
-            print(f"✗ CM.xlsx dosyası bulunamadı: {cm_dosya_yolu}")
-            self.cm_islemleri = None
-        
-        # Gerekli sütunları seç
-        sutun_adlari = list(KESINTI_SUTUNLARI.values())
-        df = df_full[sutun_adlari].copy()
-        df.columns = ['INOUT', 'KesintiNo', 'Kademe', 'SebekeUnsuru', 'Baslama', 'Bitis',
-                      'ScadaKesintisi', 'SonCagri', 'IlkMusteriDisiCagri', 'IlkMusteriCagri', 
-                      'CBSTMNo', 'KaynagaGore', 'ToplamCagri', 'KesijtiSeviyesi']
-        
-        # Veri temizleme
-        df = df.dropna(subset=['KesintiNo', 'SebekeUnsuru', 'Baslama', 'Bitis'])
-        df['Baslama'] = pd.to_datetime(df['Baslama'], errors='coerce', dayfirst=True)
-        df['Bitis'] = pd.to_datetime(df['Bitis'], errors='coerce', dayfirst=True)
-        df['SonCagri'] = pd.to_datetime(df['SonCagri'], errors='coerce', dayfirst=True)
-        df['IlkMusteriDisiCagri'] = pd.to_datetime(df['IlkMusteriDisiCagri'], errors='coerce', dayfirst=True)
-        df['IlkMusteriCagri'] = pd.to_datetime(df['IlkMusteriCagri'], errors='coerce', dayfirst=True)
-        df['ScadaKesintisi'] = df['ScadaKesintisi'].fillna('')
-        df['CBSTMNo'] = df['CBSTMNo'].fillna('').astype(str)
-        df['ToplamCagri'] = pd.to_numeric(df['ToplamCagri'], errors='coerce').fillna(0).astype(int)
-        df['KesijtiSeviyesi'] = df['KesijtiSeviyesi'].fillna('').astype(str)
-        
-        # TM bazlı tarama için tüm kesintileri sakla
-        self.df_tum_kesintiler = df.copy()
-        
-        # TM bazlı index oluştur (hızlı arama için)
-        self._tm_index_olustur()
-        
-        # Her kesinti no için maksimum bitiş zamanını hesapla
-        self.kesinti_max_bitis = df.groupby('KesintiNo')['Bitis'].max().to_dict()
-        
-        sonuc_list = []
+        df = self._veriyi_hazirla(excel_yolu)
+        
+        klasor = os.path.dirname(os.path.abspath(excel_yolu))
+        durum = AnalizDurumu(klasor)
+        ayar_ozeti = AnalizDurumu.ayar_ozeti_hesapla(self.tolerans_ayarlari)
+        cm_imzasi = self._hazir['imza'][1]
+        if artimli:
+            durum.yukle(ayar_ozeti)
+            # CM'siz analizde toplu CM kayıtları tutulmaz; CM eklendiyse hepsi yeniden hesaplanır
+            if durum.cm_imzasi is None and cm_imzasi is not None:
+                durum = AnalizDurumu(klasor)
+        
+        # Kesintileri (veya TM taramasının okuduğu kesintileri) değişen birimler
+        with profil.asama('analiz.birim_ozetleri', len(df)):
+            ozetler = self._birim_ozetleri(df)
+            degisen = {tur: durum.degisen_birimler(tur, ozetler[tur]) for tur in AnalizDurumu.TURLER}
+        if durum.ayar_ozeti is not None:
+            print(f"✓ Artımlı analiz: {int(degisen['unsur'].sum())}/{len(degisen['unsur'])} şebeke unsuru, "
+                  f"{int(degisen['tm'].sum())}/{len(degisen['tm'])} TM yeniden hesaplanacak")
+        
+        parcalar = []
+        self._ortak_w_bekleyenler = []
+        self._ticket_bekleyenler = []
+        
+        # Şebeke unsuruna ve başlama zamanına göre tek seferde sırala,
+        # zincirleri vektörel tarama ile belirle
+        secim = df['SebekeUnsuru'].isin(ozetler['unsur'].index[degisen['unsur']]).to_numpy()
+        df_unsur = df if secim.all() else df[secim]
+        with profil.asama('analiz.zincir_belirleme', len(df_unsur)):
+            df_sirali, zincir_idleri = self._zincirleri_belirle(df_unsur)
+            df_eleman, zincir_nolari, zincirler, unsur_sayilari = self._unsur_zincir_elemanlari(
+                df_sirali, zincir_idleri
+            )
         
-        # Şebeke unsuruna göre grupla
-        for unsur, grup in df.groupby('SebekeUnsuru'):
-            grup = grup.sort_values('Baslama').reset_index(drop=True)
-            temp = [grup.iloc[0].to_dict()]
-            
-            for i in range(1, len(grup)):
-                simdiki = grup.iloc[i].to_dict()
-                
-                # Aynı kesinti no ard arda / iç içe sayılmaz
-                # Gruptaki son eklenen kesinti ile aynı no ise
-                if simdiki['KesintiNo'] == temp[-1]['KesintiNo']:
-                    sonuc_list.extend(self._zincir_olustur(temp, unsur))
-                    temp = [simdiki]
-                    continue
-                
-                # Gruptaki TÜM kesintilerin maksimum bitiş zamanını bul
-                grup_max_bitis = max(x['Bitis'] for x in temp)
-                
-                # En son biten kesinti (tolerans hesabı için)
-                en_son_biten = max(temp, key=lambda x: x['Bitis'])
-                
-                # İç içe (gruptaki herhangi bir kesinti hala devam ediyorsa)
-                if simdiki['Baslama'] <= grup_max_bitis:
-                    temp.append(simdiki)
-                # Ard arda (dinamik tolerans)
-                else:
-                    # En son biten kesintinin süresine göre tolerans belirle
-                    tolerans_dk = self._tolerans_hesapla(en_son_biten)
-                    
-                    if (simdiki['Baslama'] - grup_max_bitis) <= timedelta(minutes=tolerans_dk):
-                        temp.append(simdiki)
-                    else:
-                        # Yeni grup
-                        sonuc_list.extend(self._zincir_olustur(temp, unsur))
-                        temp = [simdiki]
-            
-            sonuc_list.extend(self._zincir_olustur(temp, unsur))
+        # Sonuç sütunlarını (zincir, eleman) ataması üzerinden topluca hesapla
+        with profil.asama('analiz.zincir_olusturma', len(zincirler)):
+            parcalar.extend(self._sonuclari_olustur(df_eleman, zincir_nolari, zincirler, 'Kademe', True, 'zincir'))
         
         # ═══════════════════════════════════════════════════════════════
         # TM No Ard Arda Analizi (Dağıtım-AG için)
         # ═══════════════════════════════════════════════════════════════
-        tm_ardarda_sonuc = self._tm_no_ardarda_analiz(df)
-        sonuc_list.extend(tm_ardarda_sonuc)
+        self._ilerleme_bildir('tm', 0.0, zorla=True)
+        secim = df['TMNo'].isin(ozetler['tm'].index[degisen['tm']]).to_numpy()
+        # Sayı tüm veri için; artımlı çalışmada yeniden zincirlenenler ayrıca yazılır
+        tm_dagitim = df['DagitimAG'].to_numpy() & (df['TMNo'].cat.codes.to_numpy() >= 0)
+        if tm_dagitim.any():
+            yeniden = '' if degisen['tm'].all() else f" ({int((tm_dagitim & secim).sum())} kesinti yeniden zincirlendi)"
+            print(f"✓ TM No Ard Arda analizi: {int(tm_dagitim.sum())} Dağıtım-AG kesintisi{yeniden}")
+        with profil.asama('analiz.tm_ardarda') as a:
+            tm_parcalari, tm_sayilari = self._tm_no_ardarda_analiz(
+                df if secim.all() else df[secim], int(unsur_sayilari.sum())
+            )
+            a.adet = sum(len(p) for p in tm_parcalari)
+        parcalar.extend(tm_parcalari)
+        self._ilerleme_bildir('tm', 1.0, zorla=True)
+        
+        df_yeni = pd.concat(parcalar) if parcalar else pd.DataFrame(columns=self.SONUC_SUTUNLARI)
+        
+        # CM değişmediyse yalnızca yeni zincirlerin CM sütunları doldurulur,
+        # değiştiyse kayıtlı zincirlerinkiyle birlikte birleştirmeden sonra
+        kayitlar = (self._ortak_w_bekleyenler, self._ticket_bekleyenler)
+        cm_ayni = durum.ayar_ozeti is not None and durum.cm_imzasi == cm_imzasi
+        if cm_ayni:
+            self._cm_sutunlarini_doldur(df_yeni)
+        
+        with profil.asama('analiz.birim_birlestirme') as a:
+            df_sonuc = self._birimleri_birlestir(
+                durum, ozetler, degisen, df_yeni, {'unsur': unsur_sayilari, 'tm': tm_sayilari}, kayitlar
+            )
+            a.adet = len(df_sonuc)
+        
+        if cm_ayni:
+            self._ortak_w_bekleyenler = []
+            self._ticket_bekleyenler = []
+        else:
+            self._cm_sutunlarini_doldur(df_sonuc)
+        
+        with profil.asama('analiz.durum_kaydet', len(df_sonuc)):
+            durum.ayar_ozeti = ayar_ozeti
+            durum.cm_imzasi = cm_imzasi
+            for tur in AnalizDurumu.TURLER:
+                durum.turler[tur]['sonuc'] = (
+                    df_sonuc[df_sonuc['tur'] == tur].drop(columns='tur').reset_index(drop=True)
+                )
+            durum.kaydet()
         
-        # Sonuçları DataFrame'e çevir
-        df_sonuc = pd.DataFrame(sonuc_list)
-        df_sonuc = df_sonuc[df_sonuc['Tur'] != 'Tekil']
-        df_sonuc = df_sonuc.sort_values(['SebekeUnsuru', 'BirlesikBaslama'])
+        # İndeks, Tekil'ler dahil sonuç listesindeki sıradır
+        df_sonuc = df_sonuc[self.SONUC_SUTUNLARI].sort_values(['SebekeUnsuru', 'BirlesikBaslama'])
         
         self.df_sonuc = df_sonuc
         return df_sonuc
     
-    def _tolerans_hesapla(self, kesinti):
-        """Kesinti süresine göre tolerans hesapla."""
-        kritik_saat = self.tolerans_ayarlari.get('kritik_saat', 9)
-        tolerans_ustu = self.tolerans_ayarlari.get('tolerans_ustu_dk', 60)
-        tolerans_alti = self.tolerans_ayarlari.get('tolerans_alti_dk', 15)
+    def _cm_sutunlarini_doldur(self, df_sonuc):
+        """
+        Sıraya alınan zincirlerin Ortak W ve OMS ticket sütunlarını tek seferde doldur.
         
-        # Kesinti süresini saat cinsinden hesapla
-        sure_saat = (kesinti['Bitis'] - kesinti['Baslama']).total_seconds() / 3600
+        Args:
+            df_sonuc: Sonuç sırası indeksli sonuç DataFrame'i
+        """
+        if self.cm_islemleri is None:
+            # Kayıtlı zincirlerde önceki CM'nin değerleri kalmasın
+            df_sonuc['OMS Ticket IDs'] = ""
+            df_sonuc['Ortak W Değerleri'] = ""
+            self._ortak_w_bekleyenler = []
+            self._ticket_bekleyenler = []
+            return
+            
+        # Tüm zincirlerin ortak W değerlerini tek seferde hesapla
+        self._ilerleme_bildir('ortak_w', 0.0, zorla=True)
+        with profil.asama('analiz.ortak_w', len(self._ortak_w_bekleyenler)):
+            self._ortak_w_doldur(df_sonuc)
+        self._ilerleme_bildir('ortak_w', 1.0, zorla=True)
+        
+        # Öncesi/sonrası çağrı ticket'larını tek seferde sınıflandır
+        self._ilerleme_bildir('oms_ticket', 0.0, zorla=True)
+        with profil.asama('analiz.oms_ticket', len(self._ticket_bekleyenler)):
+            self._oms_ticket_doldur(df_sonuc)
+        self._ilerleme_bildir('oms_ticket', 1.0, zorla=True)
+    
+    def _birim_ozetleri(self, df):
+        """
+        Şebeke unsuru ve TM birimlerinin girdi özetleri.
         
-        if sure_saat >= kritik_saat:
-            return tolerans_ustu
-        else:
-            return tolerans_alti
-    
-    def _zincir_olustur(self, temp, unsur):
-        """Karma zincirleri ikiye ayırır."""
-        farklar = []
-        icice_list, ardarda_list = [], []
-        ic_ice, ard_arda = False, False
-        
-        for i in range(1, len(temp)):
-            fark = (temp[i]['Baslama'] - temp[i - 1]['Bitis']).total_seconds() / 60
-            # Önceki kesintinin toleransını hesapla
-            tolerans_dk = self._tolerans_hesapla(temp[i - 1])
-            
-            if fark <= 0:
-                ic_ice = True
-                icice_list.append((temp[i - 1], temp[i]))
-            elif fark > 0 and fark <= tolerans_dk:
-                ard_arda = True
-                ardarda_list.append((temp[i - 1], temp[i]))
-                farklar.append(round(fark, 1))
-        
-        sonuc = []
-        if ic_ice and ard_arda:
-            if icice_list:
-                sonuc.append(self._tek_zincir(icice_list, unsur, "İç içe", None))
-            if ardarda_list:
-                sonuc.append(self._tek_zincir(ardarda_list, unsur, "Ard arda", farklar))
-            return sonuc
-        elif ic_ice:
-            return [self._tek_zincir(icice_list, unsur, "İç içe", None)]
-        elif ard_arda:
-            return [self._tek_zincir(ardarda_list, unsur, "Ard arda", farklar)]
-        else:
-            pairs = [(x,) for x in temp]
-            return [self._tek_zincir(pairs, unsur, "Tekil", None)]
-    
-    def _tek_zincir(self, pairs, unsur, tur, farklar=None):
-        """Tek bir zincir için detayları hesapla."""
-        elemanlar = []
-        seen = set()
-        for pair in pairs:
-            for x in pair:
-                if x['KesintiNo'] not in seen:
-                    elemanlar.append(x)
-                    seen.add(x['KesintiNo'])
-        
-        elemanlar.sort(key=lambda x: x['Baslama'])
-        
-        # En erken başlama ve en geç bitiş
-        ilk = min(x['Baslama'] for x in elemanlar)
-        son = max(x['Bitis'] for x in elemanlar)
-        
-        # Her kesinti için maksimum bitiş zamanını kullan
-        if self.kesinti_max_bitis:
-            max_bitis_list = [self.kesinti_max_bitis.get(x['KesintiNo'], x['Bitis']) for x in elemanlar]
-            son = max(max_bitis_list)
-        
-        sure_str = ExcelYardimci.format_sure(son - ilk)
-        
-        # IN/OUT türü belirleme
-        inout_degerleri = {x['INOUT'] for x in elemanlar if isinstance(x['INOUT'], str)}
-        if len(inout_degerleri) == 1:
-            inout_durum = list(inout_degerleri)[0]
-        elif len(inout_degerleri) > 1:
-            inout_durum = "IN/OUT"
-        else:
-            inout_durum = "-"
+        Unsur özeti kendi kesintilerinin tüm sütunlarından (MaksBitis dahil)
+        hesaplanır; Dağıtım-AG kesintisi olan unsurlarda TM taramasının
+        okuduğu, aynı TM'deki tüm kesintilerin (TM, başlama, kesinti no)
+        özeti de satırlarına eklenir. TM birimi, TM No Ard Arda'ya giren
+        Dağıtım-AG kesintilerinden oluşur.
+        
+        Args:
+            df: Temizlenmiş kesinti DataFrame'i
+            
+        Returns:
+            dict: Tür -> birim özetleri (Series, sonuçtaki birim sırasıyla)
+        """
+        tm_kodlari = df['TMNo'].cat.codes.to_numpy()
+        tm_var = tm_kodlari >= 0
+        tm_nolari = pd.Index(df['TMNo'].cat.categories, dtype=object)
+        
+        baglam = AnalizDurumu.grup_ozetleri(df.loc[tm_var, ['TMNo', 'Baslama', 'KesintiNo']], df['TMNo'][tm_var])
+        kategori_baglami = np.zeros(len(tm_nolari), dtype=np.uint64)
+        konum = baglam.index.get_indexer(tm_nolari)
+        kategori_baglami[konum >= 0] = baglam.to_numpy()[konum[konum >= 0]]
+        dagitim_ag = df['DagitimAG'].to_numpy()
+        dagitim_ag_unsuru = df['SebekeUnsuru'].isin(df['SebekeUnsuru'][dagitim_ag].unique()).to_numpy()
+        tm_baglami = np.where(tm_var & dagitim_ag_unsuru, kategori_baglami[tm_kodlari], np.uint64(0))
+        
+        unsur = AnalizDurumu.grup_ozetleri(df.assign(TMBaglami=tm_baglami), df['SebekeUnsuru'])
+        unsur_sirasi = pd.Index(np.asarray(pd.factorize(df['SebekeUnsuru'], sort=True)[1]), dtype=object)
+        
+        secim = tm_var & dagitim_ag
+        tm = AnalizDurumu.grup_ozetleri(df[secim], df['TMNo'][secim])
+        return {
+            'unsur': unsur.reindex(unsur_sirasi),
+            'tm': tm.reindex(tm_nolari[tm_nolari.isin(tm.index)])
+        }
+    
+    def _birimleri_birlestir(self, durum, ozetler, degisen, df_yeni, sayilar, kayitlar):
+        """
+        Yeni hesaplanan birimlerin sonuçlarını kayıtlı birimlerinkiyle birleştir.
         
-        # Scada Kesintisi oranı hesaplama
-        toplam_kesinti = len(elemanlar)
-        x_olan_sayisi = sum(1 for x in elemanlar if str(x.get('ScadaKesintisi', '')).strip().upper() == 'X')
-        scada_orani = f"{x_olan_sayisi}/{toplam_kesinti}"
+        Yeni sonuç ve toplu CM kayıtlarının sıraları (yalnızca değişen
+        birimleri kapsayan) birim ve birim içi sıraya çevrilir; kayıtlı
+        birimlerinkiyle birlikte güncel birim sırasına göre tam analizdeki
+        sonuç sırasına yerleştirilir. Durumun birim tabloları ve CM kayıtları
+        güncellenir; CM kayıtları sonuç sırasıyla bekleyen listelere alınır.
         
-        # Çağrı durumu analizi
-        cagri_durumu, oncesi_kesintiler, sonrasi_kesintiler = self._analyze_cagri_durumu(elemanlar)
-        
-        # Tür bilgisi
-        tur_final = f"{tur} - {cagri_durumu}" if cagri_durumu else tur
-        
-        # OMS Ticket ID'leri
-        oms_ticket_ids = ""
-        if (oncesi_kesintiler or sonrasi_kesintiler) and self.cm_islemleri:
-            kesinti_zamanlar = {
-                elem['KesintiNo']: (
-                    elem['Baslama'],
-                    self.kesinti_max_bitis.get(elem['KesintiNo'], elem['Bitis']) if self.kesinti_max_bitis else elem['Bitis']
-                )
-                for elem in elemanlar
+        Args:
+            durum: AnalizDurumu
+            ozetler: Tür -> birim özetleri
+            degisen: Tür -> yeniden hesaplanan birimlerin maskesi
+            df_yeni: Değişen birimlerin sonuçları (yeni sıra indeksli)
+            sayilar: Tür -> değişen birimlerin sonuç satırı sayıları
+            kayitlar: Değişen birimlerin (Ortak W, OMS ticket) bekleyen kayıtları
+            
+        Returns:
+            DataFrame: Sonuç sırası indeksli tüm sonuçlar ('tur', 'birim', 'yerel' ile)
+        """
+        # Değişen birimlerin yeni sıra aralıkları (tür ve birim sırasıyla ardışık)
+        yeni_birimler = []
+        for tur in AnalizDurumu.TURLER:
+            anahtarlar = ozetler[tur].index[degisen[tur]]
+            yeni_birimler.append(pd.DataFrame({
+                'tur': tur, 'birim': anahtarlar, 'sayi': sayilar[tur].reindex(anahtarlar, fill_value=0).to_numpy()
+            }))
+        yeni_birimler = pd.concat(yeni_birimler, ignore_index=True)
+        yeni_birimler['bas'] = np.cumsum(yeni_birimler['sayi']) - yeni_birimler['sayi']
+        dolu = yeni_birimler[yeni_birimler['sayi'] > 0]
+        
+        def birime_cevir(siralar):
+            i = np.searchsorted(dolu['bas'].to_numpy(), siralar, side='right') - 1
+            return (dolu['tur'].to_numpy()[i], dolu['birim'].to_numpy()[i],
+                    np.asarray(siralar, dtype=np.int64) - dolu['bas'].to_numpy()[i])
+        
+        tur, birim, yerel = birime_cevir(df_yeni.index.to_numpy(dtype=np.int64))
+        df_yeni = df_yeni.reset_index(drop=True).assign(tur=tur, birim=birim, yerel=yerel)
+        ortak_w = pd.DataFrame(kayitlar[0], columns=['sira', 'kesinti'])
+        tur, birim, yerel = birime_cevir(ortak_w['sira'].to_numpy(dtype=np.int64))
+        ortak_w = ortak_w.drop(columns='sira').assign(tur=tur, birim=birim, yerel=yerel)
+        ticket = pd.DataFrame(kayitlar[1], columns=['sira', 'yon', 'kesinti', 'baslama', 'bitis'])
+        tur, birim, yerel = birime_cevir(ticket['sira'].to_numpy(dtype=np.int64))
+        ticket = ticket.drop(columns='sira').assign(tur=tur, birim=birim, yerel=yerel)
+        
+        sonuc_list, ortak_w_list, ticket_list = [], [], []
+        ilk_sira = 0
+        for tur in AnalizDurumu.TURLER:
+            kayit = durum.turler[tur]
+            kalan = ozetler[tur].index[~degisen[tur]]
+            yeni = yeni_birimler[yeni_birimler['tur'] == tur]
+            
+            # Birim tablosu: kalan birimlerin kayıtlı, değişenlerin yeni satır sayısı
+            sayi = pd.Series(0, index=ozetler[tur].index, dtype=np.int64)
+            sayi.loc[kalan] = kayit['birimler']['sayi'].reindex(kalan).to_numpy()
+            sayi.loc[yeni['birim']] = yeni['sayi'].to_numpy()
+            birimler = pd.DataFrame({'ozet': ozetler[tur], 'sayi': sayi})
+            bas = pd.Series(ilk_sira + np.cumsum(sayi.to_numpy()) - sayi.to_numpy(), index=sayi.index)
+            ilk_sira += int(sayi.sum())
+            
+            eski_sonuc = kayit['sonuc'] if kayit['sonuc'] is not None else df_yeni.iloc[:0].drop(columns='tur')
+            parcalar = []
+            for eski, yeni_kayitlar, liste in (
+                (eski_sonuc, df_yeni, sonuc_list), (kayit['ortak_w'], ortak_w, ortak_w_list),
+                (kayit['ticket'], ticket, ticket_list)
+            ):
+                eski = eski[eski['birim'].isin(kalan)]
+                yeni_kayitlar = yeni_kayitlar[yeni_kayitlar['tur'] == tur].drop(columns='tur')
+                birlesik = pd.concat([p for p in (eski, yeni_kayitlar) if len(p)] or [yeni_kayitlar], ignore_index=True)
+                birlesik['yerel'] = birlesik['yerel'].astype(np.int64)
+                birlesik['sira'] = bas.reindex(birlesik['birim']).to_numpy() + birlesik['yerel'].to_numpy()
+                liste.append(birlesik.assign(tur=tur))
+                parcalar.append(birlesik.drop(columns='sira'))
+            
+            # Sonuç satırları CM sütunları doldurulduktan sonra analiz_yap'ta eklenir
+            durum.turler[tur] = {
+                'birimler': birimler, 'sonuc': None,
+                'ortak_w': parcalar[1][AnalizDurumu.ORTAK_W_SUTUNLARI],
+                'ticket': parcalar[2][AnalizDurumu.TICKET_SUTUNLARI]
             }
-            oms_ticket_ids = self.cm_islemleri.cagri_ticket_idlerini_bul(
-                oncesi_kesintiler, sonrasi_kesintiler, kesinti_zamanlar
-            )
         
-        kesinti_noktalivirgul = ";".join(str(x['KesintiNo']) for x in elemanlar)
-        zamanlar = "\n".join([
-            f"{i + 1}) {x['KesintiNo']} [{x['Kademe']}] "
-            f"{x['Baslama'].strftime('%d.%m.%Y %H:%M:%S')} → {x['Bitis'].strftime('%d.%m.%Y %H:%M:%S')}"
-            for i, x in enumerate(elemanlar)
+        ortak_w = pd.concat(ortak_w_list, ignore_index=True)
+        self._ortak_w_bekleyenler = list(zip(ortak_w['sira'].tolist(), ortak_w['kesinti'].tolist()))
+        ticket = pd.concat(ticket_list, ignore_index=True)
+        self._ticket_bekleyenler = list(zip(
+            ticket['sira'].tolist(), ticket['yon'].tolist(), ticket['kesinti'].tolist(),
+            ticket['baslama'].tolist(), ticket['bitis'].tolist()
+        ))
+        
+        df_sonuc = pd.concat(sonuc_list, ignore_index=True)
+        df_sonuc.index = pd.Index(df_sonuc['sira'].to_numpy(dtype=np.int64))
+        return df_sonuc.drop(columns='sira').sort_index()
+    
+    @staticmethod
+    def tarama_izgarasi(kritik_saatler, tolerans_ustu_listesi, tolerans_alti_listesi):
+        """
+        Tolerans değer listelerinin tüm kombinasyonlarını oluştur.
+        
+        Args:
+            kritik_saatler: Kritik süre (saat) değerleri
+            tolerans_ustu_listesi: Kritik süre üstü tolerans (dk) değerleri
+            tolerans_alti_listesi: Kritik süre altı tolerans (dk) değerleri
+            
+        Returns:
+            list: tolerans_ayarlari sözlükleri
+        """
+        return [
+            {'kritik_saat': kritik, 'tolerans_ustu_dk': ustu, 'tolerans_alti_dk': alti}
+            for kritik in kritik_saatler
+            for ustu in tolerans_ustu_listesi
+            for alti in tolerans_alti_listesi
+        ]
+    
+    def tolerans_taramasi(self, excel_yolu, ayar_listesi, ilerleme=None):
+        """
+        Birden çok tolerans ayarını tek okuma ve tek sıralama ile karşılaştır.
+        
+        Veri bir kez okunup (SebekeUnsuru, Baslama) ve TM bazında sıralanır;
+        her ayar için yalnızca zincir kırılmaları sıralı başlama/bitiş ve
+        süre dizileri üzerinde yeniden hesaplanır. Sonuç satırları
+        oluşturulmaz; seçilen ayar aynı nesne ile analiz_yap'a verildiğinde
+        okuma ve sıralama tekrarlanmaz.
+        
+        Args:
+            excel_yolu: Kesinti Excel dosyasının yolu
+            ayar_listesi: tolerans_ayarlari sözlükleri (bkz. tarama_izgarasi)
+            ilerleme: Opsiyonel Ilerleme nesnesi (TARAMA_ILERLEME_ASAMALARI ile)
+            
+        Returns:
+            DataFrame: Ayar başına zincir sayısı, zincirlenen kesinti sayısı
+            ve toplam birleşik süre (analiz_yap sonucundaki satırlara göre)
+        """
+        self.ilerleme = ilerleme
+        df = self._veriyi_hazirla(excel_yolu)
+        
+        with profil.asama('tarama.hazirlik', len(df)):
+            diziler = self._tarama_dizileri(df)
+        
+        onceki_ayarlar = getattr(self, 'tolerans_ayarlari', None)
+        satirlar = []
+        try:
+            with profil.asama('tarama.ayarlar', len(ayar_listesi)):
+                for k, ayarlar in enumerate(ayar_listesi):
+                    self._ilerleme_bildir('tarama', k / len(ayar_listesi))
+                    self.tolerans_ayarlari = ayarlar
+                    satirlar.append({**ayarlar, **self._tarama_olc(diziler)})
+        finally:
+            self.tolerans_ayarlari = onceki_ayarlar
+        self._ilerleme_bildir('tarama', 1.0, zorla=True)
+        
+        print(f"✓ Tolerans taraması: {len(ayar_listesi)} ayar karşılaştırıldı")
+        return pd.DataFrame(satirlar, columns=[
+            'kritik_saat', 'tolerans_ustu_dk', 'tolerans_alti_dk',
+            'Grup Sayısı', 'İlgili Kesinti Sayısı', 'Toplam Birleşik Süre', 'Toplam Birleşik Süre (saat)'
         ])
+    
+    def _tarama_dizileri(self, df):
+        """
+        Taramada her ayar için kullanılan, toleranstan bağımsız sıralı diziler.
         
-        # Ortak W değerlerini hesapla (CM varsa)
-        ortak_w_degerleri = ""
-        if self.cm_islemleri:
-            kesinti_id_listesi = [x['KesintiNo'] for x in elemanlar]
-            ortak_w_degerleri = self.cm_islemleri.ortak_w_degerlerini_bul(kesinti_id_listesi)
-        
-        # Kademe ve Kaynağa Göre bilgisini al (ilk elemandan)
-        kademe = elemanlar[0].get('Kademe', '') if elemanlar else ''
-        kaynaga_gore = elemanlar[0].get('KaynagaGore', '') if elemanlar else ''
-        
-        # Toplam Çağrı Sayısı (her kesintinin çağrı sayısı ; ile ayrılmış)
-        cagri_sayilari = [str(int(x.get('ToplamCagri', 0))) for x in elemanlar]
-        toplam_cagri_sayisi = "; ".join(cagri_sayilari)
-        
-        # Kesinti Seviyesi (benzersiz seviyeleri birleştir)
-        seviyeler = set()
-        for x in elemanlar:
-            seviye = str(x.get('KesijtiSeviyesi', '')).strip()
-            if seviye and seviye.lower() != 'nan':
-                seviyeler.add(seviye)
-        kesinti_seviyesi = "; ".join(sorted(seviyeler)) if seviyeler else ""
-        
-        # Dağıtım-AG için TM bazlı kesinti taraması
-        tm_kesintileri = ""
-        dagitim_ag_deger = DAGITIM_AG_AYARLARI.get('KAYNAGA_GORE_DEGER', 'Dağıtım-AG')
-        is_dagitim_ag = str(kaynaga_gore).strip() == dagitim_ag_deger
+        Args:
+            df: Temizlenmiş kesinti DataFrame'i
+            
+        Returns:
+            dict: 'unsur' ve 'tm' için sıralı dizi sözlükleri
+        """
+        if self._hazir is not None and self._hazir['df'] is df and self._hazir['tarama'] is not None:
+            return self._hazir['tarama']
+        
+        kesinti_kategorileri = pd.Index(pd.unique(df['KesintiNo']))
+        
+        def dizi_sozlugu(df_sirali, grup_kodlari):
+            return {
+                'grup': grup_kodlari,
+                'kesinti_no': df_sirali['KesintiNo'].to_numpy(),
+                'kesinti_kodu': kesinti_kategorileri.get_indexer(df_sirali['KesintiNo']),
+                'baslama': df_sirali['Baslama'].to_numpy(dtype='datetime64[ns]').view('int64'),
+                'bitis': df_sirali['Bitis'].to_numpy(dtype='datetime64[ns]').view('int64'),
+                'max_bitis': df_sirali['MaksBitis'].to_numpy(dtype='datetime64[ns]').view('int64')
+            }
         
-        if is_dagitim_ag:
-            tm_kesintileri = self._tm_bazli_kesinti_tara(elemanlar, ilk, son)
+        df_sirali, unsur_kodlari = self._unsur_sirasi(df)
+        unsur = dizi_sozlugu(df_sirali, unsur_kodlari)
+        # Kendi başlama/bitişi dışında çağrısı olan kesinti
+        # (Tekil kalan zincirler bu durumda "Tekil - ..." türüyle sonuca girer)
+        oncesi, sonrasi = self._cagri_durumlari(df_sirali)
+        unsur['cagri_disarida'] = oncesi | sonrasi
+        
+        # TM No Ard Arda: _tm_no_ardarda_analiz ile aynı filtre ve sıra
+        tm = self._tm_sirasi(df)
+        tm = {**tm, **dizi_sozlugu(tm['df'], tm['grup'])}
+        
+        diziler = {'unsur': unsur, 'tm': tm}
+        if self._hazir is not None and self._hazir['df'] is df:
+            self._hazir['tarama'] = diziler
+        return diziler
+    
+    def _tarama_olc(self, diziler):
+        """
+        Geçerli tolerans ayarı için zincir ölçülerini hesapla.
         
+        Args:
+            diziler: _tarama_dizileri sonucu
+            
+        Returns:
+            dict: Zincir sayısı, zincirlenen kesinti ve toplam birleşik süre
+        """
+        zincir_sayisi = 0
+        toplam_sure = 0
+        uye_kodlari = []
+        
+        # Şebeke unsuru zincirleri: _unsur_zincir_elemanlari'ndaki gibi iç içe ve ard arda
+        # çiftlerin kesintileri ayrı birer sonuç satırıdır; ikisi de yoksa zincir
+        # Tekil'dir ve yalnızca dışarıda çağrısı olan kesinti içeriyorsa sonuca girer
+        d = diziler['unsur']
+        n = len(d['baslama'])
+        if n > 0:
+            zincir_idleri = self._zincir_idleri_hesapla(d['grup'], d['kesinti_no'], d['baslama'], d['bitis'])
+            tolerans = self._tolerans_ns_dizisi(d['baslama'], d['bitis'])
+            ayni_zincir = zincir_idleri[1:] == zincir_idleri[:-1]
+            fark = d['baslama'][1:] - d['bitis'][:-1]
+            ciftli = np.zeros(zincir_idleri[-1] + 1, dtype=bool)
+            for cift in (ayni_zincir & (fark <= 0), ayni_zincir & (fark > 0) & (fark <= tolerans[:-1])):
+                ciftli[zincir_idleri[1:][cift]] = True
+                uye = np.zeros(n, dtype=bool)
+                uye[1:] |= cift
+                uye[:-1] |= cift
+                sayi, sure, kodlar = self._zincir_ozeti(d, np.flatnonzero(uye), zincir_idleri)
+                zincir_sayisi += sayi
+                toplam_sure += sure
+                uye_kodlari.append(kodlar)
+            
+            # Tekil zincirlerde aynı kesinti no'nun yalnızca ilk satırı eleman olur
+            anahtar = zincir_idleri * (d['kesinti_kodu'].max() + 1) + d['kesinti_kodu']
+            ilk_satir = np.zeros(n, dtype=bool)
+            ilk_satir[np.unique(anahtar, return_index=True)[1]] = True
+            tekil_eleman = ilk_satir & ~ciftli[zincir_idleri]
+            cagrili = np.zeros(len(ciftli), dtype=bool)
+            cagrili[zincir_idleri[tekil_eleman & d['cagri_disarida']]] = True
+            sayi, sure, kodlar = self._zincir_ozeti(
+                d, np.flatnonzero(tekil_eleman & cagrili[zincir_idleri]), zincir_idleri
+            )
+            zincir_sayisi += sayi
+            toplam_sure += sure
+            uye_kodlari.append(kodlar)
+        
+        # TM No Ard Arda zincirleri: en az 2 kesintili her zincir bir satırdır
+        d = diziler['tm']
+        n = len(d['baslama'])
+        if n > 1:
+            zincir_idleri = self._tm_zincir_idleri(d)
+            boyutlar = np.bincount(zincir_idleri)
+            sayi, sure, kodlar = self._zincir_ozeti(d, np.flatnonzero(boyutlar[zincir_idleri] >= 2), zincir_idleri)
+            zincir_sayisi += sayi
+            toplam_sure += sure
+            uye_kodlari.append(kodlar)
+        
+        zincirlenen = len(np.unique(np.concatenate(uye_kodlari))) if uye_kodlari else 0
+        toplam_sure = pd.Timedelta(int(toplam_sure), unit='ns')
         return {
-            'SebekeUnsuru': unsur,
-            'IN-OUT Durumu': inout_durum,
-            'BirlesikBaslama': ilk.strftime('%d.%m.%Y %H:%M:%S'),
-            'BirlesikBitis': son.strftime('%d.%m.%Y %H:%M:%S'),
-            'Süre (hh:mm:ss)': sure_str,
-            'Tur': tur_final,
-            'Ardışık Farklar (dk)': '; '.join(map(str, farklar)) if farklar else '',
-            'İlgiliKesintiler(;)': kesinti_noktalivirgul,
-            'KesintiZamanlari': zamanlar,
-            'Scada Kesintisi Oranı': scada_orani,
-            'Toplam Çağrı Sayısı': toplam_cagri_sayisi,
-            'Kesinti Seviyesi': kesinti_seviyesi,
-            'OMS Ticket IDs': oms_ticket_ids,
-            'Ortak W Değerleri': ortak_w_degerleri,
-            'TM Kesintileri': tm_kesintileri
+            'Grup Sayısı': zincir_sayisi,
+            'İlgili Kesinti Sayısı': zincirlenen,
+            'Toplam Birleşik Süre': ExcelYardimci.format_sure(toplam_sure),
+            'Toplam Birleşik Süre (saat)': round(toplam_sure.total_seconds() / 3600, 2)
         }
     
-    def _tm_no_ardarda_analiz(self, df):
+    @staticmethod
+    def _zincir_ozeti(diziler, satirlar, zincir_idleri):
         """
-        TM No bazlı ard arda analizi (Dağıtım-AG için).
+        Seçili satırları zincirlerine göre özetle.
         
-        Şebeke Unsuru farklı olsa bile aynı CBS TM No'ya sahip
-        Dağıtım-AG kesintilerini gruplar.
+        Args:
+            diziler: Sıralı dizi sözlüğü
+            satirlar: Zincir üyesi satır pozisyonları (artan)
+            zincir_idleri: Satırların zincir ID'leri
+            
+        Returns:
+            tuple: (zincir sayısı, toplam süre ns, üye kesinti kodları)
+        """
+        if len(satirlar) == 0:
+            return 0, 0, np.zeros(0, dtype=np.intp)
+        
+        zincirler = zincir_idleri[satirlar]
+        baslar = np.r_[0, np.flatnonzero(zincirler[1:] != zincirler[:-1]) + 1]
+        ilk = np.minimum.reduceat(diziler['baslama'][satirlar], baslar)
+        son = np.maximum.reduceat(diziler['max_bitis'][satirlar], baslar)
+        # Boş zamanlı zincirler sürede sayılmaz
+        nat = np.iinfo(np.int64).min
+        gecerli = (ilk != nat) & (son != nat)
+        return len(baslar), int((son[gecerli] - ilk[gecerli]).sum()), diziler['kesinti_kodu'][satirlar]
+    
+    def _tm_kirilmalari_sirali(self, kesinti_nolari, unsur_kodlari, baslama, bitis):
+        """
+        Tek bir TM için zincir kırılmalarını _tm_no_ardarda_analiz döngüsüyle
+        aynı şekilde (Timestamp/NaT karşılaştırmalarıyla) hesapla.
         
         Args:
-            df: Kesinti verilerini içeren DataFrame
+            kesinti_nolari: Kesinti numaraları (başlamaya göre sıralı)
+            unsur_kodlari: Şebeke unsuru kodları
+            baslama: Başlama zamanları (Timestamp listesi)
+            bitis: Bitiş zamanları (Timestamp listesi)
             
         Returns:
-            list: TM No Ard Arda sonuçları
+            ndarray: Kırılma maskesi
+        """
+        kritik_saat = self.tolerans_ayarlari.get('kritik_saat', 9)
+        tolerans_ustu = self.tolerans_ayarlari.get('tolerans_ustu_dk', 60)
+        tolerans_alti = self.tolerans_ayarlari.get('tolerans_alti_dk', 15)
+        
+        kirilma = np.zeros(len(baslama), dtype=bool)
+        kirilma[0] = True
+        temp = [0]
+        for i in range(1, len(baslama)):
+            if kesinti_nolari[i] == kesinti_nolari[i - 1] or unsur_kodlari[i] == unsur_kodlari[i - 1]:
+                kirilma[i] = True
+                temp = [i]
+                continue
+            
+            grup_max_bitis = max(bitis[j] for j in temp)
+            en_son_biten = max(temp, key=lambda j: bitis[j])
+            en_son_sure_saat = (bitis[en_son_biten] - baslama[en_son_biten]).total_seconds() / 3600
+            tolerans = tolerans_ustu if en_son_sure_saat >= kritik_saat else tolerans_alti
+            fark_dakika = (baslama[i] - grup_max_bitis).total_seconds() / 60
+            
+            if fark_dakika <= 0 or (0 < fark_dakika <= tolerans):
+                temp.append(i)
+            else:
+                kirilma[i] = True
+                temp = [i]
+        
+        return kirilma
+    
+    def _paralel_isle(self, is_adi, birimler, agirliklar, asama):
         """
+        Birimleri (ardışık zincir blokları) süreç havuzunda işle.
+        
+        Birimler satır sayısına göre dengeli bölümlere ayrılır (en uzun iş
+        önce, en az yüklü bölüme). Sonuçlar ve toplu Ortak W / OMS ticket
+        kayıtları birim sırasıyla birleştirilir; çıktı seri çalışmayla aynıdır.
+        
+        Args:
+            is_adi: Her birim için çağrılacak metodun adı
+            birimler: Metoda verilecek argüman demetleri
+            agirliklar: Birimlerin satır sayıları
+            asama: İlerleme aşaması
+            
+        Returns:
+            list: Birim sırasıyla sonuç tabloları
+        """
+        global _ISCI_ANALIZ
+        
+        isci_sayisi = min(self._isci_sayisi, len(birimler))
+        parcalar = self._parcalara_bol(agirliklar, min(len(birimler), isci_sayisi * 4))
+        
+        if 'fork' in multiprocessing.get_all_start_methods() and sys.platform != 'darwin':
+            ctx = multiprocessing.get_context('fork')
+            _ISCI_ANALIZ = (self, is_adi, birimler)
+            baslatici_args = (None, profil.aktif)
+        else:
+            ctx = multiprocessing.get_context('spawn')
+            baslatici_args = ((self, is_adi, birimler), profil.aktif)
+        
+        sonuclar = [None] * len(birimler)
+        try:
+            with ctx.Pool(isci_sayisi, initializer=_analiz_isci_baslat, initargs=baslatici_args) as havuz:
+                for k, (parca_sonuclari, profil_kayitlari) in enumerate(
+                    havuz.imap_unordered(_analiz_isci_parca_isle, parcalar), 1
+                ):
+                    profil.birlestir(profil_kayitlari)
+                    for i, *birim_sonucu in parca_sonuclari:
+                        sonuclar[i] = birim_sonucu
+                    self._ilerleme_bildir(asama, k / len(parcalar))
+        finally:
+            _ISCI_ANALIZ = None
+        
         sonuc_list = []
+        for birim_sonuclari, ortak_w_bekleyenler, ticket_bekleyenler in sonuclar:
+            sonuc_list.extend(birim_sonuclari)
+            self._ortak_w_bekleyenler.extend(ortak_w_bekleyenler)
+            self._ticket_bekleyenler.extend(ticket_bekleyenler)
+        return sonuc_list
+    
+    @staticmethod
+    def _parcalara_bol(agirliklar, parca_sayisi):
+        """
+        Birimleri ağırlıkları dengeli bölümlere ayır (LPT: en ağır birim önce,
+        o anda en az yüklü bölüme).
         
-        # Dağıtım-AG olanları filtrele
-        dagitim_ag_deger = DAGITIM_AG_AYARLARI.get('KAYNAGA_GORE_DEGER', 'Dağıtım-AG')
-        df_dagitim = df[df['KaynagaGore'].astype(str).str.strip() == dagitim_ag_deger].copy()
+        Args:
+            agirliklar: Birim ağırlıkları (satır sayısı)
+            parca_sayisi: Bölüm sayısı
+            
+        Returns:
+            list: Her bölüm için artan sıralı birim indeksleri
+        """
+        yukler = [(0, p) for p in range(parca_sayisi)]
+        parcalar = [[] for _ in range(parca_sayisi)]
+        for i in np.argsort(-np.asarray(agirliklar), kind='stable'):
+            yuk, p = heapq.heappop(yukler)
+            parcalar[p].append(int(i))
+            heapq.heappush(yukler, (yuk + agirliklar[i], p))
+        return [sorted(parca) for parca in parcalar if parca]
+    
+    def _ilerleme_bildir(self, asama, oran, zorla=False):
+        """İlerleme nesnesi varsa aşama ilerlemesini bildir (iptal kontrolü dahil)"""
+        if self.ilerleme is not None:
+            self.ilerleme.guncelle(asama, oran, zorla=zorla)
+    
+    def _veriyi_hazirla(self, excel_yolu):
+        """
+        Kesinti dosyasını oku, temizle; CM'yi ve TM index'ini hazırla.
+        
+        Aynı dosya (ve CM) değişmeden tekrar istenirse hazır veri kullanılır;
+        böylece tolerans taramasından sonra seçilen ayarla analiz okuma ve
+        sıralamayı tekrarlamaz.
+        
+        Args:
+            excel_yolu: Kesinti Excel dosyasının yolu
+            
+        Returns:
+            DataFrame: Temizlenmiş kesinti verisi
+        """
+        cm_dosya_yolu = (
+            TabloOkuyucu.dosya_bul(os.path.dirname(excel_yolu), "CM")
+            or os.path.join(os.path.dirname(excel_yolu), "CM.xlsx")
+        )
+        imza = (self._dosya_imzasi(excel_yolu), self._dosya_imzasi(cm_dosya_yolu))
+        if self._hazir is not None and self._hazir['imza'] == imza:
+            self._ilerleme_bildir('hazirlik', 1.0, zorla=True)
+            return self._hazir['df']
+        
+        self._ilerleme_bildir('okuma', 0.0)
+        # Excel dosyasını oku (yalnızca KESINTI_SUTUNLARI; kategorik sütunlar category olarak)
+        with profil.asama('analiz.okuma') as a:
+            df_full = ExcelYardimci.excel_oku(
+                excel_yolu,
+                header=3,
+                usecols=list(KESINTI_SUTUNLARI.values()),
+                dtype={KESINTI_SUTUNLARI[anahtar]: 'category' for anahtar in KESINTI_SEMASI['KATEGORIK']}
+            )
+            a.adet = len(df_full)
+        self._ilerleme_bildir('okuma', 0.6)
+        
+        # CM.xlsx dosyasını yükle
+        if os.path.exists(cm_dosya_yolu):
+            self.cm_islemleri = CMIslemleri(cm_dosya_yolu, self.veri_deposu)
+        else:
+            print(f"✗ CM.xlsx dosyası bulunamadı: {cm_dosya_yolu}")
+            self.cm_islemleri = None
+        
+        self._ilerleme_bildir('hazirlik', 0.0, zorla=True)
+        
+        with profil.asama('analiz.hazirlik') as a:
+            # Sütunları config sırasına dizip iç adlarla adlandır
+            df = df_full[list(KESINTI_SUTUNLARI.values())].copy()
+            df.columns = [self.IC_SUTUN_ADLARI[anahtar] for anahtar in KESINTI_SUTUNLARI]
+            
+            # Veri temizleme
+            df = df.dropna(subset=['KesintiNo', 'SebekeUnsuru', 'Baslama', 'Bitis'])
+            for anahtar in KESINTI_SEMASI['TARIH']:
+                sutun = self.IC_SUTUN_ADLARI[anahtar]
+                df[sutun] = pd.to_datetime(df[sutun], errors='coerce', dayfirst=True)
+            # Kesinti No float okunduysa (boş satırlar yüzünden) "5000001.0"
+            # yerine "5000001" yazılır: grup klasör adları ve CM/table
+            # aramaları tam sayı metniyle yapılır
+            for anahtar in KESINTI_SEMASI['TAM_SAYI']:
+                sutun = self.IC_SUTUN_ADLARI[anahtar]
+                sayilar = pd.to_numeric(df[sutun], errors='coerce')
+                if sayilar.notna().all() and (sayilar % 1 == 0).all():
+                    df[sutun] = sayilar.astype('int64')
+            df['ScadaKesintisi'] = df['ScadaKesintisi'].fillna('')
+            df['CBSTMNo'] = df['CBSTMNo'].fillna('').astype(str)
+            # Temiz TM no (kategorik) ve Dağıtım-AG maskesi bir kez hesaplanır;
+            # TM index, TM No Ard Arda ve TM bazlı tarama bu sütunları okur
+            df['TMNo'] = self._tm_no_kategorik(df['CBSTMNo'])
+            df['DagitimAG'] = self._dagitim_ag_maskesi(df['KaynagaGore'])
+            df['ToplamCagri'] = pd.to_numeric(df['ToplamCagri'], errors='coerce').fillna(0).astype(int)
+            df['KesijtiSeviyesi'] = df['KesijtiSeviyesi'].fillna('').astype(str)
+            
+            # TM bazlı tarama için tüm kesintileri sakla
+            self.df_tum_kesintiler = df.copy()
+            
+            # TM bazlı index oluştur (hızlı arama için)
+            self._tm_index_olustur()
+            
+            # Her kesinti no için maksimum bitiş zamanı (tüm kademeleri)
+            df['MaksBitis'] = df.groupby('KesintiNo')['Bitis'].transform('max')
+            a.adet = len(df)
+        
+        self._hazir = {'imza': imza, 'df': df, 'sirali': None, 'tarama': None, 'tm': None}
+        return df
+    
+    @staticmethod
+    def _dosya_imzasi(dosya_yolu):
+        """Dosyanın (yol, boyut, değişiklik zamanı) imzası; dosya yoksa None"""
+        try:
+            bilgi = os.stat(dosya_yolu)
+        except OSError:
+            return None
+        return os.path.abspath(dosya_yolu), bilgi.st_size, bilgi.st_mtime_ns
+    
+    def _zincirleri_belirle(self, df):
+        """
+        Kesintileri (SebekeUnsuru, Baslama) sırasına dizip zincir ID'lerini ata.
         
-        if df_dagitim.empty:
-            return sonuc_list
+        Sıralı diziler üzerinde her şebeke unsuru için Bitis'in kümülatif
+        maksimumu ve en son biten kesintinin süresine bağlı tolerans hesaplanır;
+        zincir kırılmaları kümülatif toplam ile zincir ID'lerine çevrilir.
         
-        # TM numaralarını temizle
-        df_dagitim['CBSTMNoTemiz'] = df_dagitim['CBSTMNo'].apply(self._tm_no_temizle)
+        Args:
+            df: Temizlenmiş kesinti DataFrame'i
+            
+        Returns:
+            tuple: (sıralı DataFrame, zincir ID dizisi)
+        """
+        df_sirali, unsur_kodlari = self._unsur_sirasi(df)
+        zincir_idleri = self._zincir_idleri_hesapla(
+            unsur_kodlari,
+            df_sirali['KesintiNo'].to_numpy(),
+            df_sirali['Baslama'].to_numpy(dtype='datetime64[ns]').view('int64'),
+            df_sirali['Bitis'].to_numpy(dtype='datetime64[ns]').view('int64')
+        )
+        return df_sirali, zincir_idleri
+    
+    def _unsur_sirasi(self, df):
+        """
+        Kesintileri (SebekeUnsuru, Baslama) sırasına diz (toleranstan bağımsız,
+        hazır veri için bir kez hesaplanır).
         
-        # Boş TM'leri çıkar
-        df_dagitim = df_dagitim[df_dagitim['CBSTMNoTemiz'] != '']
+        Args:
+            df: Temizlenmiş kesinti DataFrame'i
+            
+        Returns:
+            tuple: (sıralı DataFrame, sıralı unsur kodları)
+        """
+        if self._hazir is not None and self._hazir['df'] is df and self._hazir['sirali'] is not None:
+            return self._hazir['sirali']
+        
+        unsur_kodlari, _ = pd.factorize(df['SebekeUnsuru'], sort=True)
+        baslama = df['Baslama'].to_numpy(dtype='datetime64[ns]').view('int64')
+        bos = baslama == np.iinfo(np.int64).min
+        # NaT'ler (sort_values gibi) her unsurun sonuna, orijinal sırayla
+        sira = np.lexsort((baslama, bos, unsur_kodlari))
+        self._esit_baslamalari_sirala(sira, unsur_kodlari, baslama, bos)
+        
+        sirali = (df.iloc[sira].reset_index(drop=True), unsur_kodlari[sira])
+        if self._hazir is not None and self._hazir['df'] is df:
+            self._hazir['sirali'] = sirali
+        return sirali
+    
+    def _esit_baslamalari_sirala(self, sira, unsur_kodlari, baslama, bos):
+        """
+        Aynı başlama zamanlı kesintisi olan unsurların sırasını yerinde düzelt.
         
-        if df_dagitim.empty:
-            return sonuc_list
+        Eşit başlamalar arasındaki sıra zincir kırılmalarını etkiler. Bu
+        unsurlar, grup bazlı sort_values('Baslama') ile aynı sonucu vermek
+        için orijinal satır sırasında quicksort ile yeniden sıralanır.
         
-        print(f"✓ TM No Ard Arda analizi: {len(df_dagitim)} Dağıtım-AG kesintisi")
+        Args:
+            sira: (unsur, başlama) sıralama indeksi (yerinde güncellenir)
+            unsur_kodlari: Unsur kodları (orijinal sırada)
+            baslama: Başlama zamanları (int64 ns, orijinal sırada)
+            bos: Başlama NaT maskesi (orijinal sırada)
+        """
+        k = unsur_kodlari[sira]
+        b = baslama[sira]
+        gecerli = ~bos[sira]
+        esit = (k[1:] == k[:-1]) & (b[1:] == b[:-1]) & gecerli[1:] & gecerli[:-1]
+        if not esit.any():
+            return
         
-        # Tolerans ayarlarını al
+        for kod in np.unique(k[1:][esit]):
+            bas = np.searchsorted(k, kod, side='left')
+            bit = np.searchsorted(k, kod, side='right')
+            satirlar = np.sort(sira[bas:bit])
+            maske = bos[satirlar]
+            dolu = satirlar[~maske]
+            sira[bas:bit] = np.concatenate([
+                # datetime64 üzerinde (int64 değil): numpy ikisini farklı algoritmayla sıralar
+                dolu[baslama[dolu].view('datetime64[ns]').argsort(kind='quicksort')],
+                satirlar[maske]
+            ])
+    
+    def _tolerans_ns_dizisi(self, baslama, bitis):
+        """Her kesintinin süresine göre toleransı nanosaniye dizisi olarak hesapla."""
         kritik_saat = self.tolerans_ayarlari.get('kritik_saat', 9)
         tolerans_ustu = self.tolerans_ayarlari.get('tolerans_ustu_dk', 60)
         tolerans_alti = self.tolerans_ayarlari.get('tolerans_alti_dk', 15)
         
-        # CBS TM No'ya göre grupla
-        for tm_no, tm_grup in df_dagitim.groupby('CBSTMNoTemiz'):
-            if len(tm_grup) < 2:
-                continue  # En az 2 kesinti olmalı
-            
-            # Başlama zamanına göre sırala
-            tm_grup = tm_grup.sort_values('Baslama').reset_index(drop=True)
-            
-            # Ard arda grupları bul
-            temp = [tm_grup.iloc[0].to_dict()]
+        sure_saat = (bitis - baslama) / 1e9 / 3600
+        return np.where(
+            sure_saat >= kritik_saat,
+            pd.Timedelta(timedelta(minutes=tolerans_ustu)).value,
+            pd.Timedelta(timedelta(minutes=tolerans_alti)).value
+        )
+    
+    def _zincir_idleri_hesapla(self, grup_kodlari, kesinti_nolari, baslama, bitis, ek_kirilma=None):
+        """
+        Sıralı diziler üzerinde sweep-line ile zincir ID'lerini hesapla.
+        
+        Kurallar eski satır satır döngü ile aynıdır: grup değişimi ve önceki
+        satırla aynı kesinti no zinciri keser; aksi halde başlama, zincirin
+        maksimum bitişinden önceyse (iç içe) veya en son biten kesintinin
+        toleransı içindeyse (ard arda) zincire eklenir. Başlama/bitişi
+        boş (NaT) olan satırlar tek başına kalır.
+        
+        Args:
+            grup_kodlari: Grup (şebeke unsuru) kodları
+            kesinti_nolari: Kesinti numaraları
+            baslama: Başlama zamanları (int64 ns)
+            bitis: Bitiş zamanları (int64 ns)
+            ek_kirilma: Opsiyonel, zinciri ayrıca kesen satırların maskesi
             
-            for i in range(1, len(tm_grup)):
-                simdiki = tm_grup.iloc[i].to_dict()
-                
-                # Aynı kesinti no'yu atla
-                if simdiki['KesintiNo'] == temp[-1]['KesintiNo']:
-                    sonuc_list.extend(self._tm_zincir_olustur(temp, tm_no))
-                    temp = [simdiki]
-                    continue
-                
-                # Aynı Şebeke Unsuru varsa atla (normal analiz kapsar)
-                if simdiki['SebekeUnsuru'] == temp[-1]['SebekeUnsuru']:
-                    sonuc_list.extend(self._tm_zincir_olustur(temp, tm_no))
-                    temp = [simdiki]
-                    continue
-                
-                # Gruptaki TÜM kesintilerin maksimum bitiş zamanını bul
-                grup_max_bitis = max(x['Bitis'] for x in temp)
-                
-                # En son biten kesinti (tolerans hesabı için)
-                en_son_biten = max(temp, key=lambda x: x['Bitis'])
-                
-                # Kesinti süresini hesapla (en son biten)
-                en_son_sure_saat = (en_son_biten['Bitis'] - en_son_biten['Baslama']).total_seconds() / 3600
-                
-                # Toleransı belirle
-                if en_son_sure_saat >= kritik_saat:
-                    tolerans = tolerans_ustu
-                else:
-                    tolerans = tolerans_alti
-                
-                # Fark hesapla (grup maksimum bitişe göre)
-                fark_dakika = (simdiki['Baslama'] - grup_max_bitis).total_seconds() / 60
-                
-                # İç içe (fark <= 0) veya ard arda (0 < fark <= tolerans)
-                if fark_dakika <= 0 or (0 < fark_dakika <= tolerans):
-                    temp.append(simdiki)
-                else:
-                    sonuc_list.extend(self._tm_zincir_olustur(temp, tm_no))
-                    temp = [simdiki]
-            
-            # Son grubu ekle
-            sonuc_list.extend(self._tm_zincir_olustur(temp, tm_no))
+        Returns:
+            ndarray: Her satırın zincir ID'si
+        """
+        n = len(baslama)
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+        
+        nat = np.iinfo(np.int64).min
+        gecersiz = (baslama == nat) | (bitis == nat)
+        tolerans = self._tolerans_ns_dizisi(baslama, bitis)
+        
+        # Kesin kırılmalar: grup değişimi, aynı kesinti no, NaT satırlar
+        sert = np.ones(n, dtype=bool)
+        sert[1:] = ((grup_kodlari[1:] != grup_kodlari[:-1])
+                    | (kesinti_nolari[1:] == kesinti_nolari[:-1])
+                    | gecersiz[1:] | gecersiz[:-1])
+        if ek_kirilma is not None:
+            sert |= ek_kirilma
+        segment = np.cumsum(sert) - 1
+        
+        # Segment içinde Bitis'in kümülatif maksimumu ve onu veren ilk satır
+        kum_max = pd.Series(bitis).groupby(segment).cummax().to_numpy()
+        yeni_max = sert.copy()
+        yeni_max[1:] |= bitis[1:] > kum_max[:-1]
+        en_son_biten = np.maximum.accumulate(np.where(yeni_max, np.arange(n), 0))
+        
+        kirilma = sert.copy()
+        onceki_max = kum_max[:-1]
+        fark = baslama[1:] - onceki_max
+        ekle = (baslama[1:] <= onceki_max) | (fark <= tolerans[en_son_biten[:-1]])
+        kirilma[1:] |= ~ekle
+        
+        # Negatif süreli kesinti veya negatif tolerans içeren segmentlerde
+        # segment maksimumu zincir maksimumundan farklı olabilir, sırayla işle
+        supheli = ~gecersiz & (bitis < baslama)
+        if (tolerans < 0).any():
+            supheli[:] = True
+        if supheli.any():
+            for seg in np.unique(segment[supheli]):
+                idx = np.flatnonzero(segment == seg)
+                kirilma[idx] = self._zincir_kirilmalari_sirali(
+                    baslama[idx], bitis[idx], tolerans[idx]
+                )
         
-        return sonuc_list
+        return np.cumsum(kirilma) - 1
     
-    def _tm_zincir_olustur(self, temp, tm_no):
-        """TM No Ard Arda zinciri oluştur."""
-        if len(temp) < 2:
-            return []  # Tek eleman zincir sayılmaz
+    def _zincir_kirilmalari_sirali(self, baslama, bitis, tolerans):
+        """Tek bir segment için zincir kırılmalarını satır satır hesapla."""
+        kirilma = np.zeros(len(baslama), dtype=bool)
+        kirilma[0] = True
+        grup_max_bitis = bitis[0]
+        en_son_biten = 0
+        
+        for i in range(1, len(baslama)):
+            if baslama[i] <= grup_max_bitis or baslama[i] - grup_max_bitis <= tolerans[en_son_biten]:
+                if bitis[i] > grup_max_bitis:
+                    grup_max_bitis = bitis[i]
+                    en_son_biten = i
+            else:
+                kirilma[i] = True
+                grup_max_bitis = bitis[i]
+                en_son_biten = i
         
-        elemanlar = temp
-        elemanlar.sort(key=lambda x: x['Baslama'])
+        return kirilma
+    
+    def _unsur_zincir_elemanlari(self, df_sirali, zincir_idleri):
+        """
+        Şebeke unsuru zincirlerini sonuç satırlarına ve elemanlarına ayır.
         
-        # Farkları hesapla
-        farklar = []
-        for i in range(1, len(elemanlar)):
-            fark = (elemanlar[i]['Baslama'] - elemanlar[i-1]['Bitis']).total_seconds() / 60
-            farklar.append(round(fark, 1))
+        Zincirdeki ardışık kesinti çiftleri iç içe (fark <= 0) veya ard arda
+        (0 < fark <= önceki kesintinin toleransı) olarak sınıflanır; iki tür
+        de varsa zincir iki sonuç satırı verir. Çifti olmayan zincirler
+        Tekil'dir ve yalnızca kendi sınırları dışında çağrısı olan kesinti
+        içeriyorsa ("Tekil - ..." türüyle) sonuca girer. Bir sonuç satırında
+        aynı kesinti no'nun yalnızca ilk kaydı eleman olur.
         
-        # En erken başlama ve en geç bitiş
-        ilk = min(x['Baslama'] for x in elemanlar)
-        son = max(x['Bitis'] for x in elemanlar)
+        Args:
+            df_sirali: (SebekeUnsuru, Baslama) sıralı kesintiler
+            zincir_idleri: Satırların zincir ID'leri
+            
+        Returns:
+            tuple: (eleman satırları DataFrame'i, elemanların zincir numaraları,
+                    zincir bilgileri DataFrame'i, şebeke unsuru başına Tekil'ler
+                    dahil sonuç satırı sayısı (Series, unsur sırasıyla))
+        """
+        n = len(df_sirali)
+        if n == 0:
+            return (df_sirali, np.zeros(0, dtype=np.intp), pd.DataFrame(columns=self.ZINCIR_BILGI_SUTUNLARI),
+                    pd.Series(dtype=np.int64))
+            
+        baslama = df_sirali['Baslama'].to_numpy(dtype='datetime64[ns]').view('int64')
+        bitis = df_sirali['Bitis'].to_numpy(dtype='datetime64[ns]').view('int64')
+        tolerans = self._tolerans_ns_dizisi(baslama, bitis)
+        zincir_sayisi = zincir_idleri[-1] + 1
+        ilk_satirlar = np.flatnonzero(np.r_[True, zincir_idleri[1:] != zincir_idleri[:-1]])
+        
+        ayni_zincir = zincir_idleri[1:] == zincir_idleri[:-1]
+        fark = baslama[1:] - bitis[:-1]
+        icice_cift = ayni_zincir & (fark <= 0)
+        ardarda_cift = ayni_zincir & (fark > 0) & (fark <= tolerans[:-1])
+        icice_var = np.zeros(zincir_sayisi, dtype=bool)
+        icice_var[zincir_idleri[1:][icice_cift]] = True
+        ardarda_var = np.zeros(zincir_sayisi, dtype=bool)
+        ardarda_var[zincir_idleri[1:][ardarda_cift]] = True
+        
+        # Zincir başına sonuç satırı sayısı ve ilk satırın sırası (Tekil de bir satır sayılır)
+        satir_sayisi = np.maximum(icice_var.astype(np.int64) + ardarda_var, 1)
+        ilk_sira = np.cumsum(satir_sayisi) - satir_sayisi
+        
+        kesinti_kodu = pd.factorize(df_sirali['KesintiNo'])[0]
+        anahtar = zincir_idleri * (kesinti_kodu.max() + 1) + kesinti_kodu
+        
+        def ilk_kayitlar(secim):
+            satirlar = np.flatnonzero(secim)
+            return np.sort(satirlar[np.unique(anahtar[satirlar], return_index=True)[1]])
+            
+        satir_listesi, sira_listesi = [], []
+        for cift, siralar in ((icice_cift, ilk_sira), (ardarda_cift, ilk_sira + icice_var)):
+            uye = np.zeros(n, dtype=bool)
+            uye[1:] |= cift
+            uye[:-1] |= cift
+            satirlar = ilk_kayitlar(uye)
+            satir_listesi.append(satirlar)
+            sira_listesi.append(siralar[zincir_idleri[satirlar]])
+            
+        tekil_satirlar = ilk_kayitlar(~(icice_var | ardarda_var)[zincir_idleri])
+        oncesi, sonrasi = self._cagri_durumlari(df_sirali.iloc[tekil_satirlar])
+        cagrili = np.zeros(zincir_sayisi, dtype=bool)
+        cagrili[zincir_idleri[tekil_satirlar][oncesi | sonrasi]] = True
+        tekil_satirlar = tekil_satirlar[cagrili[zincir_idleri[tekil_satirlar]]]
+        satir_listesi.append(tekil_satirlar)
+        sira_listesi.append(ilk_sira[zincir_idleri[tekil_satirlar]])
+        
+        satirlar = np.concatenate(satir_listesi)
+        siralar = np.concatenate(sira_listesi)
+        duzen = np.lexsort((satirlar, siralar))
+        satirlar = satirlar[duzen]
+        zincir_nolari = np.unique(siralar[duzen], return_inverse=True)[1]
+        
+        # Ard arda satırlarının farkları (çiftler zincir sırasıyla)
+        ardarda_ciftleri = np.flatnonzero(ardarda_cift)
+        ardarda_zincirleri = zincir_idleri[1:][ardarda_ciftleri]
+        farklar = self._grup_birlestir(
+            self._fark_metinleri(fark[ardarda_ciftleri]),
+            np.flatnonzero(np.r_[True, ardarda_zincirleri[1:] != ardarda_zincirleri[:-1]]),
+            '; '
+        )
+        
+        turler = (('İç içe', icice_var, ilk_sira), ('Ard arda', ardarda_var, ilk_sira + icice_var), ('Tekil', cagrili, ilk_sira))
+        zincirler = [np.flatnonzero(var) for _, var, _ in turler]
+        sira = np.concatenate([siralar[z] for z, (_, _, siralar) in zip(zincirler, turler)])
+        duzen = np.argsort(sira, kind='stable')
+        unsurlar = df_sirali['SebekeUnsuru'].to_numpy(dtype=object)[ilk_satirlar]
+        df_zincirler = pd.DataFrame({
+            'sira': sira[duzen],
+            'SebekeUnsuru': unsurlar[np.concatenate(zincirler)][duzen],
+            'Tur': np.repeat([tur for tur, _, _ in turler], [len(z) for z in zincirler]).astype(object)[duzen],
+            'Ardışık Farklar (dk)': np.concatenate([
+                np.full(len(zincirler[0]), '', dtype=object), farklar, np.full(len(zincirler[2]), '', dtype=object)
+            ])[duzen]
+        })
+        unsur_sayilari = pd.Series(satir_sayisi).groupby(unsurlar, sort=False).sum()
+        return df_sirali.iloc[satirlar], zincir_nolari, df_zincirler, unsur_sayilari
+    
+    def _tm_no_ardarda_analiz(self, df, ilk_sira):
+        """
+        TM No bazlı ard arda analizi (Dağıtım-AG için).
         
-        # Her kesinti için maksimum bitiş zamanını kullan
-        if self.kesinti_max_bitis:
-            max_bitis_list = [self.kesinti_max_bitis.get(x['KesintiNo'], x['Bitis']) for x in elemanlar]
-            son = max(max_bitis_list)
+        Şebeke Unsuru farklı olsa bile aynı CBS TM No'ya sahip
+        Dağıtım-AG kesintilerini gruplar. En az 2 kesintili her zincir
+        bir sonuç satırıdır.
         
-        sure_str = ExcelYardimci.format_sure(son - ilk)
+        Args:
+            df: Kesinti verilerini içeren DataFrame
+            ilk_sira: İlk TM zinciri satırının sonuçtaki sırası
+            
+        Returns:
+            tuple: (TM No Ard Arda sonuç DataFrame'leri, TM başına zincir sayısı
+                    (Series, TM sırasıyla))
+        """
+        tm_sayilari = pd.Series(dtype=np.int64)
+        d = self._tm_sirasi(df)
+        if len(d['baslama']) < 2:
+            return [], tm_sayilari
+            
+        zincir_idleri = self._tm_zincir_idleri(d)
+        boyutlar = np.bincount(zincir_idleri)
+        satirlar = np.flatnonzero(boyutlar[zincir_idleri] >= 2)
+        if len(satirlar) == 0:
+            return [], tm_sayilari
+            
+        zincir_nolari = np.unique(zincir_idleri[satirlar], return_inverse=True)[1]
+        baslar = np.flatnonzero(np.r_[True, zincir_nolari[1:] != zincir_nolari[:-1]])
+        df_eleman = d['df'].iloc[satirlar]
+        
+        # Zincirdeki her ardışık çiftin farkı
+        ciftler = np.flatnonzero(zincir_nolari[1:] == zincir_nolari[:-1])
+        fark = d['baslama'][satirlar][ciftler + 1] - d['bitis'][satirlar][ciftler]
+        farklar = self._grup_birlestir(self._fark_metinleri(fark), baslar - np.arange(len(baslar)), '; ')
         
         # Şebeke Unsurları (farklı olabilir)
-        sebeke_unsurlari = list(set(x['SebekeUnsuru'] for x in elemanlar))
-        sebeke_unsuru_str = " | ".join(sebeke_unsurlari)
-        
-        # IN/OUT türü
-        inout_degerleri = {x['INOUT'] for x in elemanlar if isinstance(x['INOUT'], str)}
-        if len(inout_degerleri) == 1:
-            inout_durum = list(inout_degerleri)[0]
-        elif len(inout_degerleri) > 1:
-            inout_durum = "IN/OUT"
-        else:
-            inout_durum = "-"
+        tm_nolari = np.asarray(d['tm_nolari'], dtype=object)[d['grup'][satirlar][baslar]]
+        unsurlar = np.split(df_eleman['SebekeUnsuru'].to_numpy(dtype=object), baslar[1:])
+        zincirler = pd.DataFrame({
+            'sira': ilk_sira + np.arange(len(baslar)),
+            'SebekeUnsuru': [
+                f"TM:{tm_no} ({' | '.join(set(unsur))})" for tm_no, unsur in zip(tm_nolari, unsurlar)
+            ],
+            'Tur': "TM No Ard Arda",
+            'Ardışık Farklar (dk)': farklar
+        })
+        tm_sayilari = pd.Series(tm_nolari).value_counts(sort=False)
+        return self._sonuclari_olustur(df_eleman, zincir_nolari, zincirler, 'SebekeUnsuru', False, 'tm'), tm_sayilari
+    
+    def _tm_sirasi(self, df):
+        """
+        TM No Ard Arda için TM numarası olan Dağıtım-AG kesintilerini
+        (TM, Baslama) sırasına diz (toleranstan bağımsız, hazır veri için
+        bir kez hesaplanır).
         
-        # Scada oranı
-        toplam = len(elemanlar)
-        x_sayisi = sum(1 for x in elemanlar if str(x.get('ScadaKesintisi', '')).strip().upper() == 'X')
-        scada_orani = f"{x_sayisi}/{toplam}"
+        TM'ler sıralı, her TM kendi içinde sort_values('Baslama') ile dizilir;
+        yalnızca en az 2 kesintisi olan TM'ler alınır.
         
-        # Çağrı durumu analizi
-        cagri_durumu, oncesi_kesintiler, sonrasi_kesintiler = self._analyze_cagri_durumu(elemanlar)
-        
-        # Tür bilgisi
-        tur = "TM No Ard Arda"
-        tur_final = f"{tur} - {cagri_durumu}" if cagri_durumu else tur
-        
-        # OMS Ticket ID'leri
-        oms_ticket_ids = ""
-        if (oncesi_kesintiler or sonrasi_kesintiler) and self.cm_islemleri:
-            kesinti_zamanlar = {
-                elem['KesintiNo']: (
-                    elem['Baslama'],
-                    self.kesinti_max_bitis.get(elem['KesintiNo'], elem['Bitis']) if self.kesinti_max_bitis else elem['Bitis']
+        Args:
+            df: Temizlenmiş kesinti DataFrame'i
+            
+        Returns:
+            dict: Sıralı kesintiler ('df'), TM kodları ('grup'), kod başına TM no,
+                  sıralı diziler ve TM no'su olan Dağıtım-AG kesintisi sayısı
+        """
+        if self._hazir is not None and self._hazir['df'] is df and self._hazir['tm'] is not None:
+            return self._hazir['tm']
+            
+        df_dagitim = df[df['DagitimAG'].to_numpy() & (df['TMNo'].cat.codes.to_numpy() >= 0)]
+        
+        # Kategoriler sıralı TM no'lar olduğundan gruplar TM no sırasıyla gelir
+        gruplar = [
+            (tm_no, tm_grup.sort_values('Baslama'))
+            for tm_no, tm_grup in df_dagitim.groupby('TMNo', observed=True)
+            if len(tm_grup) >= 2
+        ]
+        df_tm = pd.concat([tm_grup for _, tm_grup in gruplar]) if gruplar else df_dagitim.iloc[:0]
+        tm_kodlari = np.repeat(np.arange(len(gruplar)), [len(tm_grup) for _, tm_grup in gruplar])
+        
+        tm = {
+            'df': df_tm,
+            'dagitim_sayisi': len(df_dagitim),
+            'tm_nolari': [tm_no for tm_no, _ in gruplar],
+            'grup': tm_kodlari,
+            'kesinti_no': df_tm['KesintiNo'].to_numpy(),
+            'unsur_kodu': pd.factorize(df_tm['SebekeUnsuru'])[0],
+            'baslama': df_tm['Baslama'].to_numpy(dtype='datetime64[ns]').view('int64'),
+            'bitis': df_tm['Bitis'].to_numpy(dtype='datetime64[ns]').view('int64')
+        }
+        
+        # Başlama/bitişi boş kesinti içeren TM'ler satır satır işlenir
+        nat = np.iinfo(np.int64).min
+        bos = (tm['baslama'] == nat) | (tm['bitis'] == nat)
+        tm['sirali_tm'] = [
+            (np.flatnonzero(tm_kodlari == kod), df_tm['Baslama'].iloc[tm_kodlari == kod].tolist(),
+             df_tm['Bitis'].iloc[tm_kodlari == kod].tolist())
+            for kod in np.unique(tm_kodlari[bos])
+        ]
+        
+        if self._hazir is not None and self._hazir['df'] is df:
+            self._hazir['tm'] = tm
+        return tm
+    
+    def _tm_zincir_idleri(self, d):
+        """
+        TM sıralı dizileri için zincir ID'lerini hesapla.
+        
+        _zincir_idleri_hesapla kurallarına ek olarak aynı şebeke unsurundan
+        ardışık kesinti zinciri keser (normal analiz kapsar).
+        
+        Args:
+            d: _tm_sirasi sonucu (veya aynı anahtarları içeren sözlük)
+            
+        Returns:
+            ndarray: Her satırın zincir ID'si
+        """
+        n = len(d['baslama'])
+        ek_kirilma = np.zeros(n, dtype=bool)
+        ek_kirilma[1:] = d['unsur_kodu'][1:] == d['unsur_kodu'][:-1]
+        zincir_idleri = self._zincir_idleri_hesapla(
+            d['grup'], d['kesinti_no'], d['baslama'], d['bitis'], ek_kirilma
+        )
+        if d['sirali_tm']:
+            kirilma = np.r_[True, zincir_idleri[1:] != zincir_idleri[:-1]]
+            for satirlar, baslama, bitis in d['sirali_tm']:
+                kirilma[satirlar] = self._tm_kirilmalari_sirali(
+                    d['kesinti_no'][satirlar], d['unsur_kodu'][satirlar], baslama, bitis
                 )
-                for elem in elemanlar
-            }
-            oms_ticket_ids = self.cm_islemleri.cagri_ticket_idlerini_bul(
-                oncesi_kesintiler, sonrasi_kesintiler, kesinti_zamanlar
+            zincir_idleri = np.cumsum(kirilma) - 1
+        return zincir_idleri
+    
+    def _sonuclari_olustur(self, df_eleman, zincir_nolari, zincirler, etiket_sutunu, tm_tara, asama):
+        """
+        Zincir elemanlarından sonuç satırlarını oluştur (işçi sayısı > 1 ise
+        zincir sınırlarında bölünmüş bloklar süreç havuzunda işlenir).
+        
+        Args:
+            df_eleman: Zincir elemanları (zincir sırasıyla, her zincir ardışık)
+            zincir_nolari: Elemanların zincir numaraları (0'dan artan)
+            zincirler: Zincir bilgileri (ZINCIR_BILGI_SUTUNLARI)
+            etiket_sutunu: KesintiZamanlari'nda köşeli parantez içinde yazılacak sütun
+            tm_tara: Dağıtım-AG zincirleri için TM bazlı kesinti taraması yapılsın mı
+            asama: İlerleme aşaması
+            
+        Returns:
+            list: Sonuç DataFrame'leri (sıra indeksli)
+        """
+        zincir_sayisi = len(zincirler)
+        if self._isci_sayisi > 1 and zincir_sayisi > 1:
+            baslar = np.flatnonzero(np.r_[True, zincir_nolari[1:] != zincir_nolari[:-1]])
+            sinirlar = np.r_[baslar, len(df_eleman)]
+            # Eleman sayısı dengeli, zincir sınırında kesilen bloklar
+            parca_sayisi = min(zincir_sayisi, self._isci_sayisi * 4)
+            kesimler = np.unique(np.searchsorted(baslar, np.linspace(0, len(df_eleman), parca_sayisi + 1)))
+            bloklar = list(zip(kesimler[:-1], kesimler[1:]))
+            return self._paralel_isle(
+                '_sonuc_tablosu',
+                [
+                    (df_eleman.iloc[sinirlar[z0]:sinirlar[z1]], zincir_nolari[sinirlar[z0]:sinirlar[z1]] - z0,
+                     zincirler.iloc[z0:z1], etiket_sutunu, tm_tara)
+                    for z0, z1 in bloklar
+                ],
+                [sinirlar[z1] - sinirlar[z0] for z0, z1 in bloklar],
+                asama
             )
+            
+        self._ilerleme_bildir(asama, 0.0)
+        return self._sonuc_tablosu(df_eleman, zincir_nolari, zincirler, etiket_sutunu, tm_tara)
+    
+    def _sonuc_tablosu(self, df_eleman, zincir_nolari, zincirler, etiket_sutunu, tm_tara):
+        """
+        (zincir, eleman) ataması üzerinden tüm sonuç sütunlarını hesapla.
         
-        kesinti_noktalivirgul = ";".join(str(x['KesintiNo']) for x in elemanlar)
-        zamanlar = "\n".join([
-            f"{i + 1}) {x['KesintiNo']} [{x['SebekeUnsuru']}] "
-            f"{x['Baslama'].strftime('%d.%m.%Y %H:%M:%S')} → {x['Bitis'].strftime('%d.%m.%Y %H:%M:%S')}"
-            for i, x in enumerate(elemanlar)
-        ])
+        Zincir başına değerler eleman dizileri üzerinde reduceat / benzersiz
+        (zincir, değer) çiftleriyle, metinler sütun bazında birleştirilerek
+        üretilir. Ortak W ve OMS ticket için kayıtlar sonuç sırasıyla toplu
+        işleme sırasına alınır.
+        
+        Args:
+            df_eleman: Zincir elemanları (zincir sırasıyla, her zincir ardışık)
+            zincir_nolari: Elemanların zincir numaraları (0'dan artan)
+            zincirler: Zincir bilgileri (ZINCIR_BILGI_SUTUNLARI)
+            etiket_sutunu: KesintiZamanlari'nda köşeli parantez içinde yazılacak sütun
+            tm_tara: Dağıtım-AG zincirleri için TM bazlı kesinti taraması yapılsın mı
+            
+        Returns:
+            list: Tek elemanlı, sonuç sırası indeksli DataFrame listesi
+        """
+        zincir_sayisi = len(zincirler)
+        if zincir_sayisi == 0:
+            return []
+            
+        n = len(df_eleman)
+        baslar = np.flatnonzero(np.r_[True, zincir_nolari[1:] != zincir_nolari[:-1]])
+        adet = np.diff(np.r_[baslar, n])
+        siralar = zincirler['sira'].to_numpy(dtype=np.int64)
+        
+        # En erken başlama ve kesintilerin en geç bitişi
+        ilk = np.minimum.reduceat(df_eleman['Baslama'].to_numpy(dtype='datetime64[ns]').view('int64'), baslar)
+        son = np.maximum.reduceat(df_eleman['MaksBitis'].to_numpy(dtype='datetime64[ns]').view('int64'), baslar)
+        
+        # IN/OUT türü: zincirdeki farklı metin değerleri
+        kodlar, degerler = pd.factorize(df_eleman['INOUT'])
+        degerler = np.asarray(degerler, dtype=object)
+        metin_mi = np.array([isinstance(d, str) for d in degerler], dtype=bool)
+        gecerli = kodlar >= 0
+        gecerli[gecerli] = metin_mi[kodlar[gecerli]]
+        z, k = self._zincir_benzersiz(zincir_nolari[gecerli], kodlar[gecerli])
+        deger_sayisi = np.bincount(z, minlength=zincir_sayisi)
+        inout_durum = np.full(zincir_sayisi, '-', dtype=object)
+        inout_durum[deger_sayisi > 1] = 'IN/OUT'
+        tek = deger_sayisi[z] == 1
+        inout_durum[z[tek]] = degerler[k[tek]]
+        
+        # Scada Kesintisi oranı
+        kodlar, degerler = pd.factorize(df_eleman['ScadaKesintisi'], use_na_sentinel=False)
+        x_mi = np.array([str(d).strip().upper() == 'X' for d in degerler], dtype=bool)
+        x_sayisi = np.add.reduceat(x_mi[kodlar].astype(np.int64), baslar)
+        scada_orani = x_sayisi.astype(str).astype(object) + '/' + adet.astype(str).astype(object)
         
-        # Ortak W değerleri
-        ortak_w_degerleri = ""
+        # Çağrı durumu analizi
+        oncesi, sonrasi = self._cagri_durumlari(df_eleman)
+        oncesi_var = np.logical_or.reduceat(oncesi, baslar)
+        sonrasi_var = np.logical_or.reduceat(sonrasi, baslar)
+        cagri_durumu = np.select(
+            [oncesi_var & sonrasi_var, oncesi_var, sonrasi_var],
+            ["Kesinti Öncesi ve Sonrası Çağrı", "Kesinti Öncesi Çağrı", "Kesinti Sonrası Çağrı"],
+            default=""
+        ).astype(object)
+        tur_final = zincirler['Tur'].to_numpy(dtype=object) + np.where(cagri_durumu != '', ' - ' + cagri_durumu, '')
+        
+        kesinti_metinleri = df_eleman['KesintiNo'].astype(str).to_numpy(dtype=object)
+        eleman_no = np.arange(n) - np.repeat(baslar, adet) + 1
+        zaman_satirlari = (
+            eleman_no.astype(str).astype(object) + ') ' + kesinti_metinleri
+            + ' [' + df_eleman[etiket_sutunu].astype(str).to_numpy(dtype=object) + '] '
+            + ExcelYardimci.format_tarih_dizi(df_eleman['Baslama'].to_numpy(dtype='datetime64[ns]'))
+            + ' → ' + ExcelYardimci.format_tarih_dizi(df_eleman['Bitis'].to_numpy(dtype='datetime64[ns]'))
+        )
+        
+        # Kesinti Seviyesi (zincirdeki benzersiz seviyeler, sıralı)
+        kodlar, degerler = pd.factorize(df_eleman['KesijtiSeviyesi'], use_na_sentinel=False)
+        temiz = [str(d).strip() for d in degerler]
+        seviyeler = sorted({s for s in temiz if s and s.lower() != 'nan'})
+        seviye_sirasi = {s: i for i, s in enumerate(seviyeler)}
+        seviye_kodlari = np.array([seviye_sirasi.get(s, -1) for s in temiz], dtype=np.int64)[kodlar]
+        secim = seviye_kodlari >= 0
+        z, k = self._zincir_benzersiz(zincir_nolari[secim], seviye_kodlari[secim])
+        kesinti_seviyesi = np.full(zincir_sayisi, '', dtype=object)
+        if len(z):
+            gruplar = np.flatnonzero(np.r_[True, z[1:] != z[:-1]])
+            kesinti_seviyesi[z[gruplar]] = self._grup_birlestir(np.array(seviyeler, dtype=object)[k], gruplar, '; ')
+            
+        # Dağıtım-AG için TM bazlı kesinti taraması (Kaynağa Göre ilk elemandan)
+        tm_kesintileri = np.full(zincir_sayisi, '', dtype=object)
+        if tm_tara:
+            dagitim_ag_zincirleri = np.flatnonzero(df_eleman['DagitimAG'].to_numpy()[baslar])
+            if len(dagitim_ag_zincirleri):
+                kesinti_nolari = df_eleman['KesintiNo'].to_numpy()
+                tm_kodlari = df_eleman['TMNo'].cat.codes.to_numpy()
+                for z in dagitim_ag_zincirleri:
+                    bas, bit = baslar[z], baslar[z] + adet[z]
+                    tm_kesintileri[z] = self._tm_bazli_kesinti_tara(
+                        kesinti_nolari[bas:bit], tm_kodlari[bas:bit], ilk[z], son[z]
+                    )
+                    
         if self.cm_islemleri:
-            kesinti_id_listesi = [x['KesintiNo'] for x in elemanlar]
-            ortak_w_degerleri = self.cm_islemleri.ortak_w_degerlerini_bul(kesinti_id_listesi)
-        
-        # Toplam Çağrı Sayısı (her kesintinin çağrı sayısı ; ile ayrılmış)
-        cagri_sayilari = [str(int(x.get('ToplamCagri', 0))) for x in elemanlar]
-        toplam_cagri_sayisi = "; ".join(cagri_sayilari)
-        
-        # Kesinti Seviyesi (benzersiz seviyeleri birleştir)
-        seviyeler = set()
-        for x in elemanlar:
-            seviye = str(x.get('KesijtiSeviyesi', '')).strip()
-            if seviye and seviye.lower() != 'nan':
-                seviyeler.add(seviye)
-        kesinti_seviyesi = "; ".join(sorted(seviyeler)) if seviyeler else ""
-        
-        return [{
-            'SebekeUnsuru': f"TM:{tm_no} ({sebeke_unsuru_str})",
+            self._toplu_kayitlari_ekle(df_eleman, zincir_nolari, siralar, baslar, adet,
+                                       oncesi, sonrasi, oncesi_var | sonrasi_var)
+                                       
+        return [pd.DataFrame({
+            'SebekeUnsuru': zincirler['SebekeUnsuru'].to_numpy(dtype=object),
             'IN-OUT Durumu': inout_durum,
-            'BirlesikBaslama': ilk.strftime('%d.%m.%Y %H:%M:%S'),
-            'BirlesikBitis': son.strftime('%d.%m.%Y %H:%M:%S'),
-            'Süre (hh:mm:ss)': sure_str,
+            'BirlesikBaslama': ExcelYardimci.format_tarih_dizi(ilk.view('datetime64[ns]')),
+            'BirlesikBitis': ExcelYardimci.format_tarih_dizi(son.view('datetime64[ns]')),
+            'Süre (hh:mm:ss)': ExcelYardimci.format_sure_dizi(son - ilk),
             'Tur': tur_final,
-            'Ardışık Farklar (dk)': '; '.join(map(str, farklar)) if farklar else '',
-            'İlgiliKesintiler(;)': kesinti_noktalivirgul,
-            'KesintiZamanlari': zamanlar,
+            'Ardışık Farklar (dk)': zincirler['Ardışık Farklar (dk)'].to_numpy(dtype=object),
+            'İlgiliKesintiler(;)': self._grup_birlestir(kesinti_metinleri, baslar, ';'),
+            'KesintiZamanlari': self._grup_birlestir(zaman_satirlari, baslar, '\n'),
             'Scada Kesintisi Oranı': scada_orani,
-            'Toplam Çağrı Sayısı': toplam_cagri_sayisi,
+            'Toplam Çağrı Sayısı': self._grup_birlestir(
+                df_eleman['ToplamCagri'].astype(str).to_numpy(dtype=object), baslar, '; '
+            ),
             'Kesinti Seviyesi': kesinti_seviyesi,
-            'OMS Ticket IDs': oms_ticket_ids,
-            'Ortak W Değerleri': ortak_w_degerleri,
-            'TM Kesintileri': ''  # TM No Ard Arda için bu alan boş
-        }]
+            'OMS Ticket IDs': "",  # _oms_ticket_doldur ile toplu doldurulur
+            'Ortak W Değerleri': "",  # _ortak_w_doldur ile toplu doldurulur
+            'TM Kesintileri': tm_kesintileri
+        }, index=pd.Index(siralar))]
+    
+    def _toplu_kayitlari_ekle(self, df_eleman, zincir_nolari, siralar, baslar, adet, oncesi, sonrasi, cagrili):
+        """
+        Zincirlerin kesintilerini toplu Ortak W ve OMS ticket işlemleri için
+        sonuç sırasıyla sıraya al.
+        
+        Args:
+            df_eleman: Zincir elemanları
+            zincir_nolari: Elemanların zincir numaraları
+            siralar: Zincirlerin sonuç sırası
+            baslar, adet: Zincirlerin ilk eleman konumu ve eleman sayısı
+            oncesi, sonrasi: Elemanların öncesi/sonrası çağrı maskeleri
+            cagrili: Öncesi veya sonrası çağrısı olan zincirlerin maskesi
+        """
+        kesinti_nolari = df_eleman['KesintiNo'].tolist()
+        
+        # Tek kesintili zincirlerin ortak W değeri olmaz
+        coklu = (adet > 1)[zincir_nolari]
+        self._ortak_w_bekleyenler.extend(zip(
+            siralar[zincir_nolari[coklu]].tolist(), [k for k, c in zip(kesinti_nolari, coklu) if c]
+        ))
+        
+        cagrili_zincirler = np.flatnonzero(cagrili)
+        if len(cagrili_zincirler) == 0:
+            return
+            
+        baslama = df_eleman['Baslama'].tolist()
+        max_bitis = df_eleman['MaksBitis'].tolist()
+        for z in cagrili_zincirler:
+            elemanlar = range(baslar[z], baslar[z] + adet[z])
+            kesinti_zamanlar = {kesinti_nolari[i]: (baslama[i], max_bitis[i]) for i in elemanlar}
+            self._ticket_bekleyenler.extend(self.cm_islemleri.ticket_kayitlari_olustur(
+                int(siralar[z]),
+                list({kesinti_nolari[i] for i in elemanlar if oncesi[i]}),
+                list({kesinti_nolari[i] for i in elemanlar if sonrasi[i]}),
+                kesinti_zamanlar
+            ))
+    
+    @staticmethod
+    def _cagri_durumlari(df_eleman):
+        """
+        Her kesintinin kendi sınırları dışında çağrısı olup olmadığını bul.
+        
+        Çağrı (Son Çağrı, İlk Müşteri Dışı, İlk Müşteri) başlamadan önceyse
+        öncesi, değilse ve kesinti no'nun en geç bitişinden sonraysa sonrası
+        sayılır; boş çağrı zamanları atlanır.
+        
+        Args:
+            df_eleman: Kesintiler (MaksBitis sütunu ile)
+            
+        Returns:
+            tuple: (öncesi çağrı maskesi, sonrası çağrı maskesi)
+        """
+        baslama = df_eleman['Baslama'].to_numpy(dtype='datetime64[ns]')
+        max_bitis = df_eleman['MaksBitis'].to_numpy(dtype='datetime64[ns]')
+        oncesi = np.zeros(len(df_eleman), dtype=bool)
+        sonrasi = np.zeros(len(df_eleman), dtype=bool)
+        for sutun in ('SonCagri', 'IlkMusteriDisiCagri', 'IlkMusteriCagri'):
+            cagri = df_eleman[sutun].to_numpy(dtype='datetime64[ns]')
+            once = cagri < baslama
+            oncesi |= once
+            sonrasi |= ~once & (cagri > max_bitis)
+        return oncesi, sonrasi
+    
+    @staticmethod
+    def _zincir_benzersiz(zincir_nolari, kodlar):
+        """
+        Benzersiz (zincir, değer kodu) çiftleri, zincir ve kod sırasıyla.
+        
+        Returns:
+            tuple: (zincir numaraları, değer kodları)
+        """
+        taban = int(kodlar.max()) + 1 if len(kodlar) else 1
+        anahtar = np.unique(zincir_nolari.astype(np.int64) * taban + kodlar)
+        return anahtar // taban, anahtar % taban
+    
+    @staticmethod
+    def _grup_birlestir(metinler, baslar, ayirici):
+        """
+        Ardışık gruplardaki metinleri ayırıcıyla birleştir.
+        
+        Args:
+            metinler: Metin dizisi (object, gruplar ardışık)
+            baslar: Grupların ilk eleman konumları
+            ayirici: Ayırıcı metin
+            
+        Returns:
+            ndarray: Grup başına birleşik metin (object)
+        """
+        metinler = np.asarray(metinler, dtype=object)
+        if len(metinler) == 0:
+            return np.zeros(0, dtype=object)
+        parcalar = ayirici + metinler
+        parcalar[baslar] = metinler[baslar]
+        return np.add.reduceat(parcalar, baslar)
+    
+    @staticmethod
+    def _fark_metinleri(farklar):
+        """Nanosaniye farklarını 0.1 dakikaya yuvarlanmış metinlere çevir"""
+        dakikalar = ExcelYardimci.toplam_saniye(farklar) / 60
+        return np.array([str(round(fark, 1)) for fark in dakikalar.tolist()], dtype=object)
+    
+    def _oms_ticket_doldur(self, df_sonuc):
+        """
+        Sıraya alınan tüm zincirlerin 'OMS Ticket IDs' alanını tek seferde doldur.
+        
+        Args:
+            df_sonuc: Sonuç sırası indeksli sonuç DataFrame'i
+        """
+        if not self._ticket_bekleyenler:
+            return
+            
+        degerler = self.cm_islemleri.cagri_ticket_toplu_bul(self._ticket_bekleyenler)
+        df_sonuc['OMS Ticket IDs'] = pd.Series(degerler, dtype=object).reindex(df_sonuc.index, fill_value="")
+        self._ticket_bekleyenler = []
+    
+    def _ortak_w_doldur(self, df_sonuc):
+        """
+        Sıraya alınan tüm zincirlerin 'Ortak W Değerleri' alanını doldur.
+        
+        Zincir başına CM araması yerine tüm (zincir, kesinti) çiftleri
+        CMIslemleri.ortak_w_toplu_bul ile tek seferde işlenir.
+        
+        Args:
+            df_sonuc: Sonuç sırası indeksli sonuç DataFrame'i
+        """
+        if not self._ortak_w_bekleyenler:
+            return
+            
+        degerler = self.cm_islemleri.ortak_w_toplu_bul(self._ortak_w_bekleyenler)
+        df_sonuc['Ortak W Değerleri'] = pd.Series(degerler, dtype=object).reindex(df_sonuc.index, fill_value="")
+        self._ortak_w_bekleyenler = []
+        
     
     def _tm_no_temizle(self, tm_no):
         """TM numarasını temizle (float'tan int'e çevir)"""
@@ -511,37 +1522,95 @@ class KesintiAnaliz:
         except:
             return tm_str
     
+    def _tm_no_kategorik(self, seri):
+        """
+        TM numarası sütununu temizlenmiş, kategorik bir sütuna çevir.
+        
+        _tm_no_temizle her farklı değer için bir kez çağrılır; kategoriler
+        sıralı TM numaralarıdır, boş TM no'lar eksik değer (kod -1) olur.
+        
+        Args:
+            seri: CBS TM No Series'i
+            
+        Returns:
+            Categorical: Temizlenmiş TM numaraları
+        """
+        kodlar, degerler = pd.factorize(seri, use_na_sentinel=False)
+        temiz = np.array([self._tm_no_temizle(d) for d in degerler], dtype=object)
+        dolu = temiz != ''
+        tm_nolari = np.unique(temiz[dolu])
+        tm_kodlari = np.full(len(temiz), -1, dtype=np.int64)
+        tm_kodlari[dolu] = np.searchsorted(tm_nolari, temiz[dolu])
+        return pd.Categorical.from_codes(tm_kodlari[kodlar], categories=pd.Index(tm_nolari, dtype=object))
+    
+    @staticmethod
+    def _dagitim_ag_maskesi(seri):
+        """
+        Kaynağa Göre değeri Dağıtım-AG olan kesintilerin maskesi (her farklı
+        değer bir kez karşılaştırılır).
+        
+        Args:
+            seri: Kaynağa Göre Series'i
+            
+        Returns:
+            ndarray: Dağıtım-AG maskesi
+        """
+        dagitim_ag_deger = DAGITIM_AG_AYARLARI.get('KAYNAGA_GORE_DEGER', 'Dağıtım-AG')
+        kodlar, degerler = pd.factorize(seri, use_na_sentinel=False)
+        eslesen = np.array([str(d).strip() == dagitim_ag_deger for d in degerler], dtype=bool)
+        return eslesen[kodlar]
+    
     def _tm_index_olustur(self):
-        """TM bazlı index oluştur (hızlı arama için)"""
+        """
+        TM bazlı index oluştur (hızlı arama için).
+        
+        Her TM (TMNo kategori kodu) için başlama zamanına göre sıralı
+        (zamanlar, kesinti no'ları) dizileri tutulur; pencere sorguları
+        searchsorted ile yapılır.
+        """
         self.tm_kesinti_index = {}
         
-        if self.df_tum_kesintiler is None:
+        if self.df_tum_kesintiler is None or self.df_tum_kesintiler.empty:
             return
         
-        for _, row in self.df_tum_kesintiler.iterrows():
-            tm_no = self._tm_no_temizle(row.get('CBSTMNo', ''))
-            if not tm_no:
-                continue
-            
-            kesinti_bilgi = {
-                'KesintiNo': row['KesintiNo'],
-                'Baslama': row['Baslama']
-            }
-            
-            if tm_no not in self.tm_kesinti_index:
-                self.tm_kesinti_index[tm_no] = []
-            self.tm_kesinti_index[tm_no].append(kesinti_bilgi)
+        df = self.df_tum_kesintiler
+        tm_kodlari = df['TMNo'].cat.codes.to_numpy()
+        gecerli = tm_kodlari >= 0
+        if not gecerli.any():
+            print("✓ TM index oluşturuldu: 0 farklı TM")
+            return
+        
+        tm_kodlari = tm_kodlari[gecerli]
+        zamanlar = df['Baslama'].to_numpy(dtype='datetime64[ns]')[gecerli]
+        kesinti_nolari = df['KesintiNo'].to_numpy(dtype=object)[gecerli]
+        
+        # TM ve başlama zamanına göre sırala (NaT'ler her TM'nin sonuna düşer)
+        sira = np.lexsort((zamanlar, tm_kodlari))
+        tm_kodlari = tm_kodlari[sira]
+        zamanlar = zamanlar[sira]
+        kesinti_nolari = kesinti_nolari[sira]
+        zaman_var = ~np.isnat(zamanlar)
+        
+        sinirlar = np.flatnonzero(np.diff(tm_kodlari)) + 1
+        for bas, bit in zip(np.r_[0, sinirlar], np.r_[sinirlar, len(tm_kodlari)]):
+            # Başlama zamanı olmayan kesintiler hiçbir pencereye girmez
+            secim = zaman_var[bas:bit]
+            self.tm_kesinti_index[int(tm_kodlari[bas])] = (
+                zamanlar[bas:bit][secim],
+                kesinti_nolari[bas:bit][secim]
+            )
         
         print(f"✓ TM index oluşturuldu: {len(self.tm_kesinti_index)} farklı TM")
     
-    def _tm_bazli_kesinti_tara(self, elemanlar, baslama, bitis):
+    def _tm_bazli_kesinti_tara(self, kesinti_nolari, tm_kodlari, baslama, bitis):
         """
         Dağıtım-AG kesintileri için TM bazlı kesinti taraması (optimize edilmiş).
         
         Args:
-            elemanlar: Gruptaki kesinti elemanları
-            baslama: Grubun başlangıç zamanı
-            bitis: Grubun bitiş zamanı
+            kesinti_nolari: Zincirdeki kesinti numaraları
+            tm_kodlari: Zincirdeki kesintilerin TMNo kategori kodları (-1: TM yok)
+            baslama: Zincirin başlangıç zamanı (int64 ns)
+            bitis: Zincirin bitiş zamanı (int64 ns)
             
         Returns:
             str: Aynı TM'deki diğer kesinti numaraları (;'li)
@@ -549,101 +1618,42 @@ class KesintiAnaliz:
         if not hasattr(self, 'tm_kesinti_index') or not self.tm_kesinti_index:
             return ""
         
-        if len(elemanlar) == 0:
-            return ""
-        
-        # Gruptaki kesinti numaralarını al
-        grup_kesinti_nolari = {x['KesintiNo'] for x in elemanlar}
-        
-        # Gruptaki TM numaralarını al (temizlenmiş)
-        tm_nolari = set()
-        for elem in elemanlar:
-            tm_no = self._tm_no_temizle(elem.get('CBSTMNo', ''))
-            if tm_no:
-                tm_nolari.add(tm_no)
+        # Gruptaki kesinti ve TM numaraları
+        grup_kesinti_nolari = set(kesinti_nolari.tolist())
+        tm_kodlari = {int(kod) for kod in tm_kodlari if kod >= 0}
         
-        if not tm_nolari:
+        if not tm_kodlari:
             return ""
         
         # Tarama aralığını hesapla (±12 saat)
         tarama_saat = DAGITIM_AG_AYARLARI.get('TARAMA_SAAT', 12)
-        tarama_baslama = baslama - timedelta(hours=tarama_saat)
-        tarama_bitis = bitis + timedelta(hours=tarama_saat)
+        tarama_ns = pd.Timedelta(hours=tarama_saat).value
+        tarama_baslama = np.datetime64(int(baslama) - tarama_ns, 'ns')
+        tarama_bitis = np.datetime64(int(bitis) + tarama_ns, 'ns')
         
-        # Index kullanarak hızlı arama
+        # Sıralı dizilerde ikili arama ile pencere [tarama_baslama, tarama_bitis]
         bulunan_kesintiler = set()
         
-        for tm_no in tm_nolari:
-            if tm_no not in self.tm_kesinti_index:
+        for tm_kodu in tm_kodlari:
+            kayit = self.tm_kesinti_index.get(tm_kodu)
+            if kayit is None:
                 continue
             
-            # Sadece bu TM'deki kesintileri kontrol et
-            for kesinti_bilgi in self.tm_kesinti_index[tm_no]:
-                kesinti_no = kesinti_bilgi['KesintiNo']
-                row_baslama = kesinti_bilgi['Baslama']
-                
+            zamanlar, kesinti_nolari = kayit
+            bas = np.searchsorted(zamanlar, tarama_baslama, side='left')
+            bit = np.searchsorted(zamanlar, tarama_bitis, side='right')
+            
+            for kesinti_no in kesinti_nolari[bas:bit]:
                 # Kendi grubundaki kesintileri atla
                 if kesinti_no in grup_kesinti_nolari:
                     continue
-                
-                # Zaman aralığında mı?
-                if pd.isna(row_baslama):
-                    continue
-                
-                if tarama_baslama <= row_baslama <= tarama_bitis:
-                    bulunan_kesintiler.add(int(kesinti_no))
+                bulunan_kesintiler.add(int(kesinti_no))
         
         if bulunan_kesintiler:
             return ";".join(str(k) for k in sorted(bulunan_kesintiler))
         
         return ""
     
-    def _analyze_cagri_durumu(self, elemanlar):
-        """Çağrıların her kesintinin kendi sınırlarına göre durumunu analiz et."""
-        oncesi_cagri = False
-        sonrasi_cagri = False
-        oncesi_kesintiler = set()
-        sonrasi_kesintiler = set()
-        
-        for elem in elemanlar:
-            kesinti_no = elem['KesintiNo']
-            kesinti_kendi_baslama = elem['Baslama']
-            
-            # Maksimum bitiş zamanını al
-            if self.kesinti_max_bitis and kesinti_no in self.kesinti_max_bitis:
-                kesinti_kendi_bitis = self.kesinti_max_bitis[kesinti_no]
-            else:
-                kesinti_kendi_bitis = elem['Bitis']
-            
-            # Çağrı zamanlarını kontrol et
-            cagri_zamanlari = [
-                elem.get('SonCagri'),
-                elem.get('IlkMusteriDisiCagri'),
-                elem.get('IlkMusteriCagri')
-            ]
-            
-            for cagri_zaman in cagri_zamanlari:
-                if pd.isna(cagri_zaman):
-                    continue
-                
-                if cagri_zaman < kesinti_kendi_baslama:
-                    oncesi_cagri = True
-                    oncesi_kesintiler.add(kesinti_no)
-                elif cagri_zaman > kesinti_kendi_bitis:
-                    sonrasi_cagri = True
-                    sonrasi_kesintiler.add(kesinti_no)
-        
-        # Durum belirle
-        durum = ""
-        if oncesi_cagri and sonrasi_cagri:
-            durum = "Kesinti Öncesi ve Sonrası Çağrı"
-        elif oncesi_cagri:
-            durum = "Kesinti Öncesi Çağrı"
-        elif sonrasi_cagri:
-            durum = "Kesinti Sonrası Çağrı"
-        
-        return durum, list(oncesi_kesintiler), list(sonrasi_kesintiler)
-    
     def kaydet(self, dosya_yolu):
         """
         Analiz sonuçlarını Excel'e kaydet.
@@ -655,7 +1665,8 @@ class KesintiAnaliz:
             print("✗ Kaydedilecek sonuç yok!")
             return False
         
-        ExcelYardimci.kaydet_bicimli(self.df_sonuc, dosya_yolu)
+        with profil.asama('analiz.kaydet', len(self.df_sonuc)):
+            ExcelYardimci.kaydet_bicimli(self.df_sonuc, dosya_yolu)
         return True
     
     def sonuclari_al(self):
@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Okuyucu Modülü
+Excel, CSV ve Parquet girdilerini aynı okuma ayarlarıyla (header, skiprows,
+usecols, dtype, keep_default_na) okur. Excel için kuruluysa calamine
+motoru, değilse openpyxl kullanılır; her okumada motor ve süre yazdırılır.
+"""
+
+import pandas as pd
+import importlib.util
+import os
+import sys
+import time
+
+# Config'i import et
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import OKUYUCU_AYARLARI
+
+
+class TabloOkuyucu:
+    """Girdi dosyalarını uzantısına göre uygun motorla okuyan sınıf"""
+
+    CALAMINE_VAR = importlib.util.find_spec('python_calamine') is not None
+    PARQUET_VAR = importlib.util.find_spec('pyarrow') is not None
+
+    @classmethod
+    def excel_motoru(cls):
+        """
+        Ayara göre kullanılacak Excel motoru.
+
+        Returns:
+            str: 'calamine' veya 'openpyxl'
+        """
+        motor = OKUYUCU_AYARLARI.get('EXCEL_MOTORU', 'otomatik')
+        if motor == 'otomatik':
+            return 'calamine' if cls.CALAMINE_VAR else 'openpyxl'
+        if motor == 'calamine' and not cls.CALAMINE_VAR:
+            print("✗ python-calamine kurulu değil, openpyxl kullanılacak")
+            return 'openpyxl'
+        return motor
+
+    @staticmethod
+    def dosya_bul(klasor, ad):
+        """
+        Girdiyi GIRDI_UZANTILARI sırasıyla ara (örn. table.xlsx, table.parquet, table.csv).
+
+        Args:
+            klasor: Aranacak klasör
+            ad: Uzantısız dosya adı
+
+        Returns:
+            str veya None: Bulunan ilk dosyanın yolu
+        """
+        for uzanti in OKUYUCU_AYARLARI.get('GIRDI_UZANTILARI', ['.xlsx']):
+            yol = os.path.join(klasor, f"{ad}{uzanti}")
+            if os.path.exists(yol):
+                return yol
+        return None
+
+    @classmethod
+    def oku(cls, dosya_yolu, **okuma_ayarlari):
+        """
+        Dosyayı uzantısına göre oku.
+
+        CSV dosyaları Excel sayfasıyla aynı yerleşimde (başlık öncesi satırlar
+        dahil) kabul edilir; Parquet dosyaları zaten tablo olduğundan header ve
+        skiprows yok sayılır.
+
+        Args:
+            dosya_yolu: Girdi dosyası yolu
+            **okuma_ayarlari: pd.read_excel parametreleri
+
+        Returns:
+            DataFrame: Okunan veri
+        """
+        uzanti = os.path.splitext(dosya_yolu)[1].lower()
+        baslangic = time.perf_counter()
+
+        if uzanti == '.csv':
+            motor = 'csv'
+            df = pd.read_csv(
+                dosya_yolu,
+                sep=OKUYUCU_AYARLARI.get('CSV_AYIRICI', ','),
+                encoding=OKUYUCU_AYARLARI.get('CSV_KODLAMA', 'utf-8-sig'),
+                **okuma_ayarlari
+            )
+        elif uzanti == '.parquet':
+            motor = 'parquet'
+            df = cls._parquet_oku(dosya_yolu, **okuma_ayarlari)
+        else:
+            df, motor = cls._excel_oku(dosya_yolu, cls.excel_motoru(), okuma_ayarlari)
+
+        if OKUYUCU_AYARLARI.get('SURE_YAZDIR', True):
+            sure = time.perf_counter() - baslangic
+            print(f"✓ {os.path.basename(dosya_yolu)} okundu: {len(df)} satır ({motor}, {sure:.2f} sn)")
+        return df
+
+    @staticmethod
+    def _excel_oku(dosya_yolu, motor, okuma_ayarlari):
+        """
+        Excel'i seçilen motorla oku; calamine dosyayı açamazsa openpyxl'e dön.
+
+        Hatalı parametre (ValueError) ve dosya hataları (OSError) olduğu gibi
+        yükseltilir; bunlar motor değiştirmekle düzelmez.
+
+        Returns:
+            tuple: (DataFrame, kullanılan motor)
+        """
+        try:
+            return pd.read_excel(dosya_yolu, engine=motor, **okuma_ayarlari), motor
+        except (OSError, ValueError):
+            raise
+        except Exception as e:
+            if motor != 'calamine':
+                raise
+            print(f"✗ calamine ile okunamadı, openpyxl deneniyor: {e}")
+        return pd.read_excel(dosya_yolu, engine='openpyxl', **okuma_ayarlari), 'openpyxl'
+
+    @classmethod
+    def _parquet_oku(cls, dosya_yolu, usecols=None, dtype=None, keep_default_na=True, **_):
+        """
+        Parquet dosyasını read_excel ayarlarına uyarak oku.
+
+        Args:
+            dosya_yolu: Parquet dosyası yolu
+            usecols: Sütun adları veya konumları
+            dtype: {sütun: tip} sözlüğü
+            keep_default_na: False ise metin sütunlarındaki boşlar '' olur (Excel okumasıyla aynı)
+
+        Returns:
+            DataFrame: Okunan veri
+        """
+        if not cls.PARQUET_VAR:
+            raise ImportError("Parquet girdisi için pyarrow kurulu olmalı")
+
+        if usecols is not None and all(isinstance(s, str) for s in usecols):
+            df = pd.read_parquet(dosya_yolu, columns=list(usecols))
+        else:
+            df = pd.read_parquet(dosya_yolu)
+            if usecols is not None:
+                disarida = [k for k in usecols if k >= len(df.columns)]
+                if disarida:
+                    raise ValueError(f"usecols sütun sayısını aşıyor: {disarida}")
+                df = df.iloc[:, sorted(usecols)]
+
+        if not keep_default_na:
+            metin = df.columns[df.dtypes == object]
+            df[metin] = df[metin].fillna('')
+        if dtype:
+            df = df.astype(dtype)
+        return df
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""
+Önbellek Modülü
+Excel girdilerinin tipli Parquet kopyalarını çalışma kitabının yanında saklar.
+Pickle kullanılmaz: önbellek klasörüne dosya bırakabilen biri okuma sırasında kod çalıştıramaz.
+"""
+
+import pandas as pd
+import numpy as np
+import hashlib
+import importlib.util
+import os
+import sys
+
+# Config'i import et
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import ONBELLEK_AYARLARI
+
+
+class Onbellek:
+    """Excel dosyaları için yan dosya önbelleği"""
+    
+    PARQUET_VAR = importlib.util.find_spec('pyarrow') is not None
+    
+    # Karışık tipli object sütunları Parquet'te tip kodu + tipli sütunlarla saklanır
+    KARISIK_AYIRICI = '\x1f'
+    KARISIK_TIPLER = {
+        type(None): 0, str: 1, float: 2, np.float64: 2, int: 3, np.int64: 3,
+        bool: 4, np.bool_: 4, pd.Timestamp: 5, type(pd.NaT): 6
+    }
+    
+    def __init__(self, aktif=None, klasor_adi=None, maks_boyut_mb=None):
+        """
+        Önbelleği başlat.
+        
+        Args:
+            aktif: Önbellek kullanılsın mı (None ise config'den)
+            klasor_adi: Çalışma kitabının yanındaki önbellek klasörünün adı
+            maks_boyut_mb: Klasör başına boyut sınırı (MB)
+        """
+        self.aktif = ONBELLEK_AYARLARI.get('AKTIF', True) if aktif is None else aktif
+        self.klasor_adi = klasor_adi or ONBELLEK_AYARLARI.get('KLASOR_ADI', '.kesinti_onbellek')
+        self.maks_boyut = (maks_boyut_mb or ONBELLEK_AYARLARI.get('MAKS_BOYUT_MB', 2048)) * 1024 * 1024
+    
+    def oku(self, dosya_yolu, okuyucu, **okuma_ayarlari):
+        """
+        Dosyayı önbellekten oku; yoksa okuyucu ile oku ve önbelleğe yaz.
+        
+        Args:
+            dosya_yolu: Kaynak dosya yolu
+            okuyucu: DataFrame döndüren okuma fonksiyonu (örn. pd.read_excel)
+            **okuma_ayarlari: Okuyucuya geçirilecek parametreler (anahtara dahil)
+            
+        Returns:
+            DataFrame: Okunan veri
+        """
+        if not self.aktif or not self.PARQUET_VAR:
+            return okuyucu(dosya_yolu, **okuma_ayarlari)
+        
+        try:
+            anahtar = self._anahtar_hesapla(dosya_yolu)
+        except OSError:
+            return okuyucu(dosya_yolu, **okuma_ayarlari)
+        
+        klasor = os.path.join(os.path.dirname(os.path.abspath(dosya_yolu)), self.klasor_adi)
+        onek = f"{os.path.basename(dosya_yolu)}.{self._ayar_ozeti(okuma_ayarlari)}."
+        
+        kayit_yolu = os.path.join(klasor, f"{onek}{anahtar}.parquet")
+        if os.path.exists(kayit_yolu):
+            try:
+                df = self.parquet_oku(kayit_yolu)
+                os.utime(kayit_yolu)  # LRU için son kullanım zamanı
+                print(f"✓ Önbellekten yüklendi: {os.path.basename(dosya_yolu)}")
+                return df
+            except Exception as e:
+                print(f"✗ Önbellek okunamadı, dosya yeniden okunacak: {e}")
+                self._sil(kayit_yolu)
+        
+        df = okuyucu(dosya_yolu, **okuma_ayarlari)
+        
+        try:
+            os.makedirs(klasor, exist_ok=True)
+            self._eski_kayitlari_sil(klasor, onek)
+            self._yaz(df, os.path.join(klasor, f"{onek}{anahtar}"))
+            self._boyut_sinirla(klasor)
+        except Exception as e:
+            print(f"✗ Önbelleğe yazılamadı: {e}")
+        
+        return df
+    
+    def _anahtar_hesapla(self, dosya_yolu):
+        """Yol, boyut, değişiklik zamanı ve içerik hash'inden anahtar üret"""
+        tam_yol = os.path.normcase(os.path.abspath(dosya_yolu))
+        bilgi = os.stat(tam_yol)
+        
+        icerik = hashlib.blake2b(digest_size=16)
+        with open(tam_yol, 'rb') as f:
+            for parca in iter(lambda: f.read(1024 * 1024), b''):
+                icerik.update(parca)
+        
+        anahtar = f"{tam_yol}|{bilgi.st_size}|{bilgi.st_mtime_ns}|{icerik.hexdigest()}"
+        return hashlib.blake2b(anahtar.encode('utf-8'), digest_size=10).hexdigest()
+    
+    @staticmethod
+    def _ayar_ozeti(okuma_ayarlari):
+        """Okuma ayarlarının kısa özeti (aynı dosyanın farklı okumaları ayrı tutulur)"""
+        ayarlar = repr(sorted(okuma_ayarlari.items()))
+        return hashlib.blake2b(ayarlar.encode('utf-8'), digest_size=4).hexdigest()
+    
+    def _yaz(self, df, kayit_yolu_oneki):
+        """DataFrame'i geçici dosya üzerinden Parquet olarak yaz (temsil edilemiyorsa yazılmaz)"""
+        gecici = f"{kayit_yolu_oneki}.tmp"
+        if self.parquet_yaz(df, gecici):
+            os.replace(gecici, f"{kayit_yolu_oneki}.parquet")
+    
+    @classmethod
+    def parquet_yaz(cls, df, yol):
+        """
+        DataFrame'i Parquet olarak yaz.
+        
+        Metin dışı değer içeren object sütunları (tarih/metin, sayı/metin
+        karışık hücreler, NaN) tip kodu ve tipli yardımcı sütunlarla
+        kayıpsız saklanır; parquet_oku aynı değerleri geri üretir.
+        Sütun adları metin değilse (header=None) veya tanınmayan hücre
+        tipi varsa veri yazılmaz.
+        
+        Returns:
+            bool: Yazıldı mı
+        """
+        if not all(isinstance(c, str) and cls.KARISIK_AYIRICI not in c for c in df.columns):
+            return False
+        
+        sutunlar = {}
+        ekler = {}
+        for ad in df.columns:
+            seri = df[ad]
+            if seri.dtype != object or cls._metin_sutunu_mu(seri):
+                sutunlar[ad] = seri
+                continue
+            kodlu = cls._karisik_kodla(seri)
+            if kodlu is None:
+                return False
+            sutunlar[ad] = kodlu.pop(ad)
+            ekler.update(kodlu)
+        
+        try:
+            pd.DataFrame({**sutunlar, **ekler}, index=df.index).to_parquet(yol)
+        except Exception:
+            cls._sil(yol)
+            return False
+        return True
+    
+    @classmethod
+    def parquet_oku(cls, yol):
+        """parquet_yaz ile yazılmış DataFrame'i oku (karışık sütunlar geri çözülür)"""
+        df = pd.read_parquet(yol)
+        kod_eki = f"{cls.KARISIK_AYIRICI}tur"
+        for ad in [c for c in df.columns if c.endswith(kod_eki)]:
+            cls._karisik_coz(df, ad[:-len(kod_eki)])
+        return df
+    
+    @staticmethod
+    def _metin_sutunu_mu(seri):
+        """Sütun yalnızca metin ve None içeriyor mu (Parquet doğrudan saklar)"""
+        if pd.api.types.infer_dtype(seri, skipna=True) not in ('string', 'empty'):
+            return False
+        bos = seri.isna().to_numpy()
+        return all(deger is None for deger in seri.to_numpy()[bos])
+    
+    @classmethod
+    def _karisik_kodla(cls, seri):
+        """Karışık sütunu metin, tip kodu, sayı, tam sayı ve zaman sütunlarına ayır"""
+        ad = seri.name
+        degerler = seri.to_numpy()
+        try:
+            kodlar = np.fromiter(
+                (cls.KARISIK_TIPLER[type(deger)] for deger in degerler), dtype=np.int8, count=len(degerler)
+            )
+            sayi = np.full(len(degerler), np.nan)
+            sayi[kodlar == 2] = degerler[kodlar == 2].astype(np.float64)
+            tam = np.zeros(len(degerler), dtype=np.int64)
+            tam_mi = (kodlar == 3) | (kodlar == 4)
+            tam[tam_mi] = degerler[tam_mi].astype(np.int64)
+            zaman = pd.to_datetime(pd.Series(np.where(kodlar == 5, degerler, None), dtype=object))
+        except (KeyError, OverflowError, TypeError, ValueError):
+            return None
+        if isinstance(zaman.dtype, pd.DatetimeTZDtype):
+            return None
+        
+        ayirici = cls.KARISIK_AYIRICI
+        return {
+            ad: pd.Series(np.where(kodlar == 1, degerler, None), index=seri.index, dtype=object),
+            f"{ad}{ayirici}tur": pd.Series(kodlar, index=seri.index),
+            f"{ad}{ayirici}sayi": pd.Series(sayi, index=seri.index),
+            f"{ad}{ayirici}tam": pd.Series(tam, index=seri.index),
+            f"{ad}{ayirici}zaman": pd.Series(zaman.to_numpy(), index=seri.index)
+        }
+    
+    @classmethod
+    def _karisik_coz(cls, df, ad):
+        """_karisik_kodla ile ayrılan sütunları tek object sütunda birleştir"""
+        ayirici = cls.KARISIK_AYIRICI
+        kodlar = df.pop(f"{ad}{ayirici}tur").to_numpy()
+        sayi = df.pop(f"{ad}{ayirici}sayi").to_numpy()
+        tam = df.pop(f"{ad}{ayirici}tam").to_numpy()
+        zaman = df.pop(f"{ad}{ayirici}zaman")
+        
+        degerler = np.full(len(kodlar), None, dtype=object)
+        metin = kodlar == 1
+        degerler[metin] = df[ad].to_numpy(dtype=object)[metin]
+        for kod, parca in (
+            (2, lambda m: sayi[m].tolist()),
+            (3, lambda m: tam[m].tolist()),
+            (4, lambda m: tam[m].astype(bool).tolist()),
+            (5, lambda m: list(zaman[m])),
+            (6, lambda m: [pd.NaT] * int(m.sum()))
+        ):
+            maske = kodlar == kod
+            if maske.any():
+                degerler[maske] = parca(maske)
+        df[ad] = degerler
+    
+    def _eski_kayitlari_sil(self, klasor, onek):
+        """Aynı çalışma kitabının (aynı okuma ayarlarıyla) eski kayıtlarını sil"""
+        for ad in os.listdir(klasor):
+            if ad.startswith(onek) and ad.count('.') == onek.count('.') + 1:
+                self._sil(os.path.join(klasor, ad))
+    
+    def _boyut_sinirla(self, klasor):
+        """Klasör boyut sınırı aşıldıysa en uzun süredir kullanılmayanları sil"""
+        kayitlar = []
+        for ad in os.listdir(klasor):
+            yol = os.path.join(klasor, ad)
+            if os.path.isfile(yol):
+                bilgi = os.stat(yol)
+                kayitlar.append((bilgi.st_mtime, bilgi.st_size, yol))
+        
+        toplam = sum(boyut for _, boyut, _ in kayitlar)
+        for _, boyut, yol in sorted(kayitlar):
+            if toplam <= self.maks_boyut:
+                break
+            self._sil(yol)
+            toplam -= boyut
+    
+    @staticmethod
+    def _sil(yol):
+        """Dosyayı sessizce sil"""
+        try:
+            os.remove(yol)
+        except OSError:
+            pass
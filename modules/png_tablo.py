@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+PNG Tablo Modülü
+OTG/JTK tablolarını matplotlib ax.table yerine doğrudan Pillow ile çizer.
+Hücreler tek geçişte paletli (P) görüntüye boyanır; bellek yalnızca çıktı
+görüntüsü kadardır ve kayıtta renk azaltma gerekmez.
+"""
+
+import functools
+import importlib.util
+import os
+import sys
+
+# Config'i import et
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import PNG_AYARLARI
+
+
+class PngTablo:
+    """Önceden satırlara bölünmüş hücre metinlerinden tablo PNG'si çizen sınıf"""
+
+    PILLOW_VAR = importlib.util.find_spec('PIL') is not None
+
+    # Satır türleri (png_olustur'daki renk düzeni)
+    BASLIK = 'baslik'
+    RENKLI = 'renkli'   # ALTERNATE_ROW_COLOR ile boyanan veri satırı
+    DUZ = 'duz'         # Beyaz veri satırı
+
+    # Palet düzeni: 0 saydam kenar, ardından satır türü başına zemin -> yazı
+    # rengi rampası (kenar yumuşatma tonları), en sonda çizgi rengi
+    SAYDAM = 0
+    RAMPA_UZUNLUGU = 16
+    RAMPALAR = {BASLIK: 1, RENKLI: 1 + RAMPA_UZUNLUGU, DUZ: 1 + 2 * RAMPA_UZUNLUGU}
+    CIZGI = 1 + 3 * RAMPA_UZUNLUGU
+
+    def __init__(self, kaynak_adi):
+        """
+        Çiziciyi kaynak tipine göre hazırla.
+
+        Args:
+            kaynak_adi: 'OTG' veya 'JTK' (yazı boyutu için)
+        """
+        dpi = PNG_AYARLARI['DPI']
+        font_size = PNG_AYARLARI['OTG_FONT_SIZE'] if kaynak_adi == 'OTG' else PNG_AYARLARI['JTK_FONT_SIZE']
+        header_font_size = PNG_AYARLARI.get('HEADER_FONT_SIZE', font_size + 1)
+
+        # Nokta -> piksel (matplotlib ile aynı DPI ölçeği)
+        self.font = self._font_al(False, round(font_size * dpi / 72))
+        self.baslik_font = self._font_al(True, round(header_font_size * dpi / 72))
+        self.satir_araligi = round(font_size * dpi / 72 * 0.3)
+        self.yatay_bosluk = round(font_size * dpi / 72 * 0.6)
+        self.dikey_bosluk = round(font_size * dpi / 72 * 0.5)
+        self.cizgi = max(1, round(dpi / 72))
+        self.kenar = round(0.05 * dpi)  # pad_inches=0.05 karşılığı
+
+    @classmethod
+    def kullanilabilir_mi(cls):
+        """Pillow kurulu mu"""
+        return cls.PILLOW_VAR
+
+    @classmethod
+    def _palet(cls):
+        """RAMPALAR düzeninde RGB palet listesi (PNG_AYARLARI renkleriyle)"""
+        from PIL import ImageColor
+
+        renkler = {
+            cls.BASLIK: (PNG_AYARLARI['HEADER_COLOR'], 'white'),
+            cls.RENKLI: (PNG_AYARLARI['ALTERNATE_ROW_COLOR'], 'black'),
+            cls.DUZ: ('white', 'black')
+        }
+        palet = [255, 255, 255] * (cls.CIZGI + 1)
+        for tur, baslangic in cls.RAMPALAR.items():
+            zemin, yazi = (ImageColor.getrgb(renk) for renk in renkler[tur])
+            for adim in range(cls.RAMPA_UZUNLUGU):
+                oran = adim / (cls.RAMPA_UZUNLUGU - 1)
+                palet[(baslangic + adim) * 3:(baslangic + adim + 1) * 3] = [
+                    round(z + (y - z) * oran) for z, y in zip(zemin, yazi)
+                ]
+        palet[cls.CIZGI * 3:] = [0, 0, 0]
+        return palet
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _font_al(kalin, piksel):
+        """
+        matplotlib'in kullandığı yazı tipini (DejaVu Sans) Pillow ile yükle.
+
+        Süreç başına (kalınlık, boyut) için bir kez yüklenir.
+        """
+        from PIL import ImageFont
+        from matplotlib import font_manager
+
+        ozellik = font_manager.FontProperties(family='sans-serif', weight='bold' if kalin else 'normal')
+        try:
+            return ImageFont.truetype(font_manager.findfont(ozellik), piksel)
+        except OSError:
+            return ImageFont.load_default(piksel)
+
+    def ciz(self, combined_data, cell_line_counts, satir_turleri, png_path):
+        """
+        Tabloyu çizip PNG olarak kaydet.
+
+        Args:
+            combined_data: Satır listesi; hücreler '\\n' ile bölünmüş metinler
+            cell_line_counts: Her satırdaki en fazla metin satırı sayısı
+            satir_turleri: Her satır için BASLIK / RENKLI / DUZ
+            png_path: Hedef dosya yolu
+        """
+        from PIL import Image, ImageDraw
+
+        num_cols = max(len(row) for row in combined_data)
+
+        # Sütun genişlikleri: en geniş metin satırı + boşluk (en az 5 karakter)
+        en_dar = self.font.getlength('0' * 5)
+        genislikler = [en_dar] * num_cols
+        for row, tur in zip(combined_data, satir_turleri):
+            font = self.baslik_font if tur == self.BASLIK else self.font
+            for col_idx, metin in enumerate(row):
+                if metin:
+                    for satir in metin.split('\n'):
+                        genislikler[col_idx] = max(genislikler[col_idx], font.getlength(satir.strip()))
+        genislikler = [int(g) + 2 * self.yatay_bosluk for g in genislikler]
+
+        # Satır yükseklikleri (metin satırı sayısına göre)
+        satir_yuksekligi = self.font.size + self.satir_araligi
+        baslik_yuksekligi = self.baslik_font.size + self.satir_araligi
+        yukseklikler = [
+            (baslik_yuksekligi if tur == self.BASLIK else satir_yuksekligi) * satir_sayisi
+            + 2 * self.dikey_bosluk
+            for satir_sayisi, tur in zip(cell_line_counts, satir_turleri)
+        ]
+
+        genislik = sum(genislikler) + 2 * self.kenar + self.cizgi
+        yukseklik = sum(yukseklikler) + 2 * self.kenar + self.cizgi
+        goruntu = Image.new('P', (genislik, yukseklik), self.SAYDAM)
+        goruntu.putpalette(self._palet())
+        cizim = ImageDraw.Draw(goruntu)
+        # Paletli görüntüde yazı varsayılan olarak keskin ('1') çizilir; 'L' ile
+        # kenar tonları zemin ile yazı indeksi arasında karıştırılır ve zemin ->
+        # yazı rampası sayesinde doğru renge düşer
+        cizim.fontmode = 'L'
+
+        y = self.kenar
+        for row, tur, satir_h in zip(combined_data, satir_turleri, yukseklikler):
+            font = self.baslik_font if tur == self.BASLIK else self.font
+            zemin = self.RAMPALAR[tur]
+            yazi = zemin + self.RAMPA_UZUNLUGU - 1
+            x = self.kenar
+            for col_idx in range(num_cols):
+                sutun_w = genislikler[col_idx]
+                cizim.rectangle(
+                    [x, y, x + sutun_w, y + satir_h],
+                    fill=zemin, outline=self.CIZGI, width=self.cizgi
+                )
+                metin = row[col_idx] if col_idx < len(row) else ''
+                if metin:
+                    cizim.multiline_text(
+                        (x + sutun_w / 2, y + satir_h / 2), metin, font=font, fill=yazi,
+                        anchor='mm', align='center', spacing=self.satir_araligi
+                    )
+                x += sutun_w
+            y += satir_h
+
+        goruntu.save(
+            png_path, format='png', transparency=self.SAYDAM,
+            dpi=(PNG_AYARLARI['DPI'], PNG_AYARLARI['DPI'])
+        )
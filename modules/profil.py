@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+"""
+Profil Modülü
+Analiz ve raporlama aşamaları için süre, CPU ve bellek ölçümü.
+Kapalıyken ölçüm noktaları tek bir bayrak kontrolünden ibarettir.
+"""
+
+import csv
+import functools
+import json
+import os
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def tepe_rss_mb():
+    """
+    Sürecin şimdiye kadarki en yüksek bellek kullanımını (MB) döndür.
+
+    Returns:
+        float: Tepe RSS (ölçülemiyorsa None)
+    """
+    if resource is not None:
+        deger = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux KB, macOS byte döndürür
+        return deger / (1024 * 1024) if sys.platform == 'darwin' else deger / 1024
+    try:
+        import psutil
+        bilgi = psutil.Process().memory_info()
+        return getattr(bilgi, 'peak_wset', bilgi.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+
+class _BosAsama:
+    """Profil kapalıyken kullanılan, hiçbir şey yapmayan aşama"""
+
+    adet = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_BOS_ASAMA = _BosAsama()
+
+
+class _Asama:
+    """Tek bir aşama ölçümü (with bloğu)"""
+
+    def __init__(self, profilci, ad, adet=None):
+        self.profilci = profilci
+        self.ad = ad
+        self.adet = adet
+
+    def __enter__(self):
+        self._rss = tepe_rss_mb()
+        self._cpu = time.process_time()
+        self._duvar = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        duvar = time.perf_counter() - self._duvar
+        cpu = time.process_time() - self._cpu
+        rss = tepe_rss_mb()
+        artis = rss - self._rss if rss is not None and self._rss is not None else None
+        self.profilci._ekle(self.ad, duvar, cpu, self.adet, rss, artis)
+        return False
+
+
+class Profilci:
+    """Adlandırılmış aşamaların toplam ölçümlerini tutan sınıf"""
+
+    ALANLAR = ['asama', 'cagri', 'duvar_sn', 'cpu_sn', 'adet', 'tepe_rss_mb', 'rss_artis_mb']
+
+    def __init__(self):
+        """Profilciyi kapalı olarak başlat"""
+        self.aktif = False
+        self.kayitlar = {}
+        self.baslangic_zamani = None
+
+    def baslat(self):
+        """Önceki kayıtları silip ölçümü aç"""
+        self.sifirla(True)
+        self.baslangic_zamani = time.strftime('%Y-%m-%d %H:%M:%S')
+
+    def durdur(self):
+        """Ölçümü kapat (kayıtlar korunur)"""
+        self.aktif = False
+
+    def sifirla(self, aktif=None):
+        """
+        Kayıtları temizle.
+
+        Args:
+            aktif: Verilirse ölçüm durumu da bu değere ayarlanır
+        """
+        self.kayitlar = {}
+        if aktif is not None:
+            self.aktif = aktif
+
+    def asama(self, ad, adet=None):
+        """
+        Bir kod bloğunu ölç.
+
+        Kullanım:
+            with profil.asama('analiz.okuma') as a:
+                df = ...
+                a.adet = len(df)
+
+        Args:
+            ad: Aşama adı (aynı ad tekrar ölçülürse toplanır)
+            adet: İşlenen öğe sayısı (blok içinde de atanabilir)
+        """
+        if not self.aktif:
+            return _BOS_ASAMA
+        return _Asama(self, ad, adet)
+
+    def olc(self, ad):
+        """
+        Fonksiyon çağrılarını ölçen dekoratör (her çağrı bir adet sayılır).
+
+        Args:
+            ad: Aşama adı
+        """
+        def dekorator(fonksiyon):
+            @functools.wraps(fonksiyon)
+            def sarmalayici(*args, **kwargs):
+                if not self.aktif:
+                    return fonksiyon(*args, **kwargs)
+                with _Asama(self, ad, 1):
+                    return fonksiyon(*args, **kwargs)
+            return sarmalayici
+        return dekorator
+
+    def _ekle(self, ad, duvar, cpu, adet, rss, artis):
+        """Ölçümü aynı adlı kayda ekle"""
+        kayit = self.kayitlar.get(ad)
+        if kayit is None:
+            kayit = {'asama': ad, 'cagri': 0, 'duvar_sn': 0.0, 'cpu_sn': 0.0,
+                     'adet': None, 'tepe_rss_mb': None, 'rss_artis_mb': None}
+            self.kayitlar[ad] = kayit
+
+        kayit['cagri'] += 1
+        kayit['duvar_sn'] += duvar
+        kayit['cpu_sn'] += cpu
+        if adet is not None:
+            kayit['adet'] = (kayit['adet'] or 0) + adet
+        if rss is not None:
+            kayit['tepe_rss_mb'] = max(kayit['tepe_rss_mb'] or 0.0, rss)
+        if artis is not None:
+            kayit['rss_artis_mb'] = max(kayit['rss_artis_mb'] or 0.0, artis)
+
+    def devret(self):
+        """
+        Kayıtları döndür ve temizle (işçi süreçten ana sürece aktarım için).
+
+        Returns:
+            list: Kayıt sözlükleri (profil kapalıysa None)
+        """
+        if not self.aktif:
+            return None
+        kayitlar = list(self.kayitlar.values())
+        self.kayitlar = {}
+        return kayitlar
+
+    def birlestir(self, kayitlar):
+        """
+        Başka bir süreçten gelen kayıtları ekle.
+
+        Args:
+            kayitlar: devret() çıktısı
+        """
+        for k in kayitlar or []:
+            hedef = self.kayitlar.get(k['asama'])
+            if hedef is None:
+                self.kayitlar[k['asama']] = dict(k)
+                continue
+            hedef['cagri'] += k['cagri']
+            hedef['duvar_sn'] += k['duvar_sn']
+            hedef['cpu_sn'] += k['cpu_sn']
+            if k['adet'] is not None:
+                hedef['adet'] = (hedef['adet'] or 0) + k['adet']
+            for alan in ('tepe_rss_mb', 'rss_artis_mb'):
+                if k[alan] is not None:
+                    hedef[alan] = max(hedef[alan] or 0.0, k[alan])
+
+    def rapor(self):
+        """
+        Kayıtları yuvarlanmış olarak döndür.
+
+        Returns:
+            list: Aşama kayıtları (ilk ölçüm sırasına göre)
+        """
+        satirlar = []
+        for k in self.kayitlar.values():
+            satir = dict(k)
+            for alan in ('duvar_sn', 'cpu_sn'):
+                satir[alan] = round(satir[alan], 4)
+            for alan in ('tepe_rss_mb', 'rss_artis_mb'):
+                if satir[alan] is not None:
+                    satir[alan] = round(satir[alan], 1)
+            satirlar.append(satir)
+        return satirlar
+
+    def rapor_yaz(self, dosya_yolu):
+        """
+        Raporu uzantıya göre JSON veya CSV olarak yaz.
+
+        Args:
+            dosya_yolu: Hedef dosya (.csv ise CSV, diğer durumlarda JSON)
+
+        Returns:
+            str: Yazılan dosya yolu
+        """
+        klasor = os.path.dirname(os.path.abspath(dosya_yolu))
+        os.makedirs(klasor, exist_ok=True)
+        satirlar = self.rapor()
+
+        if dosya_yolu.lower().endswith('.csv'):
+            with open(dosya_yolu, 'w', encoding='utf-8', newline='') as f:
+                yazici = csv.DictWriter(f, fieldnames=self.ALANLAR)
+                yazici.writeheader()
+                yazici.writerows(satirlar)
+        else:
+            rss = tepe_rss_mb()
+            icerik = {
+                'baslangic': self.baslangic_zamani,
+                'toplam_tepe_rss_mb': round(rss, 1) if rss is not None else None,
+                'asamalar': satirlar
+            }
+            with open(dosya_yolu, 'w', encoding='utf-8') as f:
+                json.dump(icerik, f, ensure_ascii=False, indent=2)
+
+        print(f"✓ Profil raporu kaydedildi: {dosya_yolu}")
+        return dosya_yolu
+
+
+# Süreç genelinde paylaşılan profilci (GUI/CLI tarafından açılır)
+profil = Profilci()
@@ -0,0 +1,181 @@
+# -*- coding: utf-8 -*-
+"""
+Rapor Manifest Modülü
+outputs klasöründeki grup raporlarının hangi girdilerle üretildiğini tutar.
+Girdisi değişmeyen grupların PNG/Excel raporları yeniden üretilmez.
+"""
+
+import pandas as pd
+import hashlib
+import json
+import os
+import shutil
+import sys
+
+# Config'i import et
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import (
+    RAPOR_MANIFEST_AYARLARI, PNG_AYARLARI, EXCEL_STIL, DAGITIM_AG_AYARLARI,
+    TABLE_SUTUN_INDEKSLERI, JTK_SUTUN_INDEKSLERI, CM_SUTUN_INDEKSLERI
+)
+
+
+class RaporManifest:
+    """
+    Grup başına girdi özeti (hash) ve üretilen dosyaları tutan manifest.
+
+    Özet; grubun table/jtk/cm satırlarından, Kaynağa Göre değerinden ve
+    raporu etkileyen ayarlardan (PNG_AYARLARI, EXCEL_STIL, sütun indeksleri,
+    Dağıtım-AG ayarları) hesaplanır.
+    """
+
+    SURUM = 1  # Rapor biçimi veya özet içeriği değişirse artırılır (tüm gruplar yeniden üretilir)
+
+    def __init__(self, output_base, dosya_adi=None):
+        """
+        Manifesti başlat (okumak için yukle çağrılır).
+
+        Args:
+            output_base: Grup klasörlerinin bulunduğu çıktı klasörü
+            dosya_adi: Manifest dosyasının adı (None ise config'den)
+        """
+        self.output_base = output_base
+        self.yol = os.path.join(
+            output_base, dosya_adi or RAPOR_MANIFEST_AYARLARI.get('DOSYA_ADI', '.rapor_manifest.json')
+        )
+        self.gruplar = {}  # grup -> {'ozet': str, 'dosyalar': [dosya adları]}
+        self._degisti = False
+
+    def yukle(self):
+        """Mevcut manifesti oku (yoksa, bozuksa veya sürümü farklıysa boş başla)"""
+        try:
+            with open(self.yol, 'r', encoding='utf-8') as f:
+                veri = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"✗ Rapor manifesti okunamadı, tüm gruplar yeniden üretilecek: {e}")
+            return
+
+        if isinstance(veri, dict) and veri.get('surum') == self.SURUM:
+            self.gruplar = veri.get('gruplar', {})
+
+    @staticmethod
+    def ayar_ozeti():
+        """Raporları etkileyen ayarların özeti (çalışma başına bir kez hesaplanır)"""
+        ayarlar = [
+            sorted(ayar.items()) for ayar in (
+                PNG_AYARLARI, EXCEL_STIL, DAGITIM_AG_AYARLARI,
+                TABLE_SUTUN_INDEKSLERI, JTK_SUTUN_INDEKSLERI, CM_SUTUN_INDEKSLERI
+            )
+        ]
+        return hashlib.blake2b(repr(ayarlar).encode('utf-8'), digest_size=16).hexdigest()
+
+    @staticmethod
+    def ozet_hesapla(parcalar):
+        """
+        Metin ve DataFrame parçalarından tek bir özet üret.
+
+        Args:
+            parcalar: Sıralı parça listesi (str, DataFrame veya None)
+
+        Returns:
+            str: Hex özet
+        """
+        ozet = hashlib.blake2b(digest_size=16)
+        for parca in parcalar:
+            if isinstance(parca, pd.DataFrame):
+                baslik = (list(map(str, parca.columns)), list(map(str, parca.dtypes)), len(parca))
+                ozet.update(b'D' + repr(baslik).encode('utf-8'))
+                ozet.update(pd.util.hash_pandas_object(parca, index=False).to_numpy().tobytes())
+            else:
+                ozet.update(b'S' + repr(parca).encode('utf-8'))
+        return ozet.hexdigest()
+
+    def guncel_mi(self, grup, ozet):
+        """
+        Grubun raporları aynı girdilerle üretilmiş ve dosyaları yerinde mi.
+
+        Args:
+            grup: Grup string'i (klasör adı)
+            ozet: Grubun güncel girdi özeti
+
+        Returns:
+            bool: Yeniden üretmeye gerek yoksa True
+        """
+        kayit = self.gruplar.get(grup)
+        if kayit is None or kayit.get('ozet') != ozet:
+            return False
+        grup_folder = os.path.join(self.output_base, grup)
+        if not os.path.isdir(grup_folder):
+            return False
+        return all(os.path.exists(os.path.join(grup_folder, ad)) for ad in kayit.get('dosyalar', []))
+
+    def grup_kaydet(self, grup, ozet):
+        """
+        Yeniden üretilen grubun özetini ve klasördeki dosyaları kaydet.
+
+        Args:
+            grup: Grup string'i (klasör adı)
+            ozet: Grubun girdi özeti
+        """
+        grup_folder = os.path.join(self.output_base, grup)
+        dosyalar = sorted(os.listdir(grup_folder)) if os.path.isdir(grup_folder) else []
+        self.gruplar[grup] = {'ozet': ozet, 'dosyalar': dosyalar}
+        self._degisti = True
+
+    def eski_klasorleri_isle(self, grup_list, sil=None):
+        """
+        Manifestte olup artık grup listesinde olmayan klasörleri bul;
+        ayarlıysa sil. Manifestte olmayan klasörlere dokunulmaz.
+
+        Args:
+            grup_list: Güncel grup listesi
+            sil: Eski klasörler silinsin mi (None ise config'den)
+
+        Returns:
+            list: Eski grup klasörlerinin adları
+        """
+        if sil is None:
+            sil = RAPOR_MANIFEST_AYARLARI.get('ESKI_KLASORLERI_SIL', False)
+
+        guncel = set(grup_list)
+        ana_klasor = os.path.abspath(self.output_base)
+        eskiler = []
+        for grup in sorted(self.gruplar):
+            if grup in guncel:
+                continue
+            grup_folder = os.path.abspath(os.path.join(self.output_base, grup))
+            if os.path.dirname(grup_folder) != ana_klasor or not os.path.isdir(grup_folder):
+                # Klasör elle silinmiş (veya çıktı klasörü dışında): kaydı bırak
+                del self.gruplar[grup]
+                self._degisti = True
+                continue
+
+            eskiler.append(grup)
+            if sil:
+                try:
+                    shutil.rmtree(grup_folder)
+                    del self.gruplar[grup]
+                    self._degisti = True
+                except OSError as e:
+                    print(f"✗ Eski klasör silinemedi: {grup}: {e}")
+
+        if eskiler:
+            islem = "silindi" if sil else "bulundu (silinmedi)"
+            print(f"✓ Artık listede olmayan {len(eskiler)} grup klasörü {islem}")
+        return eskiler
+
+    def kaydet(self):
+        """Manifesti (değiştiyse) geçici dosya üzerinden yaz"""
+        if not self._degisti:
+            return
+
+        gecici = f"{self.yol}.tmp"
+        try:
+            with open(gecici, 'w', encoding='utf-8') as f:
+                json.dump({'surum': self.SURUM, 'gruplar': self.gruplar}, f, ensure_ascii=False)
+            os.replace(gecici, self.yol)
+            self._degisti = False
+        except OSError as e:
+            print(f"✗ Rapor manifesti yazılamadı: {e}")
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Veri Deposu Modülü
+Oturum boyunca paylaşılan girdi verileri. CM dosyası bir kez okunur;
+analiz (CMIslemleri) ve raporlama (Dosyalama) aynı DataFrame'i kullanır.
+"""
+
+import os
+import sys
+
+# Config ve diğer modülleri import et
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CM_SUTUN_INDEKSLERI, EXCEL_AYARLARI
+from modules.excel_yardimci import ExcelYardimci, IdIndeksi
+
+
+class VeriDeposu:
+    """
+    Okunmuş CM verisini ve index'lerini oturum boyunca tutan sınıf.
+
+    CM, raporlamadaki gibi başlık satırları atlanarak (CM_SKIP_ROWS, ardından
+    başlık) ve keep_default_na=False ile okunur. Sütun pozisyonları başlıksız
+    okumayla aynıdır; CMIslemleri sütunlara iloc ile erişir, Dosyalama ise
+    başlıklı görünümü kullanır.
+
+    Dosyalar (cihaz, inode) ile tanınır; böylece büyük/küçük harf duyarsız
+    sistemlerde CM.xlsx ve cm.xlsx aynı kayda düşer. Boyut veya değişiklik
+    zamanı değişen dosya yeniden okunur.
+    """
+
+    def __init__(self):
+        """Boş depo oluştur"""
+        self._cm = {}  # (st_dev, st_ino) -> kayıt sözlüğü
+
+    def __getstate__(self):
+        """Depo süreçler arasında taşınmaz (işçiler ihtiyaç duydukları DataFrame'i ayrıca alır)"""
+        return {'_cm': {}}
+
+    @staticmethod
+    def _dosya_bilgisi(dosya_yolu):
+        """Dosyanın kimliği ve güncellik imzası"""
+        bilgi = os.stat(dosya_yolu)
+        return (bilgi.st_dev, bilgi.st_ino), (bilgi.st_size, bilgi.st_mtime_ns)
+
+    def _cm_kaydi(self, dosya_yolu):
+        """
+        CM kaydını döndür; yoksa veya dosya değiştiyse oku.
+
+        Args:
+            dosya_yolu: CM.xlsx / cm.xlsx yolu
+
+        Returns:
+            dict: {'imza', 'df', 'kesinti_index', 'id_indeksi'}
+        """
+        kimlik, imza = self._dosya_bilgisi(dosya_yolu)
+        kayit = self._cm.get(kimlik)
+        if kayit is not None and kayit['imza'] == imza:
+            return kayit
+
+        df = ExcelYardimci.excel_oku(
+            dosya_yolu,
+            skiprows=EXCEL_AYARLARI['CM_SKIP_ROWS'],
+            header=0,
+            keep_default_na=False
+        )
+        kayit = {'imza': imza, 'df': df, 'kesinti_index': None, 'id_indeksi': None}
+        self._cm[kimlik] = kayit
+        return kayit
+
+    def cm_al(self, dosya_yolu):
+        """
+        CM DataFrame'ini döndür (gerekirse okuyarak).
+
+        Args:
+            dosya_yolu: CM dosyası yolu
+
+        Returns:
+            DataFrame: Başlık satırları atlanmış CM verisi
+        """
+        return self._cm_kaydi(dosya_yolu)['df']
+
+    def cm_kesinti_index(self, dosya_yolu):
+        """
+        Normalize Kesinti ID (str + strip) -> satır pozisyonları index'i.
+
+        Args:
+            dosya_yolu: CM dosyası yolu
+
+        Returns:
+            dict: Anahtar -> pozisyon dizisi (Kesinti ID sütunu yoksa boş)
+        """
+        kayit = self._cm_kaydi(dosya_yolu)
+        if kayit['kesinti_index'] is None:
+            df = kayit['df']
+            col_index = CM_SUTUN_INDEKSLERI['KESINTI_ID']
+            if col_index >= len(df.columns):
+                kayit['kesinti_index'] = {}
+            else:
+                anahtarlar = df.iloc[:, col_index].astype(str).str.strip()
+                kayit['kesinti_index'] = anahtarlar.groupby(anahtarlar.to_numpy(), sort=False).indices
+        return kayit['kesinti_index']
+
+    def cm_id_indeksi(self, dosya_yolu):
+        """
+        Raporlamadaki ID araması (ExcelYardimci.id_ara sırası) için index.
+
+        Args:
+            dosya_yolu: CM dosyası yolu
+
+        Returns:
+            IdIndeksi
+        """
+        kayit = self._cm_kaydi(dosya_yolu)
+        if kayit['id_indeksi'] is None:
+            kayit['id_indeksi'] = IdIndeksi(kayit['df'], CM_SUTUN_INDEKSLERI['KESINTI_ID'])
+        return kayit['id_indeksi']
+
+    def temizle(self):
+        """Tüm kayıtları bırak (belleği serbest bırakmak için)"""
+        self._cm = {}